@@ -1,11 +1,15 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
+import sys
 import json
 
-# ⚠️ 한글 폰트 설정
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False 
+# 프로젝트 루트의 chart_renderer.py 사용 (Agg 백엔드 + 한글 폰트 설정을 모든 시각화가 공유)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import chart_renderer
+from chart_renderer import ChartJob, save_figure
+
+chart_renderer.setup()
+import matplotlib.pyplot as plt
 
 # 파일 경로 및 카테고리 매핑
 categories = {
@@ -15,73 +19,26 @@ categories = {
     'sports': '스포츠'
 }
 
-print("🌊 [블루오션 / 레드오션 판별기] 데이터 생성을 시작합니다...\n")
-
-# 결과물 저장 폴더 세팅
-os.makedirs('result/', exist_ok=True)
-os.makedirs('result/ocean_status', exist_ok=True)
-
-try:
-    all_data = []
-    
-    # 1. 4개의 뉴스 포함 트렌드 CSV 파일 하나로 병합
-    for eng_cat, kor_cat in categories.items():
-        df = pd.read_csv(f'data/news/trend_with_news_{eng_cat}.csv')
-        df['category'] = kor_cat
-        all_data.append(df)
-        
-    df_all = pd.concat(all_data, ignore_index=True)
-
-    # 2. 기준점(Threshold) 설정: 전체 40개 키워드의 평균값
-    score_th = df_all['total_score'].mean()
-    news_th = df_all['google_news_count'].mean()
-    
-    print(f"📊 [판별 기준] 평균 트렌드 점수: {score_th:.1f} / 평균 기사량: {news_th:.1f}")
-
-    # 3. 오션(Ocean) 상태 분류 함수
-    def classify_ocean(row):
-        if row['total_score'] >= score_th and row['google_news_count'] < news_th:
-            return '🔵 블루오션'
-        elif row['total_score'] >= score_th and row['google_news_count'] >= news_th:
-            return '🔴 레드오션'
-        elif row['total_score'] < score_th and row['google_news_count'] >= news_th:
-            return '🫧 미디어 버블'
-        else:
-            return '🏕️ 마이너(잠복기)'
-
-    # 데이터프레임에 판별 결과 컬럼 추가
-    df_all['ocean_status'] = df_all.apply(classify_ocean, axis=1)
-    
-    # 웹사이트에서 쓰기 좋게 컬럼 정리
-    cols = ['category', 'rank_title', 'total_score', 'google_news_count', 'ocean_status']
-    df_web = df_all[cols].copy()
-    
-    # 4. 웹 데이터(API용 JSON 및 CSV) 저장
-    df_web.to_csv('result/ocean_status/ocean_discriminator.csv', index=False, encoding='utf-8-sig')
-    
-    # 프론트엔드가 사랑하는 JSON 형태로 변환
-    web_json_data = df_web.to_dict(orient='records')
-    with open('result/ocean_status/ocean_discriminator.json', 'w', encoding='utf-8') as f:
-        json.dump(web_json_data, f, ensure_ascii=False, indent=4)
-        
-    print("✅ 웹사이트 API용 데이터(JSON, CSV) 생성 완료!")
-
-    # =========================================================
-    # 5. 블루오션/레드오션 시각화 맵 생성 (웹사이트에 삽입할 이미지)
-    # =========================================================
+OUTPUT_BASE = 'result/ocean_status/ocean_discriminator'
+
+
+# =========================================================
+# 5. 블루오션/레드오션 시각화 맵 생성 (웹사이트에 삽입할 이미지)
+# =========================================================
+def draw_ocean_map(df_web, score_th, news_th):
     plt.figure(figsize=(12, 9))
-    
+
     color_map = {
         '🔵 블루오션': '#1E90FF',    # Dodger Blue
         '🔴 레드오션': '#FF4500',    # Orange Red
         '🫧 미디어 버블': '#FFA500', # Orange
         '🏕️ 마이너(잠복기)': '#808080' # Gray
     }
-    
+
     # 그룹별로 색상을 다르게 점 찍기
     for status, color in color_map.items():
         subset = df_web[df_web['ocean_status'] == status]
-        plt.scatter(subset['total_score'], subset['google_news_count'], 
+        plt.scatter(subset['total_score'], subset['google_news_count'],
                     c=color, label=status, s=150, alpha=0.8, edgecolors='white')
 
     # 십자선 그리기
@@ -106,16 +63,74 @@ try:
 
     plt.legend(title='포스팅 추천도', loc='upper left')
     plt.grid(True, linestyle=':', alpha=0.6)
-    
+
     # 이미지 저장
     plt.tight_layout()
-    output_png = 'result/ocean_status/ocean_discriminator.png'
-    plt.savefig(output_png, dpi=300)
-    plt.close()
-    
+    output_png = save_figure(OUTPUT_BASE)
+
     print(f"✅ 판별기 시각화 맵 생성 완료! ({output_png})")
 
-except Exception as e:
-    print(f"❌ 에러 발생: {e}")
 
-print("\n🎉 블루오션 분석 모듈 구동 완료!")
\ No newline at end of file
+def main():
+    print("🌊 [블루오션 / 레드오션 판별기] 데이터 생성을 시작합니다...\n")
+
+    # 결과물 저장 폴더 세팅
+    os.makedirs('result/', exist_ok=True)
+    os.makedirs('result/ocean_status', exist_ok=True)
+
+    try:
+        all_data = []
+
+        # 1. 4개의 뉴스 포함 트렌드 CSV 파일 하나로 병합
+        for eng_cat, kor_cat in categories.items():
+            df = pd.read_csv(f'data/news/trend_with_news_{eng_cat}.csv')
+            df['category'] = kor_cat
+            all_data.append(df)
+
+        df_all = pd.concat(all_data, ignore_index=True)
+
+        # 2. 기준점(Threshold) 설정: 전체 40개 키워드의 평균값
+        score_th = df_all['total_score'].mean()
+        news_th = df_all['google_news_count'].mean()
+
+        print(f"📊 [판별 기준] 평균 트렌드 점수: {score_th:.1f} / 평균 기사량: {news_th:.1f}")
+
+        # 3. 오션(Ocean) 상태 분류 함수
+        def classify_ocean(row):
+            if row['total_score'] >= score_th and row['google_news_count'] < news_th:
+                return '🔵 블루오션'
+            elif row['total_score'] >= score_th and row['google_news_count'] >= news_th:
+                return '🔴 레드오션'
+            elif row['total_score'] < score_th and row['google_news_count'] >= news_th:
+                return '🫧 미디어 버블'
+            else:
+                return '🏕️ 마이너(잠복기)'
+
+        # 데이터프레임에 판별 결과 컬럼 추가
+        df_all['ocean_status'] = df_all.apply(classify_ocean, axis=1)
+
+        # 웹사이트에서 쓰기 좋게 컬럼 정리
+        cols = ['category', 'rank_title', 'total_score', 'google_news_count', 'ocean_status']
+        df_web = df_all[cols].copy()
+
+        # 4. 웹 데이터(API용 JSON 및 CSV) 저장
+        df_web.to_csv('result/ocean_status/ocean_discriminator.csv', index=False, encoding='utf-8-sig')
+
+        # 프론트엔드가 사랑하는 JSON 형태로 변환
+        web_json_data = df_web.to_dict(orient='records')
+        with open('result/ocean_status/ocean_discriminator.json', 'w', encoding='utf-8') as f:
+            json.dump(web_json_data, f, ensure_ascii=False, indent=4)
+
+        print("✅ 웹사이트 API용 데이터(JSON, CSV) 생성 완료!")
+
+        # 5. 시각화 맵 렌더링 (입력 데이터가 지난번과 같으면 건너뜀)
+        chart_renderer.render([ChartJob('analyze_ocean_status', 'draw_ocean_map', (df_web, score_th, news_th), OUTPUT_BASE)])
+
+    except Exception as e:
+        print(f"❌ 에러 발생: {e}")
+
+    print("\n🎉 블루오션 분석 모듈 구동 완료!")
+
+
+if __name__ == "__main__":
+    main()
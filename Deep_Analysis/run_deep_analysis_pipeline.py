@@ -2,6 +2,13 @@ import subprocess
 import sys
 import time
 import os
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dag_runner import DagRunner, script_step, summarize
+import chart_renderer
+
+categories = ['climate', 'entertainment', 'finance', 'sports']
 
 def run_script(script_name, description):
     """개별 파이썬 스크립트를 실행하고 소요 시간과 에러를 관리하는 도우미 함수"""
@@ -23,6 +30,49 @@ def run_script(script_name, description):
         print(f"\n❌ {script_name} 파일을 찾을 수 없습니다. 파일 이름과 경로를 확인해 주세요!")
         sys.exit(1)
 
+def build_dag():
+    """각 스크립트의 입력/출력 파일로 연결한 DAG (스크립트는 각자 별도 프로세스라 그래프도 동시에 그려도 안전)"""
+    dag = DagRunner(state_path='.dag_state.json')
+    chart = chart_renderer.output_path # 그래프 확장자는 --chart-format 설정
+    news_json = 'raw_data/google_news_grouped_by_category_keyword.json'
+    top10_csvs = [f'data/top10_keyword/final_weighted_top10_{cat}.csv' for cat in categories]
+    news_csvs = [f'data/news/trend_with_news_{cat}.csv' for cat in categories]
+    yt_average = 'data/youtube/youtube_keyword_average.csv'
+
+    settings = chart_renderer.settings()
+
+    # 그래프를 그리는 스크립트는 형식 / DPI가 바뀌면 입력이 같아도 다시 실행
+    def add(script, inputs, outputs):
+        draws = any(path.endswith(f".{settings['format']}") for path in outputs)
+        dag.add(script[:-3], script_step(script), [script] + inputs, outputs, params=settings if draws else None)
+
+    add('news_data_preprocessing.py', [news_json] + top10_csvs, news_csvs)
+    add('youtube_data_preprocessing.py',
+        [news_json, 'raw_data/youtube_data_integrated.csv', 'raw_data/youtube_keyword_summary.csv'],
+        ['data/youtube/youtube_data_integrated_mapped.csv', 'data/youtube/youtube_keyword_summary_mapped.csv', yt_average])
+    add('analyze_news_correlation.py', news_csvs, [chart('result/news_correlation/correlation_trend_news')])
+    add('analyze_youtube_correlation.py', news_csvs + [yt_average],
+        ['data/youtube/trend_vs_youtube_merged.csv',
+         chart('result/youtube_correlation/youtube_correlation_scatter'),
+         chart('result/youtube_correlation/youtube_correlation_heatmap')])
+    add('analyze_ocean_status.py', news_csvs,
+        ['result/ocean_status/ocean_discriminator.csv', 'result/ocean_status/ocean_discriminator.json',
+         chart('result/ocean_status/ocean_discriminator')])
+    add('analyze_youtube_engagement.py', [yt_average],
+        ['result/youtube_thermometer/youtube_engagement_all.json']
+        + [f'result/youtube_thermometer/youtube_engagement_{cat}.{ext}' for cat in categories for ext in ('csv', 'json')]
+        + [chart(f'result/youtube_thermometer/youtube_thermometer_{cat}') for cat in categories])
+    return dag
+
+def main_incremental(force=False):
+    print("🚀 [뉴스 & 유튜브 심층 분석 파이프라인] 증분 실행 (입력이 바뀐 단계만) 🚀")
+    print("=" * 70)
+    os.makedirs('result', exist_ok=True)
+    start = time.time()
+    status = build_dag().run(force=force)
+    if not summarize(status, time.time() - start):
+        sys.exit(1)
+
 def main():
     print("🚀 [뉴스 & 유튜브 심층 분석 파이프라인] 가동을 시작합니다 🚀")
     print("=" * 70)
@@ -58,4 +108,15 @@ def main():
     print("📁 'result/visualize/' 폴더에서 시각화 그래프 이미지를 확인해 보세요!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="뉴스 & 유튜브 심층 분석 파이프라인")
+    parser.add_argument("--incremental", action="store_true", help="입력 파일 내용이 지난 성공 실행과 같은 단계는 건너뛰고, 독립 단계는 동시에 실행")
+    parser.add_argument("--force", action="store_true", help="--incremental에서 해시와 관계없이 모든 단계 실행")
+    parser.add_argument("--chart-format", default=None, choices=chart_renderer.CHART_FORMATS, help="그래프 형식 (기본: png, 웹용은 webp / svg)")
+    parser.add_argument("--chart-dpi", type=int, default=None, help="그래프 해상도 (기본: 300, 웹용은 100~150 권장)")
+    args = parser.parse_args()
+    # 각 스크립트는 subprocess로 실행되므로 환경 변수(CHART_FORMAT / CHART_DPI)로 전달
+    chart_renderer.configure(args.chart_format, args.chart_dpi)
+    if args.incremental:
+        main_incremental(force=args.force)
+    else:
+        main()
\ No newline at end of file
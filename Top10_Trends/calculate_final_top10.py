@@ -1,66 +1,70 @@
-import json
 import os
+import argparse
+
 import pandas as pd
 
-# 4가지 카테고리 목록
-categories = ['climate', 'entertainment', 'finance', 'sports']
+from scoring import categories, load_preprocessed, ensure_scored, stream_top10, save_result, TOP10_SCHEMA
+from rank_bootstrap import RESAMPLES, BOOTSTRAP_COLUMNS, INTERVAL_COLUMNS, rank_intervals
+
+
+# 카테고리 1개 TOP 10 산출 → result/top10_keyword/final_weighted_top10_{cat}.csv 저장 후 반환
+# (정규화 + 가중치(config.py METRIC_WEIGHTS) 반영 Total Score는 scoring.score_category에서 계산)
+# resamples: 부트스트랩 반복 수 → 순위 95% 신뢰구간(rank_ci_low / rank_ci_high) + 안정적 Top 10 확률(top10_prob(%))
+#            df에 후보 전체가 있어야 하므로 0이면(스트리밍 모드 등) 빈 값
+def calculate_top10(df, cat, resamples=RESAMPLES):
+    df = ensure_scored(df).copy()
+    
+    if resamples:
+        df[INTERVAL_COLUMNS] = rank_intervals(df, resamples=resamples)
+    else:
+        for col in INTERVAL_COLUMNS:
+            df[col] = pd.NA
+    
+    # 소수점 둘째 자리 반올림
+    df['total_score'] = df['total_score'].round(2)
+    
+    # 내림차순 정렬 후 Top 10 추출
+    df_top10 = df.sort_values(by='total_score', ascending=False, kind='mergesort').head(10)
+    
+    # 결과 CSV(사용자가 엑셀에서 보기 편하도록) + Arrow(다음 단계 입력) 저장
+    output_filename = f'result/top10_keyword/final_weighted_top10_{cat}.csv'
+    df_top10 = save_result(df_top10, output_filename, TOP10_SCHEMA)
+    
+    print(f"✅ [{cat.upper()}] TOP 10 산출 성공! ({output_filename})")
+    return df_top10
 
-# 💡 최적화된 가중치 설정 (Volume 70% / Momentum 30%)
-w_google_vol = 0.35
-w_google_surge = 0.15
-w_naver_sum = 0.35
-w_naver_slope = 0.15
 
-print("🏆 최적의 가중치(35:15:35:15)를 적용한 최종 TOP 10 산출을 시작합니다...\n")
+# frames: {카테고리: 전처리(또는 점수 계산된) DataFrame} (없으면 data/preprocessed_{cat}.arrow 로드, 없으면 .json)
+# stream=True: data/preprocessed_{cat}.arrow 레코드 배치(없으면 .csv를 chunksize 행)씩 두 번 읽어 상위 10개만 메모리에 유지 (후보가 매우 많을 때)
+#              (후보 전체가 메모리에 없으므로 부트스트랩 컬럼은 비워 둠)
+def run(frames=None, stream=False, chunksize=100_000, resamples=RESAMPLES):
+    print("🏆 가중치(config.py METRIC_WEIGHTS)를 적용한 최종 TOP 10 산출을 시작합니다...\n")
 
-# 👈 추가: result 폴더가 없으면 자동으로 생성 (exist_ok=True는 이미 폴더가 있어도 에러 내지 않음)
-os.makedirs('result', exist_ok=True)
-os.makedirs('result/top10_keyword', exist_ok=True)
+    # 👈 추가: result 폴더가 없으면 자동으로 생성 (exist_ok=True는 이미 폴더가 있어도 에러 내지 않음)
+    os.makedirs('result', exist_ok=True)
+    os.makedirs('result/top10_keyword', exist_ok=True)
 
-for cat in categories:
-    try:
-        # 전처리 완료된 JSON 파일 로드
-        with open(f'data/preprocessed_{cat}.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        df = pd.DataFrame(data['results'])
-        
-        # 1. 4가지 지표 정규화 (Min-Max Scaling)
-        metrics = ['google_absolute_volume', 'google_surge_ratio', 'naver_trend_sum', 'naver_growth_slope']
-        
-        for metric in metrics:
-            m_min = df[metric].min()
-            m_max = df[metric].max()
-            
-            if m_max > m_min:
-                df[f'{metric}_score'] = ((df[metric] - m_min) / (m_max - m_min)) * 100
+    results = {}
+    for cat in categories:
+        try:
+            if stream:
+                df = stream_top10(cat, chunksize, decimals=2)
             else:
-                df[f'{metric}_score'] = 0
-                
-        # 2. 정교화된 가중치를 반영한 Total Score 계산
-        df['total_score'] = (
-            (df['google_absolute_volume_score'] * w_google_vol) +
-            (df['google_surge_ratio_score'] * w_google_surge) +
-            (df['naver_trend_sum_score'] * w_naver_sum) +
-            (df['naver_growth_slope_score'] * w_naver_slope)
-        )
-        
-        # 소수점 둘째 자리 반올림
-        df['total_score'] = df['total_score'].round(2)
-        
-        # 3. 내림차순 정렬 후 Top 10 추출
-        df_top10 = df.sort_values(by='total_score', ascending=False).head(10)
-        
-        # 4. 결과 CSV 저장 (사용자가 엑셀에서 보기 편하도록)
-        output_filename = f'result/top10_keyword/final_weighted_top10_{cat}.csv'
-        output_cols = ['rank_title', 'total_score', 'google_absolute_volume', 'google_surge_ratio', 'naver_trend_sum', 'naver_growth_slope']
-        df_top10[output_cols].to_csv(output_filename, index=False, encoding='utf-8-sig')
-        
-        print(f"✅ [{cat.upper()}] TOP 10 산출 성공! ({output_filename})")
-        
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: preprocessed_{cat}.json (전처리를 먼저 진행해주세요!)")
-    except Exception as e:
-        print(f"❌ [{cat.upper()}] 처리 중 에러 발생: {e}")
+                df = frames[cat] if frames is not None and cat in frames else load_preprocessed(cat, BOOTSTRAP_COLUMNS)
+            results[cat] = calculate_top10(df, cat, 0 if stream else resamples)
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: preprocessed_{cat}.json (전처리를 먼저 진행해주세요!)")
+        except Exception as e:
+            print(f"❌ [{cat.upper()}] 처리 중 에러 발생: {e}")
+
+    print("\n🎉 모든 카테고리의 최종 랭킹 추출이 성공적으로 완료되었습니다!")
+    return results
+
 
-print("\n🎉 모든 카테고리의 최종 랭킹 추출이 성공적으로 완료되었습니다!")
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="최종 TOP 10")
+    parser.add_argument("--stream", action="store_true", help="전처리 CSV를 조각 단위로 읽어 상위 10개만 유지 (메모리 O(10 + chunk))")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="스트리밍 모드에서 한 번에 읽을 행 수")
+    parser.add_argument("--bootstrap", type=int, default=RESAMPLES, help="순위 신뢰구간 / 안정적 Top 10 확률 부트스트랩 반복 수 (0이면 생략)")
+    args = parser.parse_args()
+    run(stream=args.stream, chunksize=args.chunksize, resamples=args.bootstrap)
@@ -3,8 +3,8 @@ import pandas as pd
 import numpy as np
 import os
 
-# 👈 추가: data 폴더가 없으면 자동으로 생성 (exist_ok=True는 이미 폴더가 있어도 에러 내지 않음)
-os.makedirs('data', exist_ok=True)
+from scoring import categories, PREPROCESSED_SCHEMA
+from columnar_store import write_frame
 
 # 구글 볼륨 문자열에서 '절대 검색량'과 '급상승 비율'을 숫자로 추출하는 함수
 def parse_google_data(vol_str):
@@ -38,65 +38,116 @@ def parse_google_data(vol_str):
             
     return absolute_volume, surge_ratio
 
-# 1. 환경 설정
-categories = ['climate', 'entertainment', 'finance', 'sports']
-os.makedirs('data', exist_ok=True) # 전처리된 데이터를 저장할 data 폴더 자동 생성
 
-print("🧹 [Step 1] 통합 데이터 전처리를 시작합니다 (Google 분해 + Naver 기울기 산출)...\n")
+# 구글 볼륨 문자열 전체를 한 번에 분해 → (절대 검색량 배열, 급상승 비율 배열)
+# 볼륨 문자열은 '5만+ / 1,000%' 처럼 종류가 적어서 pd.factorize로 고유값만 뽑아 한 번씩 파싱하고
+# 코드 배열로 전체에 펼침 (키워드가 수천 개여도 파싱 횟수는 고유 문자열 수만큼)
+def parse_google_volumes(vol_values):
+    codes, uniques = pd.factorize(pd.Series(list(vol_values), dtype=object))
+    parsed = [parse_google_data(u) for u in uniques] + [parse_google_data(None)]   # 마지막은 결측(코드 -1)용
 
-for cat in categories:
-    try:
-        # 원본 Raw Data 읽기
-        with open(f'raw_data/trend_report_{cat}.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        processed_results = []
-        
-        for item in data['results']:
-            # 1️⃣ 구글 데이터 분해 (절대량, 급상승)
-            g_vol, g_surge = parse_google_data(item.get('google_volume', '0'))
-            
-            # 2️⃣ 네이버 데이터 성장세 기울기 계산
-            daily_ratios = [day.get('ratio', 0) for day in item.get('naver_daily_ratio', [])]
-            if len(daily_ratios) > 1:
-                x = np.arange(len(daily_ratios))
-                slope, _ = np.polyfit(x, daily_ratios, 1) 
-            else:
-                slope = 0.0
-            
-            # 3️⃣ 통합된 하나의 새로운 데이터 구조 생성
-            new_item = {
-                'rank_title': item.get('rank_title', ''),
-                'google_absolute_volume': g_vol,
-                'google_surge_ratio': g_surge,
-                'naver_trend_sum': item.get('naver_trend_sum', 0),
-                'naver_growth_slope': round(slope, 2), # 소수점 둘째 자리까지
-                'naver_daily_ratio': item.get('naver_daily_ratio', [])
-            }
-            
-            processed_results.append(new_item)
-            
-        # 1. 통합 전처리된 JSON 파일 저장
-        new_json_data = {
-            "category": data.get("category", cat),
-            "base_date": data.get("base_date", ""),
-            "results": processed_results
+    # object 배열: 파싱 실패는 기존과 같은 정수 0으로 남겨 JSON 출력까지 동일하게 유지
+    volume = np.array([p[0] for p in parsed], dtype=object)
+    surge = np.array([p[1] for p in parsed], dtype=object)
+    return volume[codes], surge[codes]
+
+
+# 키워드별 일간 비율 시계열 전체의 1차 회귀 기울기를 한 번에 계산
+# 길이가 제각각인 시계열은 (키워드 수 x 최대 일수) 2D 배열 + 마스크로 맞추고,
+# 최소제곱 기울기 Σ(x-x̄)(y-ȳ) / Σ(x-x̄)² 를 행 단위로 계산 (일수 1개 이하는 0)
+def naver_growth_slopes(daily_series):
+    lengths = np.array([len(days) for days in daily_series], dtype=int)
+    if len(lengths) == 0:
+        return np.zeros(0)
+
+    max_len = int(lengths.max())
+    mask = np.arange(max_len) < lengths[:, None]
+    y = np.zeros(mask.shape)
+    y[mask] = [day.get('ratio', 0) for days in daily_series for day in days]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = (lengths - 1) / 2
+        y_mean = y.sum(axis=1) / lengths
+        dx = np.where(mask, np.arange(max_len) - x_mean[:, None], 0.0)
+        slope = (dx * (y - y_mean[:, None])).sum(axis=1) / (dx ** 2).sum(axis=1)
+
+    # 반올림 경계(.xx5) 근처는 계산 순서 차이로 np.polyfit과 0.01 어긋날 수 있어 그 행만 np.polyfit으로 다시 계산
+    scaled = slope * 100
+    near_half = (lengths > 1) & (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    for i in np.flatnonzero(near_half):
+        slope[i] = np.polyfit(np.arange(lengths[i]), y[i, :lengths[i]], 1)[0]
+
+    return np.round(np.where(lengths > 1, slope, 0.0), 2) # 소수점 둘째 자리까지
+
+
+# 원본 results 전체 → 전처리 row 리스트 (구글 분해 + 네이버 기울기를 키워드 루프 없이 일괄 계산)
+def build_processed_results(items):
+    g_vol, g_surge = parse_google_volumes(item.get('google_volume', '0') for item in items)
+    daily = [item.get('naver_daily_ratio', []) for item in items]
+    slopes = naver_growth_slopes(daily)
+
+    return [
+        {
+            'rank_title': item.get('rank_title', ''),
+            'google_absolute_volume': g_vol[i],
+            'google_surge_ratio': g_surge[i],
+            'naver_trend_sum': item.get('naver_trend_sum', 0),
+            'naver_growth_slope': slopes[i],
+            'naver_daily_ratio': daily[i]
         }
+        for i, item in enumerate(items)
+    ]
+
+
+# 카테고리 1개 전처리: raw_data → data/preprocessed_{cat}.arrow (다음 단계 입력) + .json/.csv (사람이 보는 내보내기) 저장 후 DataFrame 반환
+def preprocess_category(cat):
+    # 원본 Raw Data 읽기
+    with open(f'raw_data/trend_report_{cat}.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
         
-        json_filename = f'data/preprocessed_{cat}.json'
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(new_json_data, f, ensure_ascii=False, indent=4)
-            
-        # 2. 통합 전처리된 CSV 파일 저장
-        df = pd.DataFrame(processed_results)
-        csv_filename = f'data/preprocessed_{cat}.csv'
-        df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+    processed_results = build_processed_results(data['results'])
+    df = pd.DataFrame(processed_results)
+
+    # 0. 다음 단계가 읽는 Arrow 중간 파일 (스키마 고정, 메모리 맵 + 컬럼 선택 로드)
+    arrow_filename = write_frame(df, f'data/preprocessed_{cat}.arrow', PREPROCESSED_SCHEMA)
         
-        print(f"✅ [{cat.upper()}] 통합 전처리 완료! -> {json_filename}, {csv_filename} 생성")
+    # 1. 통합 전처리된 JSON 파일 저장
+    new_json_data = {
+        "category": data.get("category", cat),
+        "base_date": data.get("base_date", ""),
+        "results": processed_results
+    }
+    
+    json_filename = f'data/preprocessed_{cat}.json'
+    with open(json_filename, 'w', encoding='utf-8') as f:
+        json.dump(new_json_data, f, ensure_ascii=False, indent=4)
         
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: trend_report_{cat}.json")
-    except Exception as e:
-        print(f"❌ [{cat.upper()}] 전처리 중 에러 발생: {e}")
+    # 2. 통합 전처리된 CSV 파일 저장
+    csv_filename = f'data/preprocessed_{cat}.csv'
+    df.to_csv(csv_filename, index=False, encoding='utf-8-sig')
+    
+    print(f"✅ [{cat.upper()}] 통합 전처리 완료! -> {arrow_filename}, {json_filename}, {csv_filename} 생성")
+    return df
+
+
+# 전체 카테고리 전처리 → {카테고리: DataFrame} (실패한 카테고리는 제외)
+def run():
+    os.makedirs('data', exist_ok=True) # 전처리된 데이터를 저장할 data 폴더 자동 생성
+
+    print("🧹 [Step 1] 통합 데이터 전처리를 시작합니다 (Google 분해 + Naver 기울기 산출)...\n")
+
+    frames = {}
+    for cat in categories:
+        try:
+            frames[cat] = preprocess_category(cat)
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: trend_report_{cat}.json")
+        except Exception as e:
+            print(f"❌ [{cat.upper()}] 전처리 중 에러 발생: {e}")
+
+    print("\n🎉 모든 데이터의 전처리가 성공적으로 통합되었습니다!")
+    return frames
+
 
-print("\n🎉 모든 데이터의 전처리가 성공적으로 통합되었습니다!")
\ No newline at end of file
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+
+from scoring import metrics, SCORING_COLUMNS, load_weights, normalize_matrix, rank_matrix
+
+RESAMPLES = 1000             # 기본 부트스트랩 반복 수 (파이프라인 실행마다 계산)
+CI_LEVEL = 0.95              # 순위 신뢰구간
+MAX_CELLS = 4_000_000        # 한 번에 만드는 (반복 x 키워드 x 일수) 배열 상한 → 넘으면 반복을 나눠서
+BOOTSTRAP_COLUMNS = SCORING_COLUMNS + ['naver_daily_ratio']   # 부트스트랩에 필요한 전처리 컬럼
+INTERVAL_COLUMNS = ['rank_ci_low', 'rank_ci_high', 'top10_prob(%)']
+
+NAVER_SUM = metrics.index('naver_trend_sum')
+NAVER_SLOPE = metrics.index('naver_growth_slope')
+
+
+# 키워드별 일간 비율 시계열 → 날짜(period) 기준으로 맞춘 (키워드 x 날짜) 비율 / 존재 여부 / 자기 시계열 안의 위치(x)
+# 없는 날짜는 비율 0 (합계 = naver_trend_sum), 기울기의 x는 전처리와 같이 각 키워드 시계열 안의 순서
+def daily_matrix(daily_series):
+    lengths = np.array([len(days) for days in daily_series], dtype=int)
+    flat = [day for days in daily_series for day in days]
+    cols, periods = pd.factorize(pd.Series([day.get('period', '') for day in flat], dtype=object), sort=True)
+    rows = np.repeat(np.arange(len(daily_series)), lengths)
+
+    y = np.zeros((len(daily_series), len(periods)))
+    present = np.zeros(y.shape, dtype=bool)
+    y[rows, cols] = [day.get('ratio') or 0 for day in flat]
+    present[rows, cols] = True
+    return y, present, np.cumsum(present, axis=1) - 1
+
+
+# 날짜 재추출 idx (반복 x 날짜) → 반복별 (naver_trend_sum, naver_growth_slope) 각 (반복 x 키워드)
+# 모든 키워드가 같은 날짜 묶음을 공유 (같은 기간끼리 비교), 기울기는 뽑힌 (x, 비율) 쌍의 최소제곱 (점 1개 이하면 0)
+def resample_naver(y, present, pos, idx):
+    ys = y[:, idx].transpose(1, 0, 2)
+    mask = present[:, idx].transpose(1, 0, 2)
+    xs = np.where(mask, pos[:, idx].transpose(1, 0, 2), 0.0)
+
+    count = mask.sum(axis=2)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        dx = np.where(mask, xs - (xs.sum(axis=2) / count)[..., None], 0.0)
+        dy = np.where(mask, ys - ((ys * mask).sum(axis=2) / count)[..., None], 0.0)
+        slope = (dx * dy).sum(axis=2) / (dx ** 2).sum(axis=2)
+    return ys.sum(axis=2), np.where(np.isfinite(slope) & (count > 1), slope, 0.0)
+
+
+# 점수 계산된 카테고리 1개(후보 전체) → 키워드별 순위 신뢰구간 + 안정적 Top k 확률 (df와 같은 index)
+# 반복마다 (1) naver_daily_ratio의 날짜를 복원 추출해 네이버 합계 / 기울기를 다시 계산하고
+#          (2) 후보 풀을 복원 추출해 그 풀의 min/max로 정규화 (극단값 1개가 빠지거나 겹칠 때의 영향)
+# 순위는 원래 후보 전체 안에서 매김 — 반복 전체를 NumPy 배열 연산으로 한 번에 (반복별 파이썬 루프 없음)
+def rank_intervals(df, weights=None, resamples=RESAMPLES, k=10, seed=0, level=CI_LEVEL):
+    w = load_weights(weights)
+    x = df[metrics].to_numpy(dtype=float)
+    n = len(x)
+    rng = np.random.default_rng(seed)
+
+    if 'naver_daily_ratio' in df.columns:
+        y, present, pos = daily_matrix(df['naver_daily_ratio'].tolist())
+    else:
+        y = np.zeros((n, 0))
+    n_days = y.shape[1]
+
+    ranks = np.empty((n, resamples), dtype=int)
+    step = max(1, MAX_CELLS // max(n * max(n_days, 1), 1))
+    for start in range(0, resamples, step):
+        b = min(step, resamples - start)
+        xb = np.broadcast_to(x, (b, n, len(metrics))).copy()
+        if n_days:
+            idx = rng.integers(0, n_days, (b, n_days))
+            xb[:, :, NAVER_SUM], xb[:, :, NAVER_SLOPE] = resample_naver(y, present, pos, idx)
+
+        pool = np.take_along_axis(xb, rng.integers(0, n, (b, n))[:, :, None], axis=1)
+        scores = normalize_matrix(xb, np.fmin.reduce(pool, axis=1)[:, None, :], np.fmax.reduce(pool, axis=1)[:, None, :])
+        ranks[:, start:start + b] = rank_matrix((scores @ w).T)
+
+    tail = (1 - level) / 2 * 100
+    return pd.DataFrame({
+        'rank_ci_low': np.percentile(ranks, tail, axis=1, method='lower'),
+        'rank_ci_high': np.percentile(ranks, 100 - tail, axis=1, method='higher'),
+        'top10_prob(%)': ((ranks <= k).mean(axis=1) * 100).round(1),
+    }, index=df.index)
@@ -1,29 +1,126 @@
-import subprocess
+import os
 import sys
 import time
+import argparse
+import importlib
 
-# 개별 스크립트를 실행해주는 도우미 함수
-def run_script(script_name, description):
-    print(f"\n▶️ [{description}] 시작... ({script_name})")
+import scoring
+import data_preprocessing
+import calculate_final_top10
+import rank_bootstrap
+import analyze_trends
+import quadrant_analysis
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from dag_runner import DagRunner, summarize
+from columnar_store import arrow_path
+import chart_renderer
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.py')
+
+# 각 단계를 같은 프로세스 안에서 함수로 실행해주는 도우미 함수
+# (예전에는 단계마다 subprocess로 파이썬을 새로 띄워 pandas/matplotlib import와 JSON 로드를 매번 반복했음)
+def run_step(description, func, *args, name=None):
+    name = name or f"{func.__module__}.{func.__name__}"
+    print(f"\n▶️ [{description}] 시작... ({name})")
     start_time = time.time()
     
     try:
-        # sys.executable을 사용해 현재 실행 중인 파이썬 환경으로 스크립트를 실행합니다.
-        # check=True: 에러가 나면 즉시 예외(Exception)를 발생시킵니다.
-        subprocess.run([sys.executable, script_name], check=True)
+        result = func(*args)
         
         elapsed_time = time.time() - start_time
         print(f"✅ [{description}] 완료! (소요 시간: {elapsed_time:.2f}초)")
+        return result
         
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ [{description}] 단계에서 오류가 발생했습니다! (파일: {script_name})")
+    except Exception as e:
+        print(f"\n❌ [{description}] 단계에서 오류가 발생했습니다! ({name}: {e})")
         print("💡 파이프라인을 중단합니다. 이전 단계의 코드와 데이터를 확인해 주세요.")
         sys.exit(1) # 에러 발생 시 파이프라인 즉시 중단
-    except FileNotFoundError:
-        print(f"\n❌ {script_name} 파일을 찾을 수 없습니다. 파일 이름을 확인해 주세요!")
+
+# 시각화 3종(카테고리 x 3장)을 ChartJob으로 모아 chart_renderer 프로세스 풀에서 한 번에 렌더링
+# (matplotlib이 필요하므로 실제로 그릴 때 import, 입력 데이터가 그대로인 그림은 건너뜀)
+def render_charts(top10, platform, quadrant, fmt=None, dpi=None):
+    jobs = []
+    for module_name, tables in (('visualize_top10', top10), ('visualize_platform', platform), ('visualize_quadrant', quadrant)):
+        jobs += importlib.import_module(module_name).chart_jobs(tables)
+    return chart_renderer.render(jobs, fmt=fmt, dpi=dpi)
+
+def load_preprocessed_frames():
+    frames = {}
+    for cat in scoring.categories:
+        try:
+            frames[cat] = scoring.load_preprocessed(cat, rank_bootstrap.BOOTSTRAP_COLUMNS)
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: preprocessed_{cat}.json (전처리를 먼저 진행해주세요!)")
+    return frames
+
+# ---------------------------------------------------------
+# 증분 실행 (--incremental): 카테고리별 가지를 파일 단위 DAG로 구성
+# raw_data/trend_report_{cat}.json → data/preprocessed_{cat}.arrow → result/.../{cat}.arrow (+ .csv 내보내기) → 그래프
+# ---------------------------------------------------------
+def dag_preprocess(cat):
+    os.makedirs('data', exist_ok=True)
+    data_preprocessing.preprocess_category(cat)
+
+def dag_top10(cat):
+    os.makedirs('result/top10_keyword', exist_ok=True)
+    calculate_final_top10.calculate_top10(scoring.load_preprocessed(cat, rank_bootstrap.BOOTSTRAP_COLUMNS), cat)
+
+def dag_platform(cat):
+    os.makedirs('result/platform', exist_ok=True)
+    analyze_trends.analyze_platform(scoring.load_preprocessed(cat), cat)
+
+def dag_quadrant(cat):
+    os.makedirs('result/quadrant', exist_ok=True)
+    quadrant_analysis.analyze_quadrant(scoring.load_preprocessed(cat), cat)
+
+def dag_draw(module_name, func_name, csv_path, cat):
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)(scoring.load_result(csv_path), cat)
+
+def dag_draw_top10(csv_path, cat):
+    module = importlib.import_module('visualize_top10')
+    module.draw_top10_bar(scoring.load_result(csv_path), cat, module.colors[scoring.categories.index(cat)])
+
+def build_dag():
+    dag = DagRunner(state_path='.dag_state.json')
+    scoring_code = ['scoring.py', CONFIG_PATH]
+    chart = chart_renderer.settings()   # 그래프 형식 / DPI가 바뀌면 그리기 단계만 다시 실행
+
+    for cat in scoring.categories:
+        raw = f'raw_data/trend_report_{cat}.json'
+        pre = f'data/preprocessed_{cat}.arrow'
+        top10 = f'result/top10_keyword/final_weighted_top10_{cat}.csv'
+        platform = f'result/platform/analyzed_top10_{cat}.csv'
+        quadrant = f'result/quadrant/positioning_map_{cat}.csv'
+
+        dag.add(f'preprocess:{cat}', dag_preprocess, [raw, 'data_preprocessing.py'],
+                [pre, f'data/preprocessed_{cat}.json', f'data/preprocessed_{cat}.csv'], args=(cat,))
+        dag.add(f'top10:{cat}', dag_top10, [pre, 'calculate_final_top10.py', 'rank_bootstrap.py'] + scoring_code, [top10, arrow_path(top10)], args=(cat,))
+        dag.add(f'platform:{cat}', dag_platform, [pre, 'analyze_trends.py'] + scoring_code, [platform, arrow_path(platform)], args=(cat,))
+        dag.add(f'quadrant:{cat}', dag_quadrant, [pre, 'quadrant_analysis.py'] + scoring_code, [quadrant, arrow_path(quadrant)], args=(cat,))
+
+        # matplotlib.pyplot은 전역 상태라 같은 프로세스 안에서는 그리기 단계끼리만 순서대로 (분석 단계와는 동시에)
+        dag.add(f'draw_top10:{cat}', dag_draw_top10, [arrow_path(top10), 'visualize_top10.py'],
+                [chart_renderer.output_path(f'result/top10_keyword/top10_bar_{cat}')], args=(top10, cat), lock='pyplot', params=chart)
+        dag.add(f'draw_platform:{cat}', dag_draw, [arrow_path(platform), 'visualize_platform.py'],
+                [chart_renderer.output_path(f'result/platform/platform_dominance_{cat}')],
+                args=('visualize_platform', 'draw_platform_dominance', platform, cat), lock='pyplot', params=chart)
+        dag.add(f'draw_quadrant:{cat}', dag_draw, [arrow_path(quadrant), 'visualize_quadrant.py'],
+                [chart_renderer.output_path(f'result/quadrant/quadrant_map_{cat}')],
+                args=('visualize_quadrant', 'draw_quadrant_map', quadrant, cat), lock='pyplot', params=chart)
+    return dag
+
+def main_incremental(force=False, chart_format=None, chart_dpi=None):
+    chart_renderer.configure(chart_format, chart_dpi)
+    print("🚀 [구글 x 네이버 통합 트렌드 분석 파이프라인] 증분 실행 (입력이 바뀐 단계만) 🚀")
+    print("=" * 65)
+    start = time.time()
+    status = build_dag().run(force=force)
+    if not summarize(status, time.time() - start):
         sys.exit(1)
 
-def main():
+def main(skip_preprocess=False, chart_format=None, chart_dpi=None):
     print("🚀 [구글 x 네이버 통합 트렌드 분석 파이프라인] 가동을 시작합니다 🚀")
     print("=" * 65)
     
@@ -32,27 +129,44 @@ def main():
     # ---------------------------------------------------------
     # 📦 [Step 1] 데이터 전처리 (Preprocessing)
     # ---------------------------------------------------------
-    run_script('data_preprocessing.py', 'Step 1: 데이터 전처리 및 신규 지표(기울기) 생성')
+    if skip_preprocess:
+        # 가중치(config.py METRIC_WEIGHTS)만 바꿔 다시 계산할 때: 저장된 전처리 결과 재사용
+        frames = run_step('Step 1: 저장된 전처리 결과 로드 (전처리 생략)', load_preprocessed_frames)
+    else:
+        frames = run_step('Step 1: 데이터 전처리 및 신규 지표(기울기) 생성', data_preprocessing.run)
+    
+    # 전체 카테고리를 category 컬럼으로 합친 한 DataFrame에서 정규화/점수/순위/4분면 기준점을 groupby로 한 번에 계산
+    # (config.py 가중치) → 카테고리별 행으로 나눠 Step 2의 세 분석이 공유
+    scored = scoring.split_by_category(scoring.score_all(scoring.concat_categories(frames))) if frames else {}
     
     # ---------------------------------------------------------
     # 🧠 [Step 2] 데이터 분석 (Analysis)
     # ---------------------------------------------------------
-    run_script('calculate_final_top10.py', 'Step 2-1: 가중치(70:30) 기반 TOP 10 랭킹 산출')
-    run_script('analyze_trends.py', 'Step 2-2: 키워드별 플랫폼 기여도(%) 심층 분석')
-    run_script('quadrant_analysis.py', 'Step 2-3: 4분면(Volume vs Momentum) 포지셔닝 분석')
+    top10 = run_step('Step 2-1: 가중치(70:30) 기반 TOP 10 랭킹 산출 + 순위 부트스트랩', calculate_final_top10.run, scored)
+    platform = run_step('Step 2-2: 키워드별 플랫폼 기여도(%) 심층 분석', analyze_trends.run, scored)
+    quadrant = run_step('Step 2-3: 4분면(Volume vs Momentum) 포지셔닝 분석', quadrant_analysis.run, scored)
     
     # ---------------------------------------------------------
     # 🎨 [Step 3] 데이터 시각화 (Visualization)
     # ---------------------------------------------------------
-    run_script('visualize_top10.py', 'Step 3-1: 카테고리별 TOP 10 수평 막대 그래프 생성')
-    run_script('visualize_platform.py', 'Step 3-2: 플랫폼 기여도 누적 막대 그래프 생성')
-    run_script('visualize_quadrant.py', 'Step 3-3: 4분면 포지셔닝 맵 스캐터 플롯 생성')
+    run_step('Step 3: TOP 10 막대 / 플랫폼 기여도 / 4분면 포지셔닝 맵 그래프 병렬 생성', render_charts,
+             top10, platform, quadrant, chart_format, chart_dpi, name='chart_renderer.render')
     
     total_elapsed = time.time() - total_start
     
     print("\n" + "=" * 65)
     print(f"🎉 모든 파이프라인이 성공적으로 완료되었습니다! (총 소요 시간: {total_elapsed:.2f}초)")
-    print("📁 생성된 결과물(.csv, .png)을 확인해 보세요.")
+    print("📁 생성된 결과물(.csv, 그래프 이미지)을 확인해 보세요.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="구글 x 네이버 통합 트렌드 분석 파이프라인")
+    parser.add_argument("--skip-preprocess", action="store_true", help="data/preprocessed_*.json을 그대로 쓰고 점수/시각화만 다시 실행")
+    parser.add_argument("--incremental", action="store_true", help="입력 파일 내용이 지난 성공 실행과 같은 단계는 건너뛰고, 독립 단계는 동시에 실행")
+    parser.add_argument("--force", action="store_true", help="--incremental에서 해시와 관계없이 모든 단계 실행")
+    parser.add_argument("--chart-format", default=None, choices=chart_renderer.CHART_FORMATS, help="그래프 형식 (기본: png, 웹용은 webp / svg)")
+    parser.add_argument("--chart-dpi", type=int, default=None, help="그래프 해상도 (기본: 300, 웹용은 100~150 권장)")
+    args = parser.parse_args()
+    if args.incremental:
+        main_incremental(force=args.force, chart_format=args.chart_format, chart_dpi=args.chart_dpi)
+    else:
+        main(skip_preprocess=args.skip_preprocess, chart_format=args.chart_format, chart_dpi=args.chart_dpi)
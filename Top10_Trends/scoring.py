@@ -0,0 +1,311 @@
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# 프로젝트 루트의 config.py(가중치) / columnar_store.py(Arrow 중간 저장소) 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import load_config
+from columnar_store import DAILY_RATIO_TYPE, arrow_path, write_frame, read_frame, iter_frames
+
+# 분석할 4가지 카테고리 (모든 단계 공통)
+categories = ['climate', 'entertainment', 'finance', 'sports']
+
+# 정규화 대상 4가지 지표
+metrics = ['google_absolute_volume', 'google_surge_ratio', 'naver_trend_sum', 'naver_growth_slope']
+
+# 전처리 결과 스키마 (data/preprocessed_{cat}.arrow) — 점수 계산은 rank_title + 4가지 지표만 읽음
+PREPROCESSED_SCHEMA = pa.schema(
+    [('rank_title', pa.string())]
+    + [(metric, pa.float64()) for metric in metrics]
+    + [('naver_daily_ratio', DAILY_RATIO_TYPE)]
+)
+SCORING_COLUMNS = ['rank_title'] + metrics
+
+# 단계별 결과 스키마 (result/.../*.arrow) — 같은 이름의 CSV는 엑셀용 내보내기
+TOP10_SCHEMA = pa.schema(
+    [('rank_title', pa.string()), ('total_score', pa.float64())]
+    + [(metric, pa.float64()) for metric in metrics]
+    + [('rank_ci_low', pa.int64()), ('rank_ci_high', pa.int64()), ('top10_prob(%)', pa.float64())]
+)
+PLATFORM_SCHEMA = pa.schema([
+    ('rank_title', pa.string()), ('total_score', pa.float64()),
+    ('google_point', pa.float64()), ('naver_point', pa.float64()),
+    ('google_ratio(%)', pa.float64()), ('naver_ratio(%)', pa.float64()),
+    ('trend_type', pa.string()),
+])
+QUADRANT_SCHEMA = pa.schema([
+    ('rank_title', pa.string()), ('positioning', pa.string()),
+    ('volume_score', pa.float64()), ('momentum_score', pa.float64()),
+    ('total_score', pa.float64()),
+])
+
+# 지표 분류: 플랫폼(구글/네이버) x 성격(Volume/Momentum)
+google_metrics = ['google_absolute_volume', 'google_surge_ratio']
+naver_metrics = ['naver_trend_sum', 'naver_growth_slope']
+volume_metrics = ['google_absolute_volume', 'naver_trend_sum']
+momentum_metrics = ['google_surge_ratio', 'naver_growth_slope']
+
+# 플랫폼 성향 라벨 (기여도 60% 이상이면 해당 플랫폼 강세)
+DOMINANCE_GOOGLE = "🔵 구글 강세 (Google 주도)"
+DOMINANCE_NAVER = "🟢 네이버 강세 (Naver 주도)"
+DOMINANCE_BALANCED = "⚖️ 플랫폼 균형 (Balanced)"
+
+# 4분면 라벨 (기준점: Top 10의 Volume / Momentum 평균)
+QUADRANT_MEGA = "👑 메가 트렌드 (대세)"
+QUADRANT_STEADY = "💎 스테디셀러 (꾸준함)"
+QUADRANT_RISING = "🚀 라이징 스타 (급상승)"
+QUADRANT_NICHE = "🏕️ 니치 마켓 (틈새시장)"
+
+
+# config.py의 지표별 가중치 (METRIC_WEIGHTS) → 지표 순서대로 정렬된 배열
+def load_weights(weights=None):
+    weights = weights or load_config(check_keys=False)["METRIC_WEIGHTS"]
+    return np.array([float(weights[metric]) for metric in metrics])
+
+
+# 전처리 결과 로드 → DataFrame (columns: 필요한 컬럼만, 기본은 점수 계산용 SCORING_COLUMNS)
+# data/preprocessed_{cat}.arrow를 메모리 맵으로 열고 필요한 컬럼만 변환 (일별 시계열은 읽지 않음)
+# .arrow가 없던 이전 실행 결과면 JSON에서 로드 (data_dir: 보관해 둔 다른 실행의 data 폴더)
+def load_preprocessed(cat, columns=None, data_dir='data'):
+    columns = columns or SCORING_COLUMNS
+    path = f'{data_dir}/preprocessed_{cat}.arrow'
+    if os.path.exists(path):
+        return read_frame(path, columns)
+    with open(f'{data_dir}/preprocessed_{cat}.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return pd.DataFrame(data['results'])[columns]
+
+
+# 단계 결과 로드: CSV 경로와 같은 이름의 .arrow가 있으면 그것을 (필요한 컬럼만), 없으면 CSV
+def load_result(csv_path, columns=None):
+    path = arrow_path(csv_path)
+    if os.path.exists(path):
+        return read_frame(path, columns)
+    return pd.read_csv(csv_path, usecols=columns)
+
+
+# 지표 원값 행렬을 주어진 min/max로 Min-Max 정규화 (0~100점, max == min인 지표는 0점)
+def normalize_matrix(x, m_min, m_max):
+    span = m_max - m_min
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scores = ((x - m_min) / span) * 100
+    return np.where(span > 0, scores, 0.0)
+
+
+# 4가지 지표 정규화 (Min-Max, 0~100점) → (키워드 수 x 4) 행렬
+def build_feature_matrix(df):
+    x = df[metrics].to_numpy(dtype=float)
+    return normalize_matrix(x, np.nanmin(x, axis=0), np.nanmax(x, axis=0))
+
+
+# 정규화 행렬 → (google_point, naver_point) 배열 (total_score = 둘의 합)
+def platform_points(scores, w):
+    weighted = scores * w
+    g = [metrics.index(metric) for metric in google_metrics]
+    n = [metrics.index(metric) for metric in naver_metrics]
+    return weighted[:, g[0]] + weighted[:, g[1]], weighted[:, n[0]] + weighted[:, n[1]]
+
+
+# 점수 내림차순 상위 k개의 위치 (동점이면 원래 순서 = sort_values(kind='mergesort')와 같은 순서)
+# argpartition(np.partition)으로 k번째 값만 찾고 그 이상인 후보만 정렬 → O(n + k log k)
+def top_k_order(keys, positions, k):
+    keys = np.where(np.isnan(keys), -np.inf, keys)   # NaN은 맨 뒤 (pandas na_position='last')
+    n = len(keys)
+    if n > k:
+        kth = np.partition(keys, n - k)[n - k]
+        candidates = np.flatnonzero(keys >= kth)
+    else:
+        candidates = np.arange(n)
+    order = candidates[np.lexsort((positions[candidates], -keys[candidates]))]
+    return order[:k]
+
+
+# 점수 행렬 (키워드 x 열: 가중치 후보 / 부트스트랩 반복) → 열별 순위 (1부터, 동점은 원래 순서 = sort_values(kind='mergesort')와 같음, NaN은 맨 뒤)
+def rank_matrix(totals):
+    order = np.argsort(-totals, axis=0, kind='stable')
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, len(totals) + 1)[:, None], axis=0)
+    return ranks
+
+
+# 정규화 행렬 1번 + 가중치로 모든 점수/라벨을 한 번에 계산
+# - {지표}_score, google_point / naver_point / total_score, google_ratio(%) / naver_ratio(%) / trend_type
+# - volume_score / momentum_score (각 100점 만점, 같은 성격 지표의 가중 평균), positioning (4분면 라벨)
+# weights: {지표: 가중치} (없으면 config.py의 METRIC_WEIGHTS) — 전처리 없이 가중치만 바꿔 다시 계산 가능
+# scores: 미리 정규화한 행렬 (스트리밍 모드에서 전체 min/max로 정규화한 상위 후보만 넘길 때)
+def score_category(df, weights=None, scores=None):
+    w = load_weights(weights)
+    if scores is None:
+        scores = build_feature_matrix(df)
+    df = score_columns(df, scores, w)
+
+    # 4분면 분류: 십자선(기준점) = Top 10의 평균
+    rank = df['total_score'].rank(method='first', ascending=False).to_numpy()
+    vol_th, mom_th = top_k_means(df, np.zeros(len(df), dtype=int), rank, 1)
+    df['positioning'] = quadrant_labels(df, vol_th[0], mom_th[0])
+    return df
+
+
+# 정규화 행렬 → 4분면 라벨을 뺀 나머지 점수 컬럼 (score_category / score_all 공통)
+def score_columns(df, scores, w):
+    weighted = scores * w
+
+    df = df.copy()
+    for i, metric in enumerate(metrics):
+        df[f'{metric}_score'] = scores[:, i]
+
+    v = [metrics.index(metric) for metric in volume_metrics]
+    m = [metrics.index(metric) for metric in momentum_metrics]
+
+    # 플랫폼별 획득 점수(Point)와 총점
+    df['google_point'], df['naver_point'] = platform_points(scores, w)
+    df['total_score'] = df['google_point'] + df['naver_point']
+
+    # 플랫폼별 기여도(%)와 성향 라벨 (분모가 0일 경우 fillna(0))
+    df['google_ratio(%)'] = (df['google_point'] / df['total_score'] * 100).fillna(0).round(1)
+    df['naver_ratio(%)'] = (df['naver_point'] / df['total_score'] * 100).fillna(0).round(1)
+    df['trend_type'] = np.select(
+        [df['google_ratio(%)'] >= 60, df['naver_ratio(%)'] >= 60],
+        [DOMINANCE_GOOGLE, DOMINANCE_NAVER],
+        DOMINANCE_BALANCED,
+    )
+
+    # X축(Volume) / Y축(Momentum) 점수: 같은 성격 지표의 가중 평균 (기본 가중치면 단순 평균, 가중치가 모두 0이어도 단순 평균)
+    def axis_score(cols):
+        if w[cols[0]] + w[cols[1]] > 0:
+            return (weighted[:, cols[0]] + weighted[:, cols[1]]) / (w[cols[0]] + w[cols[1]])
+        return (scores[:, cols[0]] + scores[:, cols[1]]) / 2
+
+    df['volume_score'] = axis_score(v)
+    df['momentum_score'] = axis_score(m)
+    return df
+
+
+# 그룹별 상위 k개(rank <= k)의 Volume / Momentum 평균 → (vol 배열, mom 배열), 길이 n_groups
+# score_category(그룹 1개)와 score_all(카테고리별)이 같은 순서로 더하도록 bincount 사용 (NaN은 제외)
+def top_k_means(df, codes, rank, n_groups, k=10):
+    in_top = rank <= k
+    means = []
+    for col in ('volume_score', 'momentum_score'):
+        values = df[col].to_numpy(dtype=float)
+        valid = in_top & ~np.isnan(values)
+        total = np.bincount(codes[valid], weights=values[valid], minlength=n_groups)
+        count = np.bincount(codes[valid], minlength=n_groups)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means.append(total / count)
+    return means
+
+
+# Volume / Momentum 기준점(스칼라 또는 행별 배열) 이상/미만으로 4분면 라벨
+def quadrant_labels(df, vol_threshold, mom_threshold):
+    high_vol = df['volume_score'].to_numpy() >= vol_threshold
+    high_mom = df['momentum_score'].to_numpy() >= mom_threshold
+    return np.select(
+        [high_vol & high_mom, high_vol & ~high_mom, ~high_vol & high_mom],
+        [QUADRANT_MEGA, QUADRANT_STEADY, QUADRANT_RISING],
+        QUADRANT_NICHE,
+    )
+
+
+# 이미 점수가 계산된 DataFrame이면 그대로, 아니면 score_category (파이프라인에서 카테고리당 한 번만 계산)
+def ensure_scored(df, weights=None):
+    if weights is None and 'total_score' in df.columns and 'positioning' in df.columns:
+        return df
+    return score_category(df, weights)
+
+
+# 카테고리별 DataFrame → category(categorical) 컬럼을 붙인 하나의 DataFrame (배치 모드 입력)
+def concat_categories(frames):
+    df_all = pd.concat(list(frames.values()), keys=list(frames.keys()), names=['category', None]).reset_index(level=0)
+    df_all['category'] = pd.Categorical(df_all['category'], categories=list(frames.keys()))
+    return df_all.reset_index(drop=True)
+
+
+# 전체 카테고리 배치 점수 계산: 카테고리 수와 관계없이 groupby 연산 몇 번으로 끝냄 (카테고리별 파이썬 루프 없음)
+# - Min-Max 정규화: 카테고리 그룹별 min/max (groupby.transform)
+# - category_rank: 카테고리 안 total_score 내림차순 순위 (동점은 원래 순서, score_category의 정렬과 동일)
+# - positioning: 카테고리별 Top k의 Volume / Momentum 평균을 기준점으로
+# 결과 값은 카테고리마다 score_category를 돌린 것과 같음
+def score_all(df_all, weights=None, k=10):
+    w = load_weights(weights)
+    x = df_all[metrics].astype(float)
+    grouped = x.groupby(df_all['category'], observed=True, sort=False)
+    scores = normalize_matrix(x.to_numpy(), grouped.transform('min').to_numpy(), grouped.transform('max').to_numpy())
+    df = score_columns(df_all, scores, w)
+
+    df['category_rank'] = df.groupby('category', observed=True)['total_score'].rank(method='first', ascending=False)
+    codes = df['category'].cat.codes.to_numpy()
+    vol_th, mom_th = top_k_means(df, codes, df['category_rank'].to_numpy(), len(df['category'].cat.categories), k)
+    df['positioning'] = quadrant_labels(df, vol_th[codes], mom_th[codes])
+    return df
+
+
+# 배치 결과 → {카테고리: 해당 카테고리 행} (각 분석 단계가 카테고리별 CSV를 그대로 만들 수 있도록)
+def split_by_category(df_all):
+    return {cat: group for cat, group in df_all.groupby('category', observed=True, sort=False)}
+
+
+# 단계 결과 저장: csv_path(엑셀용) + 같은 이름의 .arrow(다음 단계 / 시각화 / DB 적재 입력, schema 컬럼 순서)
+def save_result(df, csv_path, schema):
+    df = df[schema.names]
+    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    write_frame(df, arrow_path(csv_path), schema)
+    return df
+
+
+# 전처리 결과를 조각 단위로 읽는 생성기 (스트리밍 모드 입력)
+# .arrow가 있으면 저장된 레코드 배치 단위(메모리 맵), 없으면 CSV를 chunksize 행씩
+def iter_preprocessed_chunks(cat, chunksize=100_000):
+    path = f'data/preprocessed_{cat}.arrow'
+    if os.path.exists(path):
+        return iter_frames(path, SCORING_COLUMNS)
+    return pd.read_csv(f'data/preprocessed_{cat}.csv', usecols=SCORING_COLUMNS,
+                       dtype={'rank_title': str}, keep_default_na=False, chunksize=chunksize)
+
+
+# 후보 키워드가 10^5~10^6개일 때의 상위 k개 선정 (메모리 O(k + chunk))
+# make_chunks: 호출할 때마다 DataFrame 조각 iterator를 새로 만드는 함수 (두 번 읽음)
+#   1차: 지표별 min/max만 누적
+#   2차: 전체 min/max로 정규화 → total_score → 지금까지의 상위 k개 + 현재 조각에서 다시 상위 k개
+# decimals: 순위를 매길 때 total_score 반올림 자릿수 (calculate_final_top10은 2자리로 반올림 후 정렬)
+# 반환: score_category를 거친 상위 k개 DataFrame (입력 순서, 정렬하면 메모리 경로의 sort_values(...).head(k)와 같음)
+def stream_top_k(make_chunks, k=10, weights=None, decimals=None):
+    w = load_weights(weights)
+
+    m_min = np.full(len(metrics), np.inf)
+    m_max = np.full(len(metrics), -np.inf)
+    for chunk in make_chunks():
+        x = chunk[metrics].to_numpy(dtype=float)
+        if len(x):
+            m_min = np.fmin(m_min, np.nanmin(x, axis=0))
+            m_max = np.fmax(m_max, np.nanmax(x, axis=0))
+
+    best = None
+    offset = 0
+    for chunk in make_chunks():
+        chunk = chunk.reset_index(drop=True)
+        scores = normalize_matrix(chunk[metrics].to_numpy(dtype=float), m_min, m_max)
+        g_point, n_point = platform_points(scores, w)
+        total = g_point + n_point
+        chunk['_key'] = np.round(total, decimals) if decimals is not None else total
+        chunk['_pos'] = np.arange(offset, offset + len(chunk))
+        offset += len(chunk)
+
+        pool = chunk if best is None else pd.concat([best, chunk], ignore_index=True)
+        order = top_k_order(pool['_key'].to_numpy(dtype=float), pool['_pos'].to_numpy(), k)
+        best = pool.iloc[order].reset_index(drop=True)
+
+    if best is None:
+        return pd.DataFrame(columns=['rank_title'] + metrics)
+
+    # 원래 입력 순서로 되돌려 점수 계산 (4분면 기준점을 메모리 경로와 같은 순서로 더하도록, 정렬은 각 분석 단계에서)
+    top = best.sort_values('_pos').drop(columns=['_key', '_pos']).reset_index(drop=True)
+    return score_category(top, weights, scores=normalize_matrix(top[metrics].to_numpy(dtype=float), m_min, m_max))
+
+
+# 카테고리 1개 스트리밍 상위 10개 (전처리 CSV 입력) — 각 분석 단계의 --stream 모드에서 사용
+def stream_top10(cat, chunksize=100_000, decimals=None, weights=None):
+    return stream_top_k(lambda: iter_preprocessed_chunks(cat, chunksize), k=10, weights=weights, decimals=decimals)
@@ -1,59 +1,92 @@
-import pandas as pd
-import matplotlib.pyplot as plt
 import os
+import sys
+import argparse
+
+from scoring import categories, load_result
 
-# ⚠️ 한글 폰트 설정 (윈도우: 'Malgun Gothic', 맥: 'AppleGothic')
-plt.rcParams['font.family'] = 'Malgun Gothic'
-plt.rcParams['axes.unicode_minus'] = False # 마이너스 기호 깨짐 방지
+# 프로젝트 루트의 chart_renderer.py 사용 (Agg 백엔드 + 한글 폰트 설정을 모든 시각화가 공유)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import chart_renderer
+from chart_renderer import ChartJob, save_figure
+
+chart_renderer.setup()
+import matplotlib.pyplot as plt
 
-categories = ['climate', 'entertainment', 'finance', 'sports']
 colors = ['#4CAF50', '#E91E63', '#2196F3', '#FF9800'] # 카테고리별 테마 색상 지정
 
-print("📊 [TOP 10 랭킹] 수평 막대 그래프 생성을 시작합니다...\n")
-
-
-for i, cat in enumerate(categories):
-    try:
-        # 최종 산출된 CSV 파일 로드
-        df = pd.read_csv(f'result/top10_keyword/final_weighted_top10_{cat}.csv')
-        
-        # 수평 막대 그래프는 아래에서부터 그려지므로, 점수를 오름차순 정렬해야 1등이 맨 위로 올라갑니다!
-        df = df.sort_values(by='total_score', ascending=True)
-        
-        # 도화지 생성
-        plt.figure(figsize=(10, 6))
-        
-        # 막대 그래프 그리기 (y축: 키워드, x축: 총점)
-        bars = plt.barh(df['rank_title'], df['total_score'], color=colors[i], alpha=0.8)
-        
-        # 제목 및 축 이름 설정
-        plt.title(f'[{cat.upper()}] 통합 트렌드 TOP 10', fontsize=16, weight='bold', pad=15)
-        plt.xlabel('Total Score (통합 트렌드 점수)', fontsize=12)
-        plt.ylabel('Keywords', fontsize=12)
-        
-        # 막대 끝에 글자가 잘리지 않도록 X축 여백을 15% 정도 더 넓게 설정
-        plt.xlim(0, max(df['total_score']) * 1.15) 
-        
-        # 🎯 막대 끝부분에 정확한 점수(Text) 달아주기
-        for bar in bars:
-            width = bar.get_width()
-            plt.text(width + 1, bar.get_y() + bar.get_height()/2, f'{width:.1f}점', 
-                     ha='left', va='center', fontsize=11, weight='bold', color='black')
-                     
-        # 보기 편하게 세로 점선 그리드 추가
-        plt.grid(axis='x', linestyle='--', alpha=0.5)
-        
-        # 여백 최적화 후 이미지 저장
-        plt.tight_layout()
-        output_filename = f'result/top10_keyword/top10_bar_{cat}.png'
-        plt.savefig(output_filename, dpi=300)
-        plt.close()
-        
-        print(f"✅ [{cat.upper()}] 시각화 완료! ({output_filename})")
-        
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: final_weighted_top10_{cat}.csv")
-    except Exception as e:
-        print(f"❌ 에러 발생: {e}")
-
-print("\n🎉 모든 막대 그래프가 성공적으로 생성되었습니다!")
\ No newline at end of file
+
+# 카테고리 1개 TOP 10 수평 막대 그래프 → result/top10_keyword/top10_bar_{cat}.png (형식은 chart_renderer 설정)
+def draw_top10_bar(df, cat, color):
+    # 수평 막대 그래프는 아래에서부터 그려지므로, 점수를 오름차순 정렬해야 1등이 맨 위로 올라갑니다!
+    df = df.sort_values(by='total_score', ascending=True)
+    
+    # 도화지 생성
+    plt.figure(figsize=(10, 6))
+    
+    # 막대 그래프 그리기 (y축: 키워드, x축: 총점)
+    bars = plt.barh(df['rank_title'], df['total_score'], color=color, alpha=0.8)
+    
+    # 제목 및 축 이름 설정
+    plt.title(f'[{cat.upper()}] 통합 트렌드 TOP 10', fontsize=16, weight='bold', pad=15)
+    plt.xlabel('Total Score (통합 트렌드 점수)', fontsize=12)
+    plt.ylabel('Keywords', fontsize=12)
+    
+    # 막대 끝에 글자가 잘리지 않도록 X축 여백을 15% 정도 더 넓게 설정
+    plt.xlim(0, max(df['total_score']) * 1.15) 
+    
+    # 🎯 막대 끝부분에 정확한 점수(Text) 달아주기
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width + 1, bar.get_y() + bar.get_height()/2, f'{width:.1f}점', 
+                 ha='left', va='center', fontsize=11, weight='bold', color='black')
+                 
+    # 보기 편하게 세로 점선 그리드 추가
+    plt.grid(axis='x', linestyle='--', alpha=0.5)
+    
+    # 여백 최적화 후 이미지 저장
+    plt.tight_layout()
+    output_filename = save_figure(output_base(cat))
+    
+    print(f"✅ [{cat.upper()}] 시각화 완료! ({output_filename})")
+
+
+# 카테고리 1개 그림의 출력 경로 (확장자 제외, 형식은 chart_renderer 설정)
+def output_base(cat):
+    return f'result/top10_keyword/top10_bar_{cat}'
+
+
+# tables: {카테고리: TOP 10 DataFrame} (없으면 최종 산출 CSV 로드)
+# → 카테고리별 ChartJob 목록 (파이프라인에서는 다른 시각화와 함께 한 번에 렌더링)
+def chart_jobs(tables=None):
+    jobs = []
+    for i, cat in enumerate(categories):
+        try:
+            if tables is not None and cat in tables:
+                df = tables[cat]
+            else:
+                # 최종 산출 결과 로드 (.arrow, 없으면 CSV)
+                df = load_result(f'result/top10_keyword/final_weighted_top10_{cat}.csv')
+            jobs.append(ChartJob('visualize_top10', 'draw_top10_bar', (df, cat, colors[i]), output_base(cat)))
+            
+        except FileNotFoundError:
+            print(f"❌ 파일을 찾을 수 없습니다: final_weighted_top10_{cat}.csv")
+    return jobs
+
+
+# fmt / dpi: 출력 형식과 해상도 (기본 png 300dpi), 입력 데이터가 그대로인 그림은 다시 그리지 않음
+def run(tables=None, fmt=None, dpi=None, workers=None, force=False):
+    print("📊 [TOP 10 랭킹] 수평 막대 그래프 생성을 시작합니다...\n")
+
+    chart_renderer.render(chart_jobs(tables), fmt=fmt, dpi=dpi, workers=workers, force=force)
+
+    print("\n🎉 모든 막대 그래프가 성공적으로 생성되었습니다!")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TOP 10 수평 막대 그래프 생성")
+    parser.add_argument("--format", default=None, choices=chart_renderer.CHART_FORMATS, help="출력 형식 (기본: png, 웹용은 webp / svg)")
+    parser.add_argument("--dpi", type=int, default=None, help="해상도 (기본: 300)")
+    parser.add_argument("--workers", type=int, default=None, help="렌더링 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="입력이 그대로여도 모두 다시 그리기")
+    args = parser.parse_args()
+    run(fmt=args.format, dpi=args.dpi, workers=args.workers, force=args.force)
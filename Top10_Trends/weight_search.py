@@ -0,0 +1,143 @@
+import os
+import argparse
+import itertools
+import time
+
+import numpy as np
+import pandas as pd
+
+from scoring import categories, metrics, load_preprocessed, load_weights, build_feature_matrix, rank_matrix
+
+OUTPUT_DIR = 'result/weight_search'
+WEIGHT_COLS = [f'{metric}_weight' for metric in metrics]
+
+
+# 가중치 후보: 4가지 지표 가중치(합 1)를 step 간격으로 나눈 모든 조합 → (후보 수 x 4)
+# (step=0.05면 1,771개, 0.02면 23,426개) — 막대와 별 (stars and bars)로 한 번에 생성
+# step은 1을 나누어떨어지게 하는 값만 허용 (0.03처럼 아니면 다른 간격으로 바뀌므로 ValueError)
+def weight_grid(step=0.05):
+    n = int(round(1 / step)) if step > 0 else 0
+    if n < 1 or not np.isclose(n * step, 1):
+        raise ValueError(f"가중치 격자 간격은 1을 나누어떨어지게 해야 합니다: {step} (예: 0.1, 0.05, 0.02)")
+    bars = np.array(list(itertools.combinations(range(n + len(metrics) - 1), len(metrics) - 1)))
+    edges = np.hstack([np.full((len(bars), 1), -1), bars, np.full((len(bars), 1), n + len(metrics) - 1)])
+    return (np.diff(edges, axis=1) - 1) / n
+
+
+# 가중치 후보: 합 1인 가중치를 균등하게 무작위 추출 (Dirichlet(1,1,1,1)) → (samples x 4)
+def weight_samples(samples, seed=0):
+    return np.random.default_rng(seed).dirichlet(np.ones(len(metrics)), samples)
+
+
+# 기준 점수(ref)와 후보별 점수(totals의 각 열) 사이 Kendall tau-b → 길이 후보 수 배열
+# 키워드 쌍의 대소 부호 행렬끼리 행렬곱 1번으로 계산 (쌍 x 후보 행렬이 커지면 후보를 나눠서)
+def kendall_tau(ref, totals, max_cells=4_000_000):
+    valid = ~np.isnan(ref) & ~np.isnan(totals).any(axis=1)
+    ref, totals = ref[valid], totals[valid]
+    i, j = np.triu_indices(len(ref), 1)
+    a = np.sign(ref[i] - ref[j])
+    taus = np.empty(totals.shape[1])
+    step = max(1, max_cells // max(len(i), 1))
+    for start in range(0, totals.shape[1], step):
+        b = np.sign(totals[i, start:start + step] - totals[j, start:start + step])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            taus[start:start + step] = (a @ b) / np.sqrt(np.count_nonzero(a) * np.count_nonzero(b, axis=0))
+    return taus
+
+
+# 카테고리 1개(실행 1개) 가중치 탐색: 정규화 행렬 x 가중치 후보 행렬 한 번으로 모든 후보의 Total Score 계산
+# → (후보별 결과 DataFrame, 키워드별 순위 안정성 DataFrame)
+# candidates의 0번 행 = 현재 가중치 (Kendall tau / Top 10 유지 수의 기준)
+def search_category(df, candidates, k=10):
+    scores = build_feature_matrix(df)
+    totals = scores @ candidates.T                     # (키워드 x 후보)
+    ranks = rank_matrix(totals)
+    in_top = ranks <= k
+    current_top = in_top[:, 0]
+    titles = df['rank_title'].to_numpy()
+
+    order = np.argsort(ranks, axis=0)[:k]              # 후보별 Top k 키워드 위치 (순위 순)
+    grid = pd.DataFrame(candidates, columns=WEIGHT_COLS)
+    grid.insert(0, 'candidate_id', np.arange(len(candidates)))
+    grid['kendall_tau'] = kendall_tau(totals[:, 0], totals).round(4)
+    grid['top10_kept'] = in_top[current_top].sum(axis=0)
+    grid['top10'] = [' | '.join(top) for top in titles[order.T]]
+
+    stability = pd.DataFrame({
+        'rank_title': titles,
+        'current_rank': ranks[:, 0],
+        'top10_share(%)': (in_top.mean(axis=1) * 100).round(1),
+        'best_rank': ranks.min(axis=1),
+        'worst_rank': ranks.max(axis=1),
+        'median_rank': np.median(ranks, axis=1),
+        'rank_std': ranks.std(axis=1).round(2),
+    }).sort_values('current_rank', kind='mergesort')
+    return grid, stability
+
+
+# 전체 카테고리 x 보관된 실행(runs: data 폴더 목록)에 대해 가중치 탐색
+# → result/weight_search/weight_grid_{cat}.csv / keyword_stability_{cat}.csv / weight_summary.csv
+def run(runs=('data',), step=0.05, samples=None, seed=0, weights=None):
+    print("⚖️ 가중치 민감도 / 격자 탐색을 시작합니다...\n")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    start = time.time()
+
+    current = load_weights(weights)
+    candidates = weight_samples(samples, seed) if samples else weight_grid(step)
+    candidates = np.vstack([current / current.sum(), candidates])
+    print(f"   [가중치 후보] {len(candidates) - 1:,}개 + 현재 가중치 {dict(zip(metrics, current.tolist()))}")
+
+    summaries = []
+    for cat in categories:
+        grids, stabilities = [], []
+        for data_dir in runs:
+            try:
+                df = load_preprocessed(cat, data_dir=data_dir)
+            except FileNotFoundError:
+                print(f"❌ 파일을 찾을 수 없습니다: {data_dir}/preprocessed_{cat}.json")
+                continue
+            grid, stability = search_category(df, candidates)
+            grid.insert(0, 'run', data_dir)
+            stability.insert(0, 'run', data_dir)
+            grids.append(grid)
+            stabilities.append(stability)
+        if not grids:
+            continue
+
+        grid = pd.concat(grids, ignore_index=True)
+        stability = pd.concat(stabilities, ignore_index=True)
+        grid.to_csv(f'{OUTPUT_DIR}/weight_grid_{cat}.csv', index=False, encoding='utf-8-sig')
+        stability.to_csv(f'{OUTPUT_DIR}/keyword_stability_{cat}.csv', index=False, encoding='utf-8-sig')
+        summaries.append(grid.assign(category=cat))
+
+        unchanged = (grid['top10_kept'] == 10).mean() * 100
+        shaky = stability[stability['current_rank'] <= 10].sort_values('top10_share(%)', kind='mergesort').iloc[0]
+        print(f"✅ [{cat.upper()}] Kendall tau 중앙값 {grid['kendall_tau'].median():.3f} / "
+              f"Top 10이 그대로인 후보 {unchanged:.1f}% / 가장 흔들리는 Top 10 키워드: "
+              f"{shaky['rank_title']} (Top 10 유지 {shaky['top10_share(%)']}%)")
+
+    if not summaries:
+        return None
+
+    # 후보별 전체 요약: 모든 카테고리 x 실행 평균 / 최저 Kendall tau와 평균 Top 10 유지 수
+    summary = (pd.concat(summaries, ignore_index=True)
+               .groupby('candidate_id', sort=True)
+               .agg(**{col: (col, 'first') for col in WEIGHT_COLS},
+                    mean_tau=('kendall_tau', 'mean'), min_tau=('kendall_tau', 'min'),
+                    mean_top10_kept=('top10_kept', 'mean'))
+               .round(4).reset_index())
+    summary.to_csv(f'{OUTPUT_DIR}/weight_summary.csv', index=False, encoding='utf-8-sig')
+
+    print(f"\n🎉 후보 {len(candidates):,}개 x 카테고리 {len(summaries)}개 x 실행 {len(runs)}개 탐색 완료! "
+          f"(소요 시간: {time.time() - start:.2f}초, {OUTPUT_DIR}/)")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Top 10 가중치 민감도 / 격자 탐색 (파이프라인 재실행 없음)")
+    parser.add_argument("--runs", nargs='+', default=['data'], help="전처리 결과가 있는 data 폴더 목록 (보관해 둔 이전 실행 포함)")
+    parser.add_argument("--step", type=float, default=0.05, help="가중치 격자 간격 (가중치 합 1 기준)")
+    parser.add_argument("--samples", type=int, default=None, help="격자 대신 무작위 가중치 후보 수")
+    parser.add_argument("--seed", type=int, default=0, help="--samples 난수 시드")
+    args = parser.parse_args()
+    run(runs=args.runs, step=args.step, samples=args.samples, seed=args.seed)
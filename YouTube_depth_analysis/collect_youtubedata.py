@@ -1,16 +1,27 @@
 import os
+import sys
+import csv
 import json
-import time
-import pandas as pd
+import textwrap
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from youtube_quota import QUOTA_COSTS, QuotaTracker, Checkpoint, prioritize_keywords
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rate_limit import TokenBucket
 
 # 1. 환경 설정 및 API 로드
 load_dotenv()
 API_KEY = os.getenv('YOUTUBE_API_KEY')
 KST = timezone(timedelta(hours=9))
+RATE_PER_SEC = float(os.getenv('YOUTUBE_RATE_PER_SEC', 2))  # 워커 전체 공유 초당 호출 수 (기존 0.5초 매너 타임과 동일)
+STREAM_FILE = "youtube_data_stream.jsonl"
 
 def format_kst_time(iso_date_str=None):
     """유튜브의 UTC 시간을 뉴스 데이터와 동일한 YYYY-MM-DD HH:MM (KST) 형식으로 변환"""
@@ -25,57 +36,109 @@ def format_kst_time(iso_date_str=None):
             return iso_date_str
     return dt.strftime("%Y-%m-%d %H:%M")
 
+VIDEOS_BATCH_SIZE = 50   # videos().list는 요청 1회에 ID 최대 50개 (쿼터 1 unit)
+SEARCH_MAX_RESULTS = 3   # 키워드당 검색 영상 수 (쿼터 100 unit)
+_client_local = threading.local()
+
+def get_youtube_client():
+    """
+    유튜브 API 클라이언트를 스레드마다 한 번만 만들어 재사용합니다.
+    (googleapiclient의 http 객체는 스레드 간 공유가 안전하지 않아 워커별로 하나씩 사용)
+    static_discovery=True: 패키지에 포함된 discovery 문서를 사용해 매번 네트워크로 받아오지 않음
+    """
+    client = getattr(_client_local, 'client', None)
+    if client is None:
+        client = build('youtube', 'v3', developerKey=API_KEY,
+                       static_discovery=True, cache_discovery=False)
+        _client_local.client = client
+    return client
+
+def search_video_ids(keyword, max_results=SEARCH_MAX_RESULTS):
+    """1단계: 검색을 통해 영상 ID 추출 (순위 보존, 쿼터 100 unit)"""
+    search_res = get_youtube_client().search().list(
+        q=keyword,
+        part='id',
+        maxResults=max_results,
+        type='video',
+        regionCode='KR',
+        order='relevance' # 관련성 순 (유행 반영)
+    ).execute()
+    return [item['id']['videoId'] for item in search_res.get('items', []) if 'videoId' in item['id']]
+
+def fetch_video_chunk(video_ids, part='statistics,snippet'):
+    """videos().list 1회 호출 (ID 최대 50개) → [API 응답 item]"""
+    video_res = get_youtube_client().videos().list(
+        part=part,
+        id=','.join(video_ids)
+    ).execute()
+    return video_res.get('items', [])
+
+def fetch_video_details(video_ids, tracker=None, part='statistics,snippet'):
+    """
+    2단계: 여러 키워드의 영상 ID를 모아 50개씩 videos().list로 상세 지표를 조회합니다.
+    tracker(QuotaTracker)를 주면 호출마다 쿼터를 차감하고, 쿼터가 부족하면 남은 ID는 조회하지 않습니다.
+    part='statistics'로 주면 조회수/좋아요/댓글 수만 받습니다. (통계 갱신 모드)
+    반환: ({video_id: API 응답 item}, [조회하지 못한 video_id])
+    """
+    unique_ids = list(dict.fromkeys(video_ids))  # 키워드 간 중복 영상은 한 번만 조회
+    details = {}
+    for i in range(0, len(unique_ids), VIDEOS_BATCH_SIZE):
+        if tracker is not None and not tracker.can_afford(QUOTA_COSTS["videos"]):
+            return details, unique_ids[i:]
+        try:
+            items = fetch_video_chunk(unique_ids[i:i + VIDEOS_BATCH_SIZE], part)
+        except HttpError as e:
+            if tracker is None or e.resp.status != 403:
+                raise
+            tracker.mark_exhausted()
+            return details, unique_ids[i:]
+        if tracker is not None:
+            tracker.spend("videos")
+        for video in items:
+            details[video['id']] = video
+    return details, []
+
+def build_video_row(video, run_id, keyword_id, collected_at):
+    stats = video.get('statistics', {})
+    snippet = video.get('snippet', {})
+    return {
+        "run_id": run_id,               
+        "keyword_id": keyword_id,       
+        "youtube_id": video['id'],
+        "title": snippet.get('title'),
+        "channel_title": snippet.get('channelTitle'),
+        "published_at": format_kst_time(snippet.get('publishedAt')),
+        "view_count": int(stats.get('viewCount', 0)),
+        "like_count": int(stats.get('likeCount', 0)),
+        "comment_count": int(stats.get('commentCount', 0)),
+        "thumbnail_url": snippet.get('thumbnails', {}).get('high', {}).get('url'),
+        "collected_at": collected_at
+    }
+
+def fan_out_rows(targets, details, collected_at):
+    """
+    배치 조회 결과를 검색 순위 그대로 (run_id, keyword_id)별 행으로 다시 나눕니다.
+    targets: [(run_id, keyword_id, [video_id, ...]), ...]
+    """
+    rows = []
+    for run_id, keyword_id, video_ids in targets:
+        for video_id in video_ids:
+            if video_id in details:
+                rows.append(build_video_row(details[video_id], run_id, keyword_id, collected_at))
+    return rows
+
 def get_youtube_data(keyword, keyword_id, run_id):
     """특정 키워드에 대해 유튜브 상세 데이터를 수집"""
     if not API_KEY:
         print("🚨 API_KEY가 설정되지 않았습니다.")
         return None
-    
-    youtube = build('youtube', 'v3', developerKey=API_KEY)
 
     try:
-        # 1단계: 검색을 통해 영상 ID 3개 추출 (순위 보존)
-        search_res = youtube.search().list(
-            q=keyword,
-            part='id',
-            maxResults=3,
-            type='video',
-            regionCode='KR',
-            order='relevance' # 관련성 순 (유행 반영)
-        ).execute()
-
-        video_ids = [item['id']['videoId'] for item in search_res.get('items', []) if 'videoId' in item['id']]
-        
+        video_ids = search_video_ids(keyword)
         if not video_ids:
             return []
-
-        # 2단계: 영상 ID들로 상세 지표(조회수 등) 수집
-        video_res = youtube.videos().list(
-            part='statistics,snippet',
-            id=','.join(video_ids)
-        ).execute()
-
-        collected_at = format_kst_time()
-        youtube_rows = []
-        
-        for video in video_res.get('items', []):
-            stats = video.get('statistics', {})
-            snippet = video.get('snippet', {})
-            
-            youtube_rows.append({
-                "run_id": run_id,               
-                "keyword_id": keyword_id,       
-                "youtube_id": video['id'],
-                "title": snippet.get('title'),
-                "channel_title": snippet.get('channelTitle'),
-                "published_at": format_kst_time(snippet.get('publishedAt')),
-                "view_count": int(stats.get('viewCount', 0)),
-                "like_count": int(stats.get('likeCount', 0)),
-                "comment_count": int(stats.get('commentCount', 0)),
-                "thumbnail_url": snippet.get('thumbnails', {}).get('high', {}).get('url'),
-                "collected_at": collected_at
-            })
-        return youtube_rows
+        details, _ = fetch_video_details(video_ids)
+        return fan_out_rows([(run_id, keyword_id, video_ids)], details, format_kst_time())
 
     except HttpError as e:
         if e.resp.status == 403:
@@ -86,70 +149,235 @@ def get_youtube_data(keyword, keyword_id, run_id):
 # =========================
 # 메인 실행부
 # =========================
-if __name__ == "__main__":
+NEWS_FILE_PATH = r'C:\git_down\Peak-Time\news\daum_news_grouped_by_category_keyword.json'
+
+def append_stream(rows, path=STREAM_FILE):
+    """수집된 행을 바로 JSONL 파일에 이어 씁니다. (전체 결과를 메모리에 모아두지 않음)"""
+    with open(path, "a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+def iter_stream(path=STREAM_FILE):
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def save_outputs(rows):
+    """
+    DB 적재용 JSON, 분석용 CSV, 키워드별 요약 CSV 저장.
+    rows는 리스트든 JSONL 스트림이든 한 행씩만 읽어서 쓰므로 키워드 수와 관계없이 메모리가 일정합니다.
+    반환: 저장한 행 수
+    """
+    summary = {}   # (run_id, keyword_id) -> [view, like, comment] 합계
+    count = 0
+    with open("youtube_data_integrated.json", "w", encoding="utf-8") as f_json, \
+         open("youtube_data_integrated.csv", "w", encoding="utf-8-sig", newline="") as f_csv:
+        writer = None
+        f_json.write("[")
+        for row in rows:
+            # 1. DB 적재용 전체 데이터 (json.dump(indent=4)와 같은 형식)
+            f_json.write(",\n" if count else "\n")
+            f_json.write(textwrap.indent(json.dumps(row, ensure_ascii=False, indent=4), "    "))
+
+            # 2. 분석 및 확인용 CSV
+            if writer is None:
+                writer = csv.DictWriter(f_csv, fieldnames=list(row), lineterminator="\n")
+                writer.writeheader()
+            writer.writerow(row)
+
+            # 3. 키워드별 합계 지표 누적
+            totals = summary.setdefault((row['run_id'], row['keyword_id']), [0, 0, 0])
+            totals[0] += row['view_count']
+            totals[1] += row['like_count']
+            totals[2] += row['comment_count']
+            count += 1
+        f_json.write("\n]" if count else "]")
+
+    # 3. 분석팀을 위한 키워드별 요약 파일 (합계 지표)
+    with open("youtube_keyword_summary.csv", "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(['run_id', 'keyword_id', 'view_count', 'like_count', 'comment_count'])
+        for key in sorted(summary):
+            writer.writerow(list(key) + summary[key])
+    return count
+
+def collect_all(news_file_path=NEWS_FILE_PATH, budget=None, workers=1):
+    """
+    뉴스 JSON의 키워드별 유튜브 데이터를 쿼터 범위 안에서 수집하고 JSON/CSV로 저장합니다.
+    - Top10 순위(rank_no)가 높은 키워드부터 검색 (검색 1회 = 100 unit)
+    - 키워드마다 체크포인트 저장 → 쿼터가 떨어지면 멈췄다가 다음 실행/다음 쿼터 일자에 이어서 진행
+    - workers개 스레드가 공유 토큰 버킷(초당 RATE_PER_SEC회) 아래에서 동시에 호출
+    - 완료된 키워드의 행은 즉시 youtube_data_stream.jsonl에 추가하고, 최종 파일은 스트림에서 만듭니다.
+    budget: 이번 실행에서 쓸 최대 쿼터 unit (None이면 남은 일일 쿼터 전체)
+    """
     # 조원이 생성한 뉴스 데이터 파일 로드
-    news_file_path = r'C:\git_down\Peak-Time\news\daum_news_grouped_by_category_keyword.json'
-    
     if not os.path.exists(news_file_path):
         print(f"🚨 파일을 찾을 수 없습니다: {news_file_path}")
-        exit()
+        return None
 
     with open(news_file_path, 'r', encoding='utf-8') as f:
         news_data = json.load(f)
 
-    final_db_data = []
+    if not API_KEY:
+        print("🚨 API_KEY가 설정되지 않았습니다.")
+        return None
+
+    work = prioritize_keywords(news_data)
+    by_key = {item["key"]: item for item in work}
+    source = f"{os.path.basename(news_file_path)}@{int(os.path.getmtime(news_file_path))}"
+    checkpoint = Checkpoint(source=source)
+    tracker = QuotaTracker(budget=budget)
+    bucket = TokenBucket(RATE_PER_SEC)
+    if checkpoint.resumed:
+        print(f"♻️ 체크포인트에서 이어서 진행: 검색 완료 {len(checkpoint.searched)}/{len(work)}개 키워드")
+    elif os.path.exists(STREAM_FILE):
+        os.remove(STREAM_FILE)   # 새 수집 → 이전 스트림 폐기
+    print(f"💰 사용 가능 쿼터: {tracker.remaining} unit (오늘 사용 {tracker.used}/{tracker.daily_quota}) / 워커 {workers}개")
+
     is_halted = False
+    done = set(checkpoint.done)
+
+    def search_task(item):
+        bucket.acquire()
+        return search_video_ids(item["keyword"])
+
+    def details_task(chunk):
+        bucket.acquire()
+        return fetch_video_chunk(chunk)
 
-    # 뉴스 데이터의 [카테고리] -> [키워드] 구조를 그대로 따라감 (순서 보장)
-    for category, keywords_dict in news_data.items():
-        if is_halted: break
-        print(f"\n📂 카테고리 수집 중: {category}")
-
-        for keyword, articles in keywords_dict.items():
-            if not articles: continue
-            
-            # (각 키워드의 첫 번째 기사 객체에서 ID를 참조)
-            target_run_id = articles[0]['run_id']
-            target_keyword_id = articles[0]['keyword_id']
-            
-            print(f"  └─ 키워드: '{keyword}' (ID: {target_keyword_id}) 수집 시작...", end="", flush=True)
-            
-            # 유튜브 데이터 가져오기
-            results = get_youtube_data(keyword, target_keyword_id, target_run_id)
-            
-            if results == "QUOTA_EXCEEDED":
-                print("\n🛑 유튜브 API 할당량이 초과되었습니다. 수집을 중단합니다.")
-                is_halted = True
+    def search_cost(new_searches):
+        # 새 검색 비용 + (검색 완료/진행 중 영상의 상세 조회 비용)을 미리 확보
+        pending_ids = sum(len(ids) for key, ids in checkpoint.searched.items() if key not in done)
+        pending_ids += new_searches * SEARCH_MAX_RESULTS
+        return QUOTA_COSTS["search"] * new_searches + -(-pending_ids // VIDEOS_BATCH_SIZE) * QUOTA_COSTS["videos"]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 1) 검색: 우선순위 순서대로 빈 워커에 제출하고, 끝나는 대로 체크포인트 저장
+        queue_items = iter([item for item in work if item["key"] not in checkpoint.searched])
+        in_flight = {}
+        while True:
+            while not is_halted and len(in_flight) < workers:
+                item = next(queue_items, None)
+                if item is None:
+                    break
+                if not tracker.can_afford(search_cost(len(in_flight) + 1)):
+                    print("\n💤 남은 쿼터가 부족합니다. 진행 상황을 저장했고 다음 실행에서 이어서 수집합니다.")
+                    is_halted = True
+                    break
+                in_flight[executor.submit(search_task, item)] = item
+            if not in_flight:
                 break
-            
-            if results:
-                final_db_data.extend(results)
-                print(f" 완료 ({len(results)}개 영상)")
-            else:
-                print(" 데이터 없음")
-            
-            time.sleep(0.5) # API 매너 타임
-
-    # 최종 저장 (JSON 및 CSV)
-    if final_db_data:
-        # 1. DB 적재용 전체 데이터 저장
-        with open("youtube_data_integrated.json", "w", encoding="utf-8") as f:
-            json.dump(final_db_data, f, ensure_ascii=False, indent=4)
-        
-        # 2. 분석 및 확인용 CSV 저장
-        df = pd.DataFrame(final_db_data)
-        df.to_csv("youtube_data_integrated.csv", index=False, encoding='utf-8-sig')
-
-        # 3. 분석팀을 위한 키워드별 요약 파일 (합계 지표)
-        summary = df.groupby(['run_id', 'keyword_id']).agg({
-            'view_count': 'sum',
-            'like_count': 'sum',
-            'comment_count': 'sum'
-        }).reset_index()
-        summary.to_csv("youtube_keyword_summary.csv", index=False, encoding='utf-8-sig')
 
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                item = in_flight.pop(future)
+                rank_text = f"{item['rank_no']}위" if item["rank_no"] else "순위 외"
+                label = f"  └─ [{item['category']} {rank_text}] '{item['keyword']}' (ID: {item['keyword_id']})"
+                try:
+                    video_ids = future.result()
+                except HttpError as e:
+                    if e.resp.status == 403:
+                        if not is_halted:
+                            print("\n🛑 유튜브 API 할당량이 초과되었습니다. 진행 상황을 저장했고 다음 쿼터 일자에 이어서 수집합니다.")
+                        tracker.mark_exhausted()
+                        is_halted = True
+                    else:
+                        print(f"{label} ❌ API 에러 발생: {e}")
+                    continue
+
+                tracker.spend("search")
+                checkpoint.searched[item["key"]] = video_ids
+                checkpoint.save()
+                print(f"{label} {len(video_ids)}개 영상" if video_ids else f"{label} 데이터 없음")
+
+        # 2) 상세 지표: 상세를 받지 못한 키워드의 영상 ID를 50개씩 묶어 동시에 조회하고,
+        #    키워드의 영상이 모두 도착하면 바로 행으로 분배해 스트림에 추가
+        pending = {key: ids for key, ids in checkpoint.searched.items() if key not in done and key in by_key}
+        # 검색 결과가 없는 키워드는 받을 상세가 없으므로 바로 완료 처리 (상세 조회가 하나도 안 돌아도 체크포인트가 끝나도록)
+        empty = [key for key, ids in pending.items() if not ids]
+        if empty:
+            for key in empty:
+                pending.pop(key)
+                done.add(key)
+            checkpoint.done = sorted(done)
+            checkpoint.save()
+        needed = Counter(video_id for ids in pending.values() for video_id in set(ids))
+        unique_ids = list(needed)
+        chunks = [unique_ids[i:i + VIDEOS_BATCH_SIZE] for i in range(0, len(unique_ids), VIDEOS_BATCH_SIZE)]
+        affordable = tracker.remaining // QUOTA_COSTS["videos"]
+        unfetched = set(video_id for chunk in chunks[affordable:] for video_id in chunk)
+        futures = {executor.submit(details_task, chunk): chunk for chunk in chunks[:affordable]}
+
+        details, fetched = {}, set()
+        collected_at = format_kst_time()
+        written = 0
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                items = future.result()
+            except HttpError as e:
+                if e.resp.status == 403:
+                    tracker.mark_exhausted()
+                else:
+                    print(f"❌ 상세 지표 조회 실패: {e}")
+                unfetched.update(chunk)
+                continue
+            tracker.spend("videos")
+            fetched.update(chunk)
+            for video in items:
+                details[video['id']] = video
+
+            for key in [k for k, ids in pending.items() if fetched.issuperset(ids)]:
+                item = by_key[key]
+                rows = fan_out_rows([(item["run_id"], item["keyword_id"], pending[key])], details, collected_at)
+                append_stream(rows)
+                written += len(rows)
+                done.add(key)
+                checkpoint.done = sorted(done)
+                checkpoint.save()
+                # 다른 키워드가 더 쓰지 않는 영상은 메모리에서 제거
+                for video_id in set(pending.pop(key)):
+                    needed[video_id] -= 1
+                    if needed[video_id] == 0:
+                        details.pop(video_id, None)
+
+    if unfetched:
+        is_halted = True
+    print(f"\n📦 상세 지표 조회: 영상 {len(fetched)}개 / 쿼터 사용 {tracker.run_used} unit "
+          f"(search {tracker.by_call['search']}회 · videos {tracker.by_call['videos']}회, 오늘 누적)")
+
+    # 3) 저장: 중간에 멈췄어도 완료된 키워드까지는 저장 (스트림에 도착한 순서)
+    remaining = len(work) - len(done & set(by_key))
+    total = save_outputs(iter_stream()) if os.path.exists(STREAM_FILE) else 0
+    if remaining == 0:
+        checkpoint.clear()
+
+    if total:
         print("\n" + "="*50)
-        print(f"✨ 수집 및 동기화 완료!")
-        print(f"📊 총 수집된 영상 수: {len(final_db_data)}개")
+        print(f"✨ 수집 및 동기화 완료!" if remaining == 0 else f"⏸️ 부분 저장 완료 (남은 키워드 {remaining}개는 다음 실행에서 이어서 수집)")
+        print(f"📊 총 수집된 영상 수: {total}개 (이번 실행 {written}개)")
         print(f"📁 저장 파일: youtube_data_integrated.json / csv")
-        print("="*50)
\ No newline at end of file
+        print("="*50)
+
+    return {"videos": total, "quota_exceeded": is_halted,
+            "pending_keywords": remaining, "quota_used": tracker.run_used}
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="뉴스 키워드별 유튜브 영상 수집 (쿼터 인식 + 체크포인트 재개)")
+    parser.add_argument("--news-file", default=NEWS_FILE_PATH, help="키워드/ID를 읽을 뉴스 JSON 경로")
+    parser.add_argument("--budget", type=int, default=None, help="이번 실행에서 쓸 최대 쿼터 unit")
+    parser.add_argument("--refresh-stats", action="store_true", help="검색 없이 저장된 영상의 조회수/좋아요/댓글 수만 갱신")
+    parser.add_argument("--source", choices=["csv", "db"], default="csv", help="통계 갱신 모드에서 영상 ID를 읽을 위치")
+    parser.add_argument("--workers", type=int, default=1, help="동시 호출 워커 수 (초당 호출 수는 YOUTUBE_RATE_PER_SEC로 공유 제한)")
+    args = parser.parse_args()
+
+    if args.refresh_stats:
+        from refresh_youtube_stats import refresh_stats
+        refresh_stats(source=args.source, budget=args.budget)
+    else:
+        collect_all(args.news_file, budget=args.budget, workers=max(1, args.workers))
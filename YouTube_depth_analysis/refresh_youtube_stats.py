@@ -0,0 +1,153 @@
+import os
+import json
+from datetime import datetime
+
+import pandas as pd
+
+from collect_youtubedata import API_KEY, KST, VIDEOS_BATCH_SIZE, fetch_video_details, format_kst_time, save_outputs
+from youtube_quota import QuotaTracker
+
+INTEGRATED_CSV = "youtube_data_integrated.csv"
+HISTORY_FILE = "youtube_stats_history.csv"
+VELOCITY_FILE = "youtube_engagement_velocity.csv"
+COUNT_COLUMNS = ["view_count", "like_count", "comment_count"]
+
+
+def _connect_db():
+    import psycopg2
+
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL이 설정되어 있지 않아 youtube_video를 조회할 수 없습니다.")
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return psycopg2.connect(url)
+
+
+def load_stored_videos(source="csv"):
+    """
+    통계를 갱신할 영상 목록을 읽어옵니다.
+    - csv: youtube_data_integrated.csv 전체 행 (갱신 후 같은 파일에 다시 저장)
+    - db: youtube_video 테이블의 (run_id, keyword_id, youtube_id)
+    """
+    if source == "db":
+        conn = _connect_db()
+        try:
+            df = pd.read_sql("SELECT run_id, keyword_id, youtube_id FROM youtube_video", conn)
+        finally:
+            conn.close()
+        return df
+
+    if not os.path.exists(INTEGRATED_CSV):
+        raise FileNotFoundError(f"{INTEGRATED_CSV}이 없습니다. 먼저 전체 수집을 실행하세요.")
+    return pd.read_csv(INTEGRATED_CSV, encoding="utf-8-sig")
+
+
+def apply_statistics(df, details, collected_at):
+    """조회한 statistics로 조회수/좋아요/댓글 수를 덮어씁니다. (조회되지 않은 영상은 기존 값 유지)"""
+    df = df.copy()
+    refreshed = df["youtube_id"].isin(list(details))
+    for column, api_key in zip(COUNT_COLUMNS, ["viewCount", "likeCount", "commentCount"]):
+        df.loc[refreshed, column] = df.loc[refreshed, "youtube_id"].map(
+            lambda vid: int(details[vid].get("statistics", {}).get(api_key, 0))
+        )
+    df.loc[refreshed, "collected_at"] = collected_at
+    return df, int(refreshed.sum())
+
+
+def append_history(df, collected_at, path=HISTORY_FILE):
+    """영상별 카운트 스냅샷을 이력 파일에 누적합니다. (같은 영상이 여러 키워드에 걸려 있어도 1행)"""
+    snapshot = df.drop_duplicates("youtube_id")[["youtube_id"] + COUNT_COLUMNS].copy()
+    snapshot["collected_at"] = collected_at
+    snapshot.to_csv(path, mode="a", index=False, header=not os.path.exists(path), encoding="utf-8-sig")
+    return snapshot
+
+
+def compute_engagement_velocity(history):
+    """
+    영상별 마지막 두 스냅샷 사이의 시간당 증가량(조회수/좋아요/댓글 수)을 계산합니다.
+    스냅샷이 하나뿐인 영상은 제외합니다.
+    """
+    history = history.copy()
+    history["collected_at"] = pd.to_datetime(history["collected_at"])
+    history = history.sort_values(["youtube_id", "collected_at"])
+    last_two = history.groupby("youtube_id").tail(2)
+    first = last_two.groupby("youtube_id").first()
+    last = last_two.groupby("youtube_id").last()
+
+    hours = (last["collected_at"] - first["collected_at"]).dt.total_seconds() / 3600
+    valid = hours > 0
+    velocity = pd.DataFrame(index=last.index[valid])
+    velocity["hours"] = hours[valid].round(2)
+    for column in COUNT_COLUMNS:
+        velocity[column.replace("_count", "s_per_hour")] = ((last[column] - first[column])[valid] / hours[valid]).round(2)
+    velocity["collected_at"] = last["collected_at"][valid].dt.strftime("%Y-%m-%d %H:%M")
+    return velocity.reset_index().sort_values("views_per_hour", ascending=False)
+
+
+def store_to_db(df, collected_at):
+    """youtube_video 카운트를 제자리 갱신하고 youtube_video_stats에 이력을 남깁니다."""
+    # collected_at은 타임존 없는 KST 문자열 → TIMESTAMPTZ 컬럼이 세션 타임존(UTC)으로 읽지 않도록 KST를 붙여서 저장
+    collected_at = datetime.strptime(collected_at, "%Y-%m-%d %H:%M").replace(tzinfo=KST)
+    rows = [
+        (int(r.view_count), int(r.like_count), int(r.comment_count), collected_at,
+         int(r.run_id), int(r.keyword_id), r.youtube_id)
+        for r in df.itertuples()
+    ]
+    conn = _connect_db()
+    cursor = conn.cursor()
+    cursor.executemany("""
+        UPDATE youtube_video
+        SET view_count = %s, like_count = %s, comment_count = %s, collected_at = %s
+        WHERE run_id = %s AND keyword_id = %s AND youtube_id = %s
+    """, rows)
+    cursor.executemany("""
+        INSERT INTO youtube_video_stats (run_id, keyword_id, youtube_id, view_count, like_count, comment_count, collected_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """, [(r[4], r[5], r[6], r[0], r[1], r[2], r[3]) for r in rows])
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def refresh_stats(source="csv", budget=None):
+    """
+    search().list(100 unit) 없이 저장된 영상 ID로 statistics만 50개씩 다시 조회합니다. (호출당 1 unit)
+    카운트는 제자리 갱신하고, 이력 파일에 스냅샷을 쌓아 시간당 증가량(engagement velocity)을 계산합니다.
+    """
+    if not API_KEY:
+        print("🚨 API_KEY가 설정되지 않았습니다.")
+        return None
+
+    df = load_stored_videos(source)
+    if df.empty:
+        print("⚠️ 갱신할 영상이 없습니다.")
+        return {"videos": 0}
+
+    tracker = QuotaTracker(budget=budget)
+    video_ids = df["youtube_id"].dropna().unique().tolist()
+    print(f"🔄 통계 갱신: 영상 {len(video_ids)}개 / videos.list {-(-len(video_ids) // VIDEOS_BATCH_SIZE)}회 예정")
+
+    details, unfetched = fetch_video_details(video_ids, tracker, part="statistics")
+    collected_at = format_kst_time()
+    df, refreshed = apply_statistics(df, details, collected_at)
+    if unfetched:
+        print(f"⚠️ 쿼터 부족으로 {len(unfetched)}개 영상은 갱신하지 못했습니다.")
+
+    if refreshed == 0:
+        return {"videos": 0, "quota_used": tracker.run_used, "unfetched": len(unfetched)}
+
+    if source == "db":
+        store_to_db(df[df["youtube_id"].isin(list(details))], collected_at)
+    else:
+        save_outputs(json.loads(df.to_json(orient="records", force_ascii=False)))
+
+    append_history(df[df["youtube_id"].isin(list(details))], collected_at)
+    velocity = compute_engagement_velocity(pd.read_csv(HISTORY_FILE, encoding="utf-8-sig"))
+    velocity.to_csv(VELOCITY_FILE, index=False, encoding="utf-8-sig")
+
+    print(f"✅ {refreshed}개 행 갱신 완료 (쿼터 {tracker.run_used} unit 사용)")
+    if not velocity.empty:
+        top = velocity.iloc[0]
+        print(f"🚀 조회수 증가 1위: {top['youtube_id']} (+{top['views_per_hour']:,.0f}회/시간)")
+    return {"videos": refreshed, "quota_used": tracker.run_used, "unfetched": len(unfetched)}
@@ -0,0 +1,184 @@
+import os
+import re
+import json
+from datetime import datetime, timezone, timedelta
+
+import pandas as pd
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TOP10_DIR = os.path.join(os.path.dirname(BASE_DIR), "Top10_Trends", "result", "top10_keyword")
+
+# 유튜브 Data API 호출 종류별 쿼터 비용 (unit)
+QUOTA_COSTS = {"search": 100, "videos": 1}
+DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", 10000))
+QUOTA_STATE_FILE = "youtube_quota_state.json"
+CHECKPOINT_FILE = "youtube_checkpoint.json"
+
+# 쿼터는 태평양 시간 자정에 초기화됨 (서머타임은 무시: 1시간 늦게 초기화된다고 보는 쪽이 안전)
+PACIFIC = timezone(timedelta(hours=-8))
+
+# 뉴스 JSON 카테고리명 -> Top10 결과 파일 라벨
+CATEGORY_LABELS = {
+    "비즈니스 및 금융": "finance",
+    "스포츠": "sports",
+    "엔터테인먼트": "entertainment",
+    "기후": "climate",
+}
+
+
+def quota_day():
+    return datetime.now(PACIFIC).strftime("%Y-%m-%d")
+
+
+def _write_json(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+class QuotaTracker:
+    """
+    호출 종류별 쿼터 사용량을 기록하고, 같은 쿼터 일자 안에서는 실행 간에도 누적합니다.
+    budget: 이번 실행에서 쓸 수 있는 최대 unit (None이면 남은 일일 쿼터 전체)
+    """
+    def __init__(self, daily_quota=DAILY_QUOTA, state_path=QUOTA_STATE_FILE, budget=None):
+        self.daily_quota = daily_quota
+        self.state_path = state_path
+        self.day = quota_day()
+        self.used = 0
+        self.by_call = {kind: 0 for kind in QUOTA_COSTS}
+        self.run_used = 0
+        self.budget = budget
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        # 쿼터 일자가 바뀌었으면 사용량 초기화
+        if state.get("day") == self.day:
+            self.used = state.get("used", 0)
+            self.by_call.update(state.get("by_call", {}))
+
+    def save(self):
+        _write_json(self.state_path, {"day": self.day, "used": self.used, "by_call": self.by_call})
+
+    @property
+    def remaining(self):
+        left = self.daily_quota - self.used
+        if self.budget is not None:
+            left = min(left, self.budget - self.run_used)
+        return max(0, left)
+
+    def can_afford(self, units):
+        return units <= self.remaining
+
+    def spend(self, kind, calls=1):
+        units = QUOTA_COSTS[kind] * calls
+        self.used += units
+        self.run_used += units
+        self.by_call[kind] = self.by_call.get(kind, 0) + calls
+        self.save()
+
+    def mark_exhausted(self):
+        """API가 quotaExceeded(403)를 돌려주면 오늘 남은 쿼터는 없는 것으로 기록"""
+        self.used = max(self.used, self.daily_quota)
+        self.save()
+
+
+def _normalize(text):
+    return re.sub(r'\s+', '', str(text)).lower()
+
+
+def load_keyword_ranks(top10_dir=TOP10_DIR):
+    """
+    Top10 결과 CSV(final_weighted_top10_{label}.csv)의 행 순서로 카테고리별 키워드 순위를 만듭니다.
+    반환: {label: {정규화된 키워드: rank_no}}
+    """
+    ranks = {}
+    for label in CATEGORY_LABELS.values():
+        path = os.path.join(top10_dir, f"final_weighted_top10_{label}.csv")
+        if not os.path.exists(path):
+            continue
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        ranks[label] = {_normalize(title): i for i, title in enumerate(df["rank_title"], start=1)}
+    return ranks
+
+
+def prioritize_keywords(news_data, ranks=None):
+    """
+    뉴스 JSON의 키워드들을 쿼터를 쓸 우선순위대로 정렬합니다.
+    - 카테고리마다 1위 키워드부터 번갈아 배치 (1위 x 4개 카테고리 → 2위 x 4 ...)
+    - Top10 순위에 없는 키워드는 뉴스 JSON 순서대로 맨 뒤
+    반환: [{"key", "category", "keyword", "run_id", "keyword_id", "rank_no"}, ...]
+    """
+    ranks = load_keyword_ranks() if ranks is None else ranks
+    work = []
+    for cat_order, (category, keywords_dict) in enumerate(news_data.items()):
+        label_ranks = ranks.get(CATEGORY_LABELS.get(category), {})
+        for kw_order, (keyword, articles) in enumerate(keywords_dict.items()):
+            if not articles:
+                continue
+            run_id, keyword_id = articles[0]['run_id'], articles[0]['keyword_id']
+            work.append({
+                "key": f"{run_id}:{keyword_id}",
+                "category": category,
+                "keyword": keyword,
+                "run_id": run_id,
+                "keyword_id": keyword_id,
+                "rank_no": label_ranks.get(_normalize(keyword)),
+                "_order": (cat_order, kw_order),
+            })
+
+    work.sort(key=lambda w: (0, w["rank_no"], w["_order"][0]) if w["rank_no"] else (1,) + w["_order"])
+    for w in work:
+        w.pop("_order")
+    return work
+
+
+class Checkpoint:
+    """
+    키워드 하나를 처리할 때마다 진행 상황을 파일에 기록합니다.
+    - searched: {key: [video_id, ...]} 검색이 끝난 키워드
+    - done: [key, ...] 상세 지표까지 받아 스트림(JSONL)에 기록한 키워드
+    모든 키워드가 끝나면 파일을 지우고, 중간에 멈추면 다음 실행(또는 다음 쿼터 일자)에 이어서 진행합니다.
+    """
+    def __init__(self, path=CHECKPOINT_FILE, source=None):
+        self.path = path
+        self.source = source
+        self.searched = {}
+        self.done = []
+        self.resumed = False
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        # 다른 뉴스 파일(다른 run)의 체크포인트는 사용하지 않음
+        if state.get("source") != self.source:
+            return
+        self.searched = state.get("searched", {})
+        self.done = state.get("done", [])
+        self.resumed = bool(self.searched)
+
+    def save(self):
+        _write_json(self.path, {
+            "source": self.source,
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "searched": self.searched,
+            "done": self.done,
+        })
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,181 @@
+# chart_renderer.py
+
+import os
+import json
+import hashlib
+import importlib
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+# ⚠️ 한글 폰트 설정 (윈도우: 'Malgun Gothic', 맥: 'AppleGothic') — 모든 시각화 스크립트 공통
+FONT_FAMILY = os.environ.get("CHART_FONT", "Malgun Gothic")
+
+# 출력 형식 / 해상도 기본값 (웹용은 CHART_FORMAT=webp CHART_DPI=120 처럼 환경 변수나 각 파이프라인의 옵션으로 변경)
+# 파이프라인이 스크립트를 subprocess로 실행해도 환경 변수는 그대로 전달됨
+CHART_FORMATS = ("png", "webp", "svg", "jpg", "pdf")
+MANIFEST_DIR = ".chart_manifest"   # 그림마다 지문 파일 1개 (여러 스크립트가 동시에 렌더링해도 서로 덮어쓰지 않음)
+
+_settings = {
+    "format": os.environ.get("CHART_FORMAT", "png").lower(),
+    "dpi": int(os.environ.get("CHART_DPI", "300")),
+}
+_ready = False
+
+
+def configure(fmt=None, dpi=None):
+    """
+    이후 save_figure의 출력 형식 / DPI 변경 (matplotlib은 import하지 않음).
+    같은 값을 환경 변수에도 넣어 subprocess로 실행하는 스크립트에도 전달합니다.
+    """
+    if fmt:
+        fmt = fmt.lower()
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"지원하지 않는 차트 형식입니다: {fmt} (가능: {', '.join(CHART_FORMATS)})")
+        _settings["format"] = os.environ["CHART_FORMAT"] = fmt
+    if dpi:
+        _settings["dpi"] = int(dpi)
+        os.environ["CHART_DPI"] = str(int(dpi))
+
+
+def setup(fmt=None, dpi=None):
+    """Agg 백엔드(화면 없이 파일로만 그림) + 한글 폰트 설정. 프로세스당 한 번만 실제로 설정합니다."""
+    global _ready
+    configure(fmt, dpi)
+    if _ready:
+        return
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    plt.rcParams["font.family"] = FONT_FAMILY
+    plt.rcParams["axes.unicode_minus"] = False # 마이너스 기호 깨짐 방지
+    _ready = True
+
+
+def settings():
+    """현재 출력 형식 / DPI (예: 증분 실행기의 단계 설정값 — 바뀌면 그래프를 다시 그림)"""
+    return dict(_settings)
+
+
+def output_path(base):
+    """확장자 없는 경로 → 현재 형식의 파일 경로 (예: result/quadrant/quadrant_map_sports.png)"""
+    return f"{base}.{_settings['format']}"
+
+
+def save_figure(base):
+    """현재 figure를 설정된 형식 / DPI로 저장하고 닫습니다. 반환: 저장된 파일 경로"""
+    import matplotlib.pyplot as plt
+    path = output_path(base)
+    plt.savefig(path, dpi=_settings["dpi"], format=_settings["format"])
+    plt.close()
+    return path
+
+
+class ChartJob:
+    """
+    그림 1장 = module.func(*args) 호출 1번 (func는 save_figure(output)로 저장하는 모듈 최상위 함수)
+    output: 확장자 없는 출력 경로 — 변경 없음 판정과 결과 확인에 사용
+    """
+    def __init__(self, module, func, args=(), output=None):
+        self.module = module
+        self.func = func
+        self.args = tuple(args)
+        self.output = output
+
+    def fingerprint(self):
+        """그림 함수 소스 + 입력 데이터 + 형식/DPI 해시 (이 값이 같으면 같은 그림)"""
+        import pandas as pd
+
+        h = hashlib.sha1(f"{self.module}.{self.func}|{_settings['format']}|{_settings['dpi']}".encode("utf-8"))
+        spec = importlib.util.find_spec(self.module)
+        if spec is not None and spec.origin and os.path.exists(spec.origin):
+            with open(spec.origin, "rb") as f:
+                h.update(f.read())
+        for arg in self.args:
+            if isinstance(arg, pd.DataFrame):
+                h.update(repr(list(arg.columns)).encode("utf-8"))
+                h.update(pd.util.hash_pandas_object(arg, index=False).values.tobytes())
+            else:
+                h.update(repr(arg).encode("utf-8"))
+        return h.hexdigest()
+
+
+def _draw(module, func, args):
+    getattr(importlib.import_module(module), func)(*args)
+
+
+def _manifest_file(manifest_dir, path):
+    return os.path.join(manifest_dir, hashlib.sha1(path.encode("utf-8")).hexdigest() + ".json")
+
+
+def _load_fingerprint(manifest_dir, path):
+    try:
+        with open(_manifest_file(manifest_dir, path), "r", encoding="utf-8") as f:
+            return json.load(f).get("fingerprint")
+    except (OSError, ValueError):
+        return None
+
+
+def _store_fingerprint(manifest_dir, path, fp):
+    target = _manifest_file(manifest_dir, path)
+    if fp is None:
+        if os.path.exists(target):
+            os.remove(target)
+        return
+    os.makedirs(manifest_dir, exist_ok=True)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"path": path, "fingerprint": fp}, f, ensure_ascii=False)
+    os.replace(tmp, target)
+
+
+def render(jobs, fmt=None, dpi=None, workers=None, force=False, manifest_dir=MANIFEST_DIR):
+    """
+    차트 작업들을 프로세스 풀에서 나눠 그립니다 (워커마다 setup 한 번 → 폰트/백엔드 설정 재사용).
+    입력 데이터와 그림 코드, 형식/DPI가 지난번과 같고 파일이 있으면 다시 그리지 않습니다 (force=True면 전부).
+    반환: {출력 경로: 'drawn' | 'unchanged' | 'failed'}
+    """
+    setup(fmt, dpi)
+
+    status = {}
+    todo = []
+    for job in jobs:
+        path = output_path(job.output)
+        fp = job.fingerprint()
+        if not force and os.path.exists(path) and _load_fingerprint(manifest_dir, path) == fp:
+            status[path] = "unchanged"
+        else:
+            todo.append((job, path, fp))
+
+    def done(path, fp, error=None):
+        if error is None and os.path.exists(path):
+            status[path] = "drawn"
+            _store_fingerprint(manifest_dir, path, fp)
+        else:
+            status[path] = "failed"
+            _store_fingerprint(manifest_dir, path, None)
+            print(f"❌ 차트 생성 실패: {path} ({error or '파일이 생성되지 않음'})")
+
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    if workers <= 1:
+        for job, path, fp in todo:
+            try:
+                _draw(job.module, job.func, job.args)
+                done(path, fp)
+            except Exception as e:
+                done(path, fp, e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=setup,
+                                 initargs=(_settings["format"], _settings["dpi"])) as executor:
+            futures = [(executor.submit(_draw, job.module, job.func, job.args), path, fp) for job, path, fp in todo]
+            for future, path, fp in futures:
+                try:
+                    future.result()
+                    done(path, fp)
+                except Exception as e:
+                    done(path, fp, e)
+
+    counts = {result: list(status.values()).count(result) for result in ("drawn", "unchanged", "failed")}
+    print(f"🖼️ 차트 {counts['drawn']}개 생성 / {counts['unchanged']}개 변경 없음 / {counts['failed']}개 실패"
+          f" ({_settings['format']}, {_settings['dpi']}dpi, 워커 {max(workers, 1)}개)")
+    return status
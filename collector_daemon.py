@@ -0,0 +1,221 @@
+# collector_daemon.py
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import importlib.util
+import traceback
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import load_config
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+GOOGLE_NAVER_DIR = os.path.join(ROOT_DIR, "google_naver_data")
+YOUTUBE_DIR = os.path.join(ROOT_DIR, "YouTube_depth_analysis")
+NEWS_DIR = os.path.join(ROOT_DIR, "news")
+STATUS_FILE = os.path.join(ROOT_DIR, "collector_status.json")
+TICK_SECONDS = 30   # 스케줄 확인 주기
+
+
+def load_module(name, path):
+    """폴더별 스크립트를 모듈로 불러옵니다. (collect_google_top25_naver.py.py처럼 import 불가능한 파일명 대응)"""
+    module_dir = os.path.dirname(path)
+    if module_dir not in sys.path:
+        sys.path.insert(0, module_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class CollectorDaemon:
+    """
+    수집 작업을 한 프로세스에서 주기적으로 실행하는 상주 데몬.
+    - 구글 트렌드용 headless 드라이버 풀과 네이버 데이터랩 클라이언트를 실행 간에 계속 유지 (브라우저 기동 비용 1회)
+    - 드라이버는 N 페이지 처리 또는 메모리 한도 초과 시 풀에서 재시작
+    - 작업별 마지막 실행 결과를 collector_status.json과 HTTP /status로 노출
+    """
+    def __init__(self, config, jobs=None):
+        self.config = config
+        self.schedule = {name: sec for name, sec in config["DAEMON_SCHEDULE"].items() if name in self.JOBS}
+        if jobs:
+            self.schedule = {name: self.schedule.get(name, 3600) for name in jobs}
+        self.status = {"started_at": self._now(), "jobs": {}}
+        self._status_lock = threading.Lock()
+        self._next_run = {name: 0.0 for name in self.schedule}
+
+        self.google = load_module("collect_google_top25_naver",
+                                  os.path.join(GOOGLE_NAVER_DIR, "collect_google_top25_naver.py.py"))
+        self.youtube = None
+        self.pool = None
+        self.news_http = None
+
+    @staticmethod
+    def _now():
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # -------------------------
+    # 작업
+    # -------------------------
+    def _get_pool(self):
+        if self.pool is None:
+            max_drivers = self.config.get("MAX_BROWSER_DRIVERS", 4)
+            size = max(1, min(max_drivers, len(self.config.get("GOOGLE_TRENDS_CATEGORIES", {}))))
+            self.pool = self.google.DriverPool(
+                size,
+                max_pages=self.config.get("DAEMON_DRIVER_MAX_PAGES"),
+                max_rss_mb=self.config.get("DAEMON_DRIVER_MAX_RSS_MB"),
+            )
+        return self.pool
+
+    def run_google_naver(self):
+        pool = self._get_pool()
+        summary = self.google.get_integrated_analysis_final_ultra(incremental=True, pool=pool)
+        return {
+            "categories": len(summary or {}),
+            "drivers_alive": pool.alive_count,
+            "drivers_recycled": pool.recycled,
+            "datalab": dict(self.google.get_datalab_client().stats),
+        }
+
+    def run_news(self):
+        if NEWS_DIR not in sys.path:
+            sys.path.insert(0, NEWS_DIR)
+        import news_collector
+        if self.news_http is None:
+            # 호스트별 세션을 실행 간에 유지해 keep-alive 연결 재사용 (+ 조건부 요청용 디스크 캐시)
+            self.news_http = news_collector.HostSessions(per_host=self.config.get("NEWS_PER_HOST_LIMIT", 4),
+                                                         cache=news_collector.HttpCache())
+        return news_collector.collect_news(
+            max_workers=self.config.get("NEWS_MAX_WORKERS", 16),
+            http=self.news_http,
+        )
+
+    def run_youtube(self):
+        if self.youtube is None:
+            self.youtube = load_module("collect_youtubedata", os.path.join(YOUTUBE_DIR, "collect_youtubedata.py"))
+        news_file = os.path.join(NEWS_DIR, "daum_news_grouped_by_category_keyword.json")
+        result = self.youtube.collect_all(news_file)
+        if result is None:
+            raise FileNotFoundError(news_file)
+        return result
+
+    def run_youtube_stats(self):
+        if YOUTUBE_DIR not in sys.path:
+            sys.path.insert(0, YOUTUBE_DIR)
+        from refresh_youtube_stats import refresh_stats
+        return refresh_stats(source="csv")
+
+    JOBS = {
+        "google_naver": ("run_google_naver", GOOGLE_NAVER_DIR),
+        "news": ("run_news", NEWS_DIR),
+        "youtube": ("run_youtube", YOUTUBE_DIR),
+        "youtube_stats": ("run_youtube_stats", YOUTUBE_DIR),
+    }
+
+    def run_job(self, name):
+        method_name, workdir = self.JOBS[name]
+        entry = {"last_started_at": self._now()}
+        start = time.monotonic()
+        prev_dir = os.getcwd()
+        print(f"\n⏰ [{name}] 수집 시작 ({entry['last_started_at']})")
+        try:
+            # 각 스크립트는 자기 폴더 기준 상대 경로로 파일을 읽고 쓰므로 작업 폴더로 이동
+            os.chdir(workdir)
+            entry["result"] = getattr(self, method_name)()
+            entry["ok"] = True
+        except Exception as e:
+            entry["ok"] = False
+            entry["error"] = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+        finally:
+            os.chdir(prev_dir)
+        entry["elapsed_sec"] = round(time.monotonic() - start, 1)
+        entry["last_finished_at"] = self._now()
+        print(f"{'✅' if entry['ok'] else '❌'} [{name}] 종료 ({entry['elapsed_sec']}초)")
+        self._update_status(name, entry)
+
+    # -------------------------
+    # 상태 노출
+    # -------------------------
+    def _update_status(self, name, entry):
+        with self._status_lock:
+            self.status["jobs"][name] = entry
+            self.status["updated_at"] = self._now()
+            with open(STATUS_FILE, "w", encoding="utf-8") as f:
+                json.dump(self.status, f, ensure_ascii=False, indent=4)
+
+    def status_json(self):
+        with self._status_lock:
+            snapshot = dict(self.status)
+            snapshot["next_run_in_sec"] = {
+                name: max(0, round(t - time.monotonic())) for name, t in self._next_run.items()
+            }
+            return json.dumps(snapshot, ensure_ascii=False, indent=4)
+
+    def start_status_server(self, port):
+        daemon = self
+
+        class StatusHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/status"):
+                    self.send_error(404)
+                    return
+                body = daemon.status_json().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", port), StatusHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"🌐 상태 확인: http://127.0.0.1:{port}/status")
+        return server
+
+    # -------------------------
+    # 스케줄 루프
+    # -------------------------
+    def run_forever(self, once=False):
+        try:
+            while True:
+                for name, interval in self.schedule.items():
+                    if time.monotonic() >= self._next_run[name]:
+                        self.run_job(name)
+                        self._next_run[name] = time.monotonic() + interval
+                if once:
+                    break
+                time.sleep(TICK_SECONDS)
+        except KeyboardInterrupt:
+            print("\n🛑 데몬을 종료합니다.")
+        finally:
+            if self.pool is not None:
+                self.pool.close_all()
+            if self.news_http is not None:
+                self.news_http.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Peak-Time 상주 수집 데몬 (드라이버/세션 재사용 + 주기 실행)")
+    parser.add_argument("--once", action="store_true", help="모든 작업을 한 번씩만 실행하고 종료")
+    parser.add_argument("--jobs", nargs="+", default=None, help="실행할 작업 (기본: config.DAEMON_SCHEDULE 전체)")
+    parser.add_argument("--port", type=int, default=None, help="상태 HTTP 포트 (기본: config.DAEMON_STATUS_PORT)")
+    args = parser.parse_args()
+
+    config = load_config()
+    unknown = [name for name in (args.jobs or []) if name not in CollectorDaemon.JOBS]
+    if unknown:
+        parser.error(f"알 수 없는 작업: {', '.join(unknown)} (가능: {', '.join(CollectorDaemon.JOBS)})")
+
+    daemon = CollectorDaemon(config, jobs=args.jobs)
+    port = args.port or config.get("DAEMON_STATUS_PORT")
+    if port and not args.once:
+        daemon.start_status_server(port)
+    daemon.run_forever(once=args.once)
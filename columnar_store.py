@@ -0,0 +1,54 @@
+# columnar_store.py
+
+import os
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+# 단계 사이 중간 데이터 저장소: Arrow IPC 파일 (압축 없음 → 메모리 맵으로 열면 복사 없이 바로 사용)
+# - 스키마(dtype)를 명시해서 CSV/JSON처럼 읽을 때마다 타입을 추론·파싱하지 않음
+# - columns로 필요한 컬럼만 꺼내면 나머지 컬럼(예: 누적되는 일별 시계열)은 디스크에서 읽지도 않음
+# - 사람이 보는 CSV / JSON은 각 단계가 예전처럼 따로 내보냄
+ARROW_EXT = ".arrow"
+BATCH_ROWS = 65_536   # 레코드 배치 크기 (스트리밍 모드에서 배치 단위로 읽음)
+
+DAILY_RATIO_TYPE = pa.list_(pa.struct([("period", pa.string()), ("ratio", pa.float64())]))
+
+
+def arrow_path(path):
+    """'data/preprocessed_sports.json' / '.csv' → 'data/preprocessed_sports.arrow'"""
+    return os.path.splitext(path)[0] + ARROW_EXT
+
+
+def write_frame(df, path, schema, batch_rows=BATCH_ROWS):
+    """DataFrame을 스키마의 컬럼 / 타입 그대로 Arrow IPC 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    table = pa.Table.from_pandas(df[schema.names], schema=schema, preserve_index=False)
+    tmp = path + ".tmp"
+    with pa.OSFile(tmp, "wb") as sink:
+        with ipc.new_file(sink, schema) as writer:
+            writer.write_table(table, max_chunksize=batch_rows)
+    os.replace(tmp, path)
+    return path
+
+
+def read_table(path, columns=None):
+    """메모리 맵으로 연 pyarrow.Table (columns만 선택, 버퍼는 파일 매핑을 그대로 참조)"""
+    with pa.memory_map(path, "r") as source:
+        table = ipc.open_file(source).read_all()
+    return table.select(columns) if columns else table
+
+
+def read_frame(path, columns=None):
+    """Arrow IPC 파일 → DataFrame (숫자 컬럼은 블록을 합치지 않아 가능한 한 복사 없이 변환)"""
+    return read_table(path, columns).to_pandas(split_blocks=True)
+
+
+def iter_frames(path, columns=None):
+    """레코드 배치 단위로 DataFrame 조각을 하나씩 (전체를 메모리에 올리지 않는 스트리밍 입력)"""
+    with pa.memory_map(path, "r") as source:
+        reader = ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns:
+                batch = batch.select(columns)
+            yield batch.to_pandas(split_blocks=True)
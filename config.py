@@ -3,9 +3,19 @@
 import os
 from dotenv import load_dotenv
 
-def load_config():
+# Top10 점수 가중치 (Volume 70% / Momentum 30%) — Top10_Trends/scoring.py에서 사용
+# 다른 가중치 후보의 순위 변화(Kendall tau / Top 10 유지율)는 Top10_Trends/weight_search.py로 비교
+METRIC_WEIGHTS = {
+    "google_absolute_volume": 0.35,  # 구글 절대 검색량 (Volume)
+    "google_surge_ratio": 0.15,      # 구글 급상승 비율 (Momentum)
+    "naver_trend_sum": 0.35,         # 네이버 트렌드 합계 (Volume)
+    "naver_growth_slope": 0.15,      # 네이버 성장 기울기 (Momentum)
+}
+
+def load_config(check_keys=True):
     """
     .env 파일에서 환경 변수를 로드하고, 프로젝트 설정을 반환합니다.
+    check_keys=False면 API 키 누락 경고를 생략합니다. (분석 스크립트처럼 키가 필요 없는 곳용)
     """
     load_dotenv()
 
@@ -26,15 +36,45 @@ def load_config():
         "MYSQL_PASSWORD": os.getenv("MYSQL_PASSWORD"),
         "MYSQL_DATABASE": os.getenv("MYSQL_DATABASE"),
         
-        # Peak-Time Index Weights (기획서 기준)
-        "WEIGHT_GOOGLE": 0.4,
-        "WEIGHT_NAVER": 0.6,
+        # Peak-Time Index Weights: 지표별 가중치와 플랫폼 합계 (플랫폼 합계는 지표 가중치에서 계산)
+        "METRIC_WEIGHTS": dict(METRIC_WEIGHTS),
+        "WEIGHT_GOOGLE": round(sum(w for k, w in METRIC_WEIGHTS.items() if k.startswith("google_")), 4),
+        "WEIGHT_NAVER": round(sum(w for k, w in METRIC_WEIGHTS.items() if k.startswith("naver_")), 4),
         
         # Collection Settings
         "CATEGORIES": ["비즈니스·금융", "스포츠", "엔터테인먼트", "기후"],
         "DEFAULT_PERIOD_DAYS": 7,
         "TOP_K_LIMIT": 30,  # 1차 수집 제한
-        "FINAL_TOP_N": 10   # 최종 확정 TOP 10
+        "FINAL_TOP_N": 10,  # 최종 확정 TOP 10
+
+        # Google Trends 수집 대상 (파일 라벨 -> 구글 트렌드 category 번호)
+        "GOOGLE_TRENDS_CATEGORIES": {
+            "finance": 3,
+            "sports": 17,
+            "entertainment": 4,
+            "climate": 20
+        },
+        "MAX_BROWSER_DRIVERS": 4,  # 병렬 수집 시 동시에 띄울 headless 브라우저 상한
+        "GOOGLE_TRENDS_BACKEND": "network",  # network(페이로드 가로채기, 실패 시 DOM 폴백) / dom
+
+        # Naver DataLab API 호출 제한 (일 1,000회 쿼터 기준으로 보수적으로 설정)
+        "NAVER_DATALAB_MAX_WORKERS": 4,   # 동시 요청 수
+        "NAVER_DATALAB_RATE_PER_SEC": 5,  # 초당 요청 수 (토큰 버킷)
+
+        # 상주 수집 데몬 (collector_daemon.py)
+        "DAEMON_SCHEDULE": {              # 작업별 실행 주기 (초)
+            "google_naver": 3600,
+            "news": 3600,                 # 유튜브 수집이 뉴스 JSON의 키워드/ID를 쓰므로 유튜브보다 먼저
+            "youtube": 6 * 3600,
+            "youtube_stats": 3600         # 검색 없이 저장된 영상의 통계만 갱신 (호출당 1 unit)
+        },
+        "DAEMON_DRIVER_MAX_PAGES": 50,    # 드라이버 1개가 이 페이지 수를 넘기면 재시작
+        "DAEMON_DRIVER_MAX_RSS_MB": 1500, # 브라우저 프로세스 메모리가 이 값을 넘기면 재시작
+        "DAEMON_STATUS_PORT": 8765,       # 마지막 실행 상태 HTTP 엔드포인트 (None이면 끔)
+
+        # 뉴스 수집 (news/news_collector)
+        "NEWS_MAX_WORKERS": 16,           # 키워드 x 소스 전체 동시 요청 수
+        "NEWS_PER_HOST_LIMIT": 4          # 호스트(검색 페이지/언론사)별 동시 요청 수
     }
 
     # 필수 API 키 확인
@@ -44,7 +84,7 @@ def load_config():
     if not config["YOUTUBE_API_KEY"]:
         missing_keys.append("YOUTUBE_API_KEY")
         
-    if missing_keys:
+    if check_keys and missing_keys:
         print(f"⚠️ 경고: 다음 설정이 누락되었습니다: {', '.join(missing_keys)}")
         print("네이버 및 유튜브 데이터 수집이 제한될 수 있습니다.")
 
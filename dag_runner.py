@@ -0,0 +1,205 @@
+# dag_runner.py
+
+import os
+import sys
+import json
+import time
+import hashlib
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Step:
+    """
+    파이프라인의 한 단계.
+    inputs / outputs: 이 단계가 읽고 쓰는 파일 경로 (실행 디렉터리 기준)
+    lock: 같은 이름의 lock을 가진 단계끼리는 동시에 실행하지 않음 (예: 전역 상태를 쓰는 matplotlib.pyplot)
+    params: 파일이 아닌 설정값 (JSON으로 저장 가능한 dict, 예: 그래프 형식 / DPI) — 바뀌면 입력이 같아도 다시 실행
+    """
+    def __init__(self, name, func, inputs, outputs, args=(), lock=None, params=None):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.args = tuple(args)
+        self.lock = lock
+        self.params = dict(params or {})
+
+
+def script_step(script):
+    """모듈 최상단에서 바로 실행되는 스크립트를 단계 함수로 (현재 파이썬으로 subprocess 실행)"""
+    def run():
+        subprocess.run([sys.executable, script], check=True)
+    run.__name__ = script
+    return run
+
+
+class FileHasher:
+    """
+    파일 내용 sha1 계산기. (크기, 수정 시각)이 지난번과 같으면 저장된 해시를 그대로 사용해서
+    변경이 없는 재실행에서는 파일을 다시 읽지 않습니다.
+    """
+    def __init__(self, known=None):
+        self.known = dict(known or {})
+        self._lock = threading.Lock()
+
+    def digest(self, path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        stamp = [st.st_size, st.st_mtime_ns]
+        with self._lock:
+            entry = self.known.get(path)
+        if entry and entry[:2] == stamp:
+            return entry[2]
+
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        with self._lock:
+            self.known[path] = stamp + [h.hexdigest()]
+        return h.hexdigest()
+
+
+class DagRunner:
+    """
+    파일 입출력으로 연결된 단계들을 의존 순서대로 실행하는 증분 실행기.
+    - 단계 B의 입력이 단계 A의 출력이면 A → B 의존 (자동 연결)
+    - 입력 파일 내용 해시와 설정값(params)이 마지막 성공 실행과 같고 출력이 모두 있으면 건너뜀
+    - 의존이 풀린 단계들은 스레드 풀에서 동시에 실행 (카테고리별 가지가 서로 독립)
+    - 실행 상태는 state_path(JSON)에 저장
+    """
+    def __init__(self, state_path=".dag_state.json", max_workers=4):
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.steps = {}
+        self._locks = {}
+
+    def add(self, name, func, inputs, outputs, args=(), lock=None, params=None):
+        self.steps[name] = Step(name, func, inputs, outputs, args, lock, params)
+        return self.steps[name]
+
+    def _load_state(self):
+        if not os.path.exists(self.state_path):
+            return {"steps": {}, "files": {}}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"steps": {}, "files": {}}
+
+    def _save_state(self, state):
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.state_path)
+
+    def _dependencies(self):
+        producers = {}
+        for step in self.steps.values():
+            for path in step.outputs:
+                producers[path] = step.name
+        return {
+            step.name: {producers[path] for path in step.inputs if path in producers and producers[path] != step.name}
+            for step in self.steps.values()
+        }
+
+    def _signature(self, step, hasher):
+        return {path: hasher.digest(path) for path in step.inputs}
+
+    def _run_step(self, step):
+        lock = self._locks.get(step.lock)
+        start = time.time()
+        if lock:
+            with lock:
+                step.func(*step.args)
+        else:
+            step.func(*step.args)
+        missing = [path for path in step.outputs if not os.path.exists(path)]
+        if missing:
+            raise RuntimeError(f"출력 파일이 생성되지 않았습니다: {', '.join(missing)}")
+        return time.time() - start
+
+    def run(self, force=False):
+        """
+        force: 해시와 관계없이 모든 단계 실행
+        반환: {단계 이름: 'ran' | 'skipped' | 'failed' | 'blocked'}
+        """
+        state = self._load_state()
+        hasher = FileHasher(state.get("files"))
+        deps = self._dependencies()
+        for step in self.steps.values():
+            if step.lock:
+                self._locks.setdefault(step.lock, threading.Lock())
+
+        status = {}
+        pending = {name: set(parents) for name, parents in deps.items()}
+        running = {}
+
+        def finish(name, result):
+            status[name] = result
+            for parents in pending.values():
+                parents.discard(name)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                ready = [name for name, parents in pending.items() if not parents]
+                for name in ready:
+                    del pending[name]
+                    step = self.steps[name]
+                    blocked = [p for p in deps[name] if status.get(p) in ("failed", "blocked")]
+                    if blocked:
+                        print(f"⏭️ [{name}] 이전 단계 실패로 건너뜀 ({', '.join(blocked)})")
+                        finish(name, "blocked")
+                        continue
+
+                    signature = self._signature(step, hasher)
+                    last = state["steps"].get(name)
+                    up_to_date = (
+                        last is not None and last.get("inputs") == signature
+                        and last.get("params", {}) == step.params
+                        and None not in signature.values()
+                        and all(os.path.exists(path) for path in step.outputs)
+                    )
+                    if up_to_date and not force:
+                        finish(name, "skipped")
+                        continue
+
+                    print(f"▶️ [{name}] 시작...")
+                    running[executor.submit(self._run_step, step)] = (name, signature)
+
+                if not running:
+                    if pending and not ready:
+                        raise RuntimeError(f"순환 의존이 있습니다: {', '.join(sorted(pending))}")
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name, signature = running.pop(future)
+                    try:
+                        elapsed = future.result()
+                    except Exception as e:
+                        print(f"❌ [{name}] 실패: {e}")
+                        state["steps"].pop(name, None)
+                        finish(name, "failed")
+                        continue
+                    print(f"✅ [{name}] 완료! (소요 시간: {elapsed:.2f}초)")
+                    state["steps"][name] = {"inputs": signature, "params": self.steps[name].params,
+                                            "finished_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+                    finish(name, "ran")
+
+        state["files"] = hasher.known
+        self._save_state(state)
+        return status
+
+
+def summarize(status, elapsed):
+    counts = {}
+    for result in status.values():
+        counts[result] = counts.get(result, 0) + 1
+    print(f"🧮 실행 {counts.get('ran', 0)} / 건너뜀 {counts.get('skipped', 0)} / 실패 {counts.get('failed', 0)}"
+          f" / 중단 {counts.get('blocked', 0)} (총 {elapsed:.2f}초)")
+    return counts.get("failed", 0) == 0 and counts.get("blocked", 0) == 0
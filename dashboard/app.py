@@ -182,6 +182,7 @@ def get_news(run_id: int, keyword_id: int) -> pd.DataFrame:
     FROM news_article
     WHERE run_id = :run_id
       AND keyword_id = :keyword_id
+      AND duplicate_of IS NULL
     ORDER BY article_id DESC
     LIMIT 5
     """
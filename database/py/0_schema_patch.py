@@ -34,7 +34,22 @@ def patch_schema():
         "ALTER TABLE news_article ADD COLUMN IF NOT EXISTS rank_no INT;",
         "ALTER TABLE news_article ADD COLUMN IF NOT EXISTS source VARCHAR(50);",
         "ALTER TABLE youtube_video ADD COLUMN IF NOT EXISTS rank_no INT;",
-        "ALTER TABLE youtube_video ADD COLUMN IF NOT EXISTS url TEXT;"
+        "ALTER TABLE youtube_video ADD COLUMN IF NOT EXISTS url TEXT;",
+        """CREATE TABLE IF NOT EXISTS youtube_video_stats (
+            stat_pk BIGSERIAL PRIMARY KEY,
+            run_id BIGINT,
+            keyword_id BIGINT,
+            youtube_id VARCHAR(50) NOT NULL,
+            view_count BIGINT,
+            like_count BIGINT,
+            comment_count BIGINT,
+            collected_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+        );""",
+        "CREATE INDEX IF NOT EXISTS idx_youtube_video_stats_vid ON youtube_video_stats (youtube_id, collected_at);",
+        "ALTER TABLE news_article ADD COLUMN IF NOT EXISTS canonical_url TEXT;",
+        "ALTER TABLE news_article ADD COLUMN IF NOT EXISTS title_simhash BIGINT;",
+        "ALTER TABLE news_article ADD COLUMN IF NOT EXISTS duplicate_of BIGINT REFERENCES news_article(article_id) ON DELETE CASCADE;",
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_news_article_canonical ON news_article (run_id, keyword_id, canonical_url);"
     ]
 
     for query in patches:
@@ -1,10 +1,15 @@
 # database/py/1_ingest_top10.py
 import os
+import sys
 import pandas as pd
 import psycopg2
 from dotenv import load_dotenv
 from datetime import datetime
 
+# ✅ 프로젝트 루트의 columnar_store.py 사용 (분석 단계가 CSV와 함께 저장하는 .arrow 결과)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from columnar_store import arrow_path, read_frame
+
 # ✅ .env 로드 (프로젝트 루트에 .env 있어야 함)
 load_dotenv()
 
@@ -36,6 +41,18 @@ def read_csv_safe(path: str) -> pd.DataFrame:
         return pd.read_csv(path, encoding="cp949")
 
 
+def read_table_safe(path: str, columns=None) -> pd.DataFrame:
+    """
+    ✅ CSV 경로를 받아 같은 이름의 .arrow가 있으면 그걸 우선 읽는다.
+    - 스키마가 고정돼 있어 인코딩/타입 추론 없이 필요한 컬럼만 로드
+    - .arrow가 없으면(예전 결과물) read_csv_safe로 CSV를 읽음
+    """
+    if os.path.exists(arrow_path(path)):
+        return read_frame(arrow_path(path), columns)
+    df = read_csv_safe(path)
+    return df[columns] if columns else df
+
+
 def get_db_url() -> str:
     """
     ✅ Railway(Postgres) 연결 URL을 안전하게 가져온다.
@@ -109,29 +126,31 @@ def ingest_top10():
         main_f = f"Top10_Trends/result/final_weighted_top10_{file_code}.csv"
         print("📁 main_f:", main_f)
 
-        if not os.path.exists(main_f):
+        if not (os.path.exists(main_f) or os.path.exists(arrow_path(main_f))):
             print(f"⚠️ 파일 없음: {main_f}")
             continue
 
-        df = read_csv_safe(main_f)
+        df = read_table_safe(
+            main_f, ["rank_title", "total_score", "google_absolute_volume", "naver_trend_sum"]
+        )
 
         # Supplemental data
         f_a = f"Top10_Trends/result/analyzed_top10_{file_code}.csv"
-        if os.path.exists(f_a):
+        if os.path.exists(f_a) or os.path.exists(arrow_path(f_a)):
             df = df.merge(
-                read_csv_safe(f_a)[
-                    ["rank_title", "trend_type", "google_ratio(%)", "naver_ratio(%)"]
-                ],
+                read_table_safe(
+                    f_a, ["rank_title", "trend_type", "google_ratio(%)", "naver_ratio(%)"]
+                ),
                 on="rank_title",
                 how="left",
             )
 
         f_q = f"Top10_Trends/result/quadrant/positioning_map_{file_code}.csv"
-        if os.path.exists(f_q):
+        if os.path.exists(f_q) or os.path.exists(arrow_path(f_q)):
             df = df.merge(
-                read_csv_safe(f_q)[
-                    ["rank_title", "positioning", "volume_score", "momentum_score"]
-                ],
+                read_table_safe(
+                    f_q, ["rank_title", "positioning", "volume_score", "momentum_score"]
+                ),
                 on="rank_title",
                 how="left",
             )
@@ -1,13 +1,27 @@
 # database/py/2_ingest_news.py
 import os
+import sys
 import json
 import psycopg2
 import re
 
+# news/news_collector 의 URL 정규화 + 중복 판정 인덱스 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "news"))
+from news_collector.dedup import DedupIndex, dedup_articles, to_signed64
+
 def normalize(text):
     if not text: return ""
     return re.sub(r'\s+', '', str(text)).lower()
 
+def load_existing_index(cursor, run_id, k_id):
+    """이미 적재된 대표 기사로 인덱스를 채워 재적재 시에도 같은 기사가 다시 들어가지 않게 합니다."""
+    index = DedupIndex()
+    cursor.execute("SELECT article_id, canonical_url, title_simhash FROM news_article WHERE run_id = %s AND keyword_id = %s AND duplicate_of IS NULL",
+                   (run_id, k_id))
+    for article_id, canonical_url, simhash in cursor.fetchall():
+        index.register(("db", article_id), canonical_url, simhash % (1 << 64) if simhash is not None else None)
+    return index
+
 def ingest_news():
     url = os.environ.get('DATABASE_URL')
     conn = psycopg2.connect(url)
@@ -23,30 +37,63 @@ def ingest_news():
         'google': 'news/google_news_grouped_by_category_keyword.json'
     }
     cat_map = {'sports': '스포츠', 'climate': '기후', 'entertainment': '연예/문화', 'finance_business': '금융/비즈니스'}
-    
-    stats = {}
-    for source, f_path in news_files.items():
+
+    # 1) 소스 3개를 키워드 단위로 모음 (같은 통신사 기사가 소스마다 따로 들어오므로 키워드 안에서 중복 제거)
+    candidates = {}
+    for source_order, (source, f_path) in enumerate(news_files.items()):
         if not os.path.exists(f_path): continue
         with open(f_path, 'r', encoding='utf-8') as f: data = json.load(f)
-        
+
         for code, cat_name in cat_map.items():
             if cat_name not in data: continue
-            cursor.execute("SELECT run_id FROM collection_run cr JOIN category c ON cr.category_id = c.category_id WHERE c.code = %s ORDER BY cr.created_at DESC LIMIT 1", (code,))
-            run_id = cursor.fetchone()[0]
-            
             for k_text, articles in data[cat_name].items():
                 norm_k = normalize(k_text)
                 if norm_k not in kv_map:
                     print(f"⚠️ [매핑 실패] {code}: {k_text} - Top10 DB에 없음")
                     continue
-                k_id = kv_map[norm_k]
+                # google JSON은 키워드 값이 {total_count, articles} 구조
+                if isinstance(articles, dict):
+                    articles = articles.get('articles', [])
                 for i, art in enumerate(articles[:3]):
-                    cursor.execute("INSERT INTO news_article (run_id, keyword_id, title, url, publisher, published_at, source, rank_no) VALUES (%s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING",
-                                 (run_id, k_id, art['title'], art['url'], art.get('publisher'), art.get('published_at'), source, i+1))
-                    stats[code] = stats.get(code, 0) + 1
+                    candidates.setdefault((code, kv_map[norm_k]), []).append(
+                        dict(art, source=source, rank_no=i + 1, source_order=source_order))
+
+    # 2) 키워드별로 대표 기사만 저장, 중복은 duplicate_of 참조 row로만 기록
+    run_ids = {}
+    stats = {}
+    dup_total = 0
+    for (code, k_id), articles in candidates.items():
+        if code not in run_ids:
+            cursor.execute("SELECT run_id FROM collection_run cr JOIN category c ON cr.category_id = c.category_id WHERE c.code = %s ORDER BY cr.created_at DESC LIMIT 1", (code,))
+            run_ids[code] = cursor.fetchone()[0]
+        run_id = run_ids[code]
+
+        keep, duplicates = dedup_articles(articles, load_existing_index(cursor, run_id, k_id))
+
+        new_ids = {}
+        for idx, art in enumerate(keep):
+            cursor.execute("INSERT INTO news_article (run_id, keyword_id, title, url, publisher, published_at, image_url, source, rank_no, canonical_url, title_simhash) "
+                           "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING RETURNING article_id",
+                           (run_id, k_id, art['title'], art['url'], art.get('publisher'), art.get('published_at') or None, art.get('image_url'),
+                            art['source'], art['rank_no'], art['canonical_url'], to_signed64(art['title_simhash'])))
+            row = cursor.fetchone()
+            if row:
+                new_ids[("new", idx)] = row[0]
+                stats[code] = stats.get(code, 0) + 1
+
+        for art, dup_of in duplicates:
+            best_id = dup_of[1] if dup_of[0] == "db" else new_ids.get(dup_of)
+            if best_id is None: continue
+            # 참조 row는 제목/링크/출처만 (언론사·이미지 등은 대표 기사에서 사용)
+            cursor.execute("INSERT INTO news_article (run_id, keyword_id, title, url, source, rank_no, canonical_url, title_simhash, duplicate_of) "
+                           "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT DO NOTHING",
+                           (run_id, k_id, art['title'], art['url'], art['source'], art['rank_no'],
+                            art['canonical_url'], to_signed64(art['title_simhash']), best_id))
+            dup_total += cursor.rowcount
     conn.commit()
     cursor.close()
     conn.close()
+    print(f"🧹 중복 기사 {dup_total}건은 대표 기사 참조(duplicate_of)로만 기록 (URL이 완전히 같은 기사는 생략)")
     return stats
 
 if __name__ == "__main__":
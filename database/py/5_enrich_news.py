@@ -0,0 +1,55 @@
+# database/py/5_enrich_news.py
+import os
+import sys
+import psycopg2
+from psycopg2.extras import execute_values
+
+# news/news_collector 의 <head> 스트리밍 메타 보강 단계 사용
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "news"))
+from news_collector import HostSessions, HttpCache, enrich_items
+
+def enrich_news(max_workers=16, per_host=4, limit=5000):
+    """
+    news_article 대표 기사 중 언론사/발행일/이미지가 비어 있는 row만 골라 원문 <head>를 병렬로 받아 채우고,
+    결과를 UPDATE ... FROM (VALUES ...) 한 번으로 되돌려 씁니다. (비어 있는 컬럼만 채움)
+    """
+    url = os.environ.get('DATABASE_URL')
+    conn = psycopg2.connect(url)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT article_id, source, url, publisher, published_at, image_url FROM news_article "
+                   "WHERE duplicate_of IS NULL AND url IS NOT NULL AND (publisher IS NULL OR published_at IS NULL OR image_url IS NULL) "
+                   "ORDER BY article_id DESC LIMIT %s", (limit,))
+    rows = []
+    for article_id, source, a_url, publisher, published_at, image_url in cursor.fetchall():
+        rows.append((source or "other", {"article_id": article_id, "url": a_url, "publisher": publisher,
+                                         "published_at": published_at, "image_url": image_url}))
+
+    http = HostSessions(per_host=per_host, cache=HttpCache())
+    try:
+        stats = enrich_items(rows, http, max_workers=max_workers)
+    finally:
+        http.close()
+
+    # published_at은 타임존 없는 KST 'YYYY-MM-DD HH:MM' → ::timestamptz가 세션 타임존(UTC)으로 읽지 않도록 +09:00을 붙임
+    values = [(item["article_id"], item["publisher"] or None,
+               f"{item['published_at']}+09:00" if isinstance(item["published_at"], str) and item["published_at"] else None,
+               item["image_url"] or None)
+              for _, item in rows]
+    execute_values(cursor, """
+        UPDATE news_article AS n SET
+            publisher = COALESCE(n.publisher, v.publisher),
+            published_at = COALESCE(n.published_at, v.published_at::timestamptz),
+            image_url = COALESCE(n.image_url, v.image_url)
+        FROM (VALUES %s) AS v(article_id, publisher, published_at, image_url)
+        WHERE n.article_id = v.article_id
+    """, values, page_size=1000)
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+    print(f"🖼️ 메타 보강: 대상 {len(rows)}건 / 요청 {stats['targets']}건 / 성공 {stats['fetched']}건 / 채운 필드 {stats['filled']}개")
+    return stats
+
+if __name__ == "__main__":
+    enrich_news()
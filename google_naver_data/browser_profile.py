@@ -0,0 +1,140 @@
+import os
+import time
+import psutil
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
+DEFAULT_PROFILE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".chrome_profile")
+
+# 린(lean) 프로필에서 DevTools로 차단할 요청 패턴
+# - 이미지/폰트/미디어: 표 텍스트 수집에 필요 없음
+# - 서드파티 스크립트: 광고/분석 도메인만 차단 (트렌드 앱 자체 JS는 www.gstatic.com에서 오므로 건드리지 않음)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.gstatic.com*", "*fonts.googleapis.com*",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+]
+
+# 크롬 콘텐츠 설정: 2 = 차단
+LEAN_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.media_stream": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_setting_values.geolocation": 2,
+}
+
+
+def build_chrome_options(headless=True, lean=True, user_data_dir=None):
+    """
+    Selenium Chrome 옵션 생성.
+    lean=True: 이미지/미디어 차단 + 불필요한 백그라운드 기능 끄기
+    user_data_dir: 캐시가 데워진 프로필을 실행 간에 재사용 (동시에 같은 폴더를 쓰면 안 되므로 드라이버마다 별도 경로)
+    """
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    # 봇 탐지 방지를 위한 유저 에이전트 설정
+    options.add_argument(f"user-agent={USER_AGENT}")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    # 네트워크 백엔드가 응답 본문을 읽을 수 있도록 DevTools 성능 로그 활성화
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    if lean:
+        options.add_experimental_option("prefs", LEAN_PREFS)
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_argument("--no-first-run")
+        options.add_argument("--disable-dev-shm-usage")
+    if user_data_dir:
+        os.makedirs(user_data_dir, exist_ok=True)
+        options.add_argument(f"--user-data-dir={user_data_dir}")
+    return options
+
+
+def apply_request_blocking(driver):
+    """DevTools Network.setBlockedURLs로 폰트/미디어/광고 스크립트 요청을 차단합니다."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+def create_driver(headless=True, lean=True, profile_dir=None):
+    """옵션 생성 + 요청 차단까지 적용된 Chrome 드라이버를 만듭니다."""
+    driver = webdriver.Chrome(options=build_chrome_options(headless, lean, profile_dir))
+    if lean:
+        apply_request_blocking(driver)
+    return driver
+
+
+def profile_dir_for(index, base_dir=DEFAULT_PROFILE_DIR):
+    """드라이버 번호별 프로필 경로 (예: .chrome_profile/driver-0)"""
+    return os.path.join(base_dir, f"driver-{index}")
+
+
+def browser_rss_mb(driver):
+    """chromedriver 아래의 Chrome 프로세스 트리 전체 RSS 합계 (MB)"""
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+    except (psutil.Error, AttributeError):
+        return None
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except psutil.Error:
+            continue
+    return round(total / (1024 * 1024), 1)
+
+
+def page_load_ms(driver):
+    """Navigation Timing 기준 마지막 페이지 로딩 시간 (ms)"""
+    value = driver.execute_script(
+        "let n = performance.getEntriesByType('navigation')[0];"
+        "return n ? (n.loadEventEnd || n.domContentLoadedEventEnd) : null;"
+    )
+    return round(value, 1) if value else None
+
+
+def measure_page(driver, url):
+    """URL 하나를 열어 로딩 시간과 브라우저 RSS를 측정합니다."""
+    start = time.monotonic()
+    driver.get(url)
+    wall_ms = (time.monotonic() - start) * 1000
+    return {
+        "page_load_ms": page_load_ms(driver) or round(wall_ms, 1),
+        "rss_mb": browser_rss_mb(driver),
+    }
+
+
+def compare_profiles(target_urls):
+    """
+    카테고리별로 기본(full) 프로필과 린(lean) 프로필의 로딩 시간/메모리를 비교합니다.
+    반환: {label: {"full": {...}, "lean": {...}, "saved_ms": .., "saved_rss_mb": ..}}
+    """
+    report = {label: {} for label in target_urls}
+    for mode, lean in (("full", False), ("lean", True)):
+        driver = create_driver(headless=True, lean=lean)
+        try:
+            for label, url in target_urls.items():
+                report[label][mode] = measure_page(driver, url)
+        finally:
+            driver.quit()
+
+    for label, row in report.items():
+        full, lean = row["full"], row["lean"]
+        row["saved_ms"] = round(full["page_load_ms"] - lean["page_load_ms"], 1)
+        if full["rss_mb"] is not None and lean["rss_mb"] is not None:
+            row["saved_rss_mb"] = round(full["rss_mb"] - lean["rss_mb"], 1)
+        print(f"   [{label}] 로딩 {full['page_load_ms']}ms → {lean['page_load_ms']}ms "
+              f"(절감 {row['saved_ms']}ms) / RSS {full['rss_mb']}MB → {lean['rss_mb']}MB")
+    return report
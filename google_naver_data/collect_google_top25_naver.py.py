@@ -1,159 +1,537 @@
 import os
+import sys
 import json
 import time
-import urllib.request
+import queue
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+# 프로젝트 루트의 config.py 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import load_config
+from trends_network_backend import drain_performance_log, capture_trending_payloads, parse_trending_payload
+from naver_datalab_client import NaverDataLabClient
+from naver_incremental import StoredSeries, fetch_incremental
+from browser_profile import create_driver, profile_dir_for, browser_rss_mb, page_load_ms, compare_profiles
 
 # 1. 환경 설정 및 API 키 로드
 load_dotenv()
 NAVER_ID = os.getenv("NAVER_CLIENT_ID")
 NAVER_SECRET = os.getenv("NAVER_CLIENT_SECRET")
 
-def get_integrated_analysis_final_ultra():
-    # 분석 대상 카테고리 (금융, 스포츠, 엔터, 기후)
-    target_urls = {
-        'finance': 'https://trends.google.co.kr/trending?geo=KR&hl=ko&hours=168&category=3',
-        'sports': 'https://trends.google.co.kr/trending?geo=KR&hl=ko&hours=168&category=17',
-        'entertainment': 'https://trends.google.co.kr/trending?geo=KR&hl=ko&hours=168&category=4',
-        'climate': 'https://trends.google.co.kr/trending?geo=KR&hl=ko&hours=168&category=20'
-    }
-    
-    options = Options()
-    options.add_argument("--window-size=1920,1080")
-    # 봇 탐지 방지를 위한 유저 에이전트 설정
-    options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    
-    driver = webdriver.Chrome(options=options)
-    summary_report = {}
+# 대기 전략 설정 (고정 sleep 대신 "표가 그려지고 더 이상 변하지 않을 때"까지만 대기)
+PAGE_READY_TIMEOUT = 20      # 첫 렌더링 하드 타임아웃 (초)
+SCROLL_SETTLE_TIMEOUT = 4    # 스크롤 후 추가 행 로딩 대기 상한 (초)
+POLL_INTERVAL = 0.3          # 표 상태 확인 주기 (초)
+STABLE_POLLS = 2             # 연속으로 같은 상태가 관측되어야 하는 횟수
+WAIT_LOG_FILE = 'collection_wait_log.json'
 
-    # [핵심] 클래스명 대신 태그 구조(tr > td)로 접근하는 범용 스크립트
-    # innerText와 textContent를 모두 활용해 로딩 지연 데이터를 강제 추출합니다.
-    precision_scan_script = r"""
-    let snapshot = [];
-    let rows = document.querySelectorAll('tr');
-    
-    rows.forEach(row => {
-        let cells = row.querySelectorAll('td');
-        // 구글 트렌드 표 구조상 칸이 3개 이상인 곳에 데이터가 있습니다.
-        if(cells.length >= 3) {
-            // 2번째 칸(index 1) = 키워드, 3번째 칸(index 2) = 검색량
-            let titleText = (cells[1].innerText || cells[1].textContent || "").split('\n')[0].trim();
-            let volumeText = (cells[2].innerText || cells[2].textContent || "").trim();
-            
-            if(titleText && titleText.length > 1) {
-                snapshot.push({title: titleText, google_volume: volumeText});
-            }
+_datalab_client = None
+_datalab_client_lock = threading.Lock()
+
+NAVER_START_DATE = "2026-02-18"  # 네이버 일간 추이 수집 시작일
+
+TRENDS_URL_TEMPLATE = 'https://trends.google.co.kr/trending?geo=KR&hl=ko&hours=168&category={category_id}'
+
+# 표 상태 서명: 데이터 행(td 3칸 이상) 개수 + 마지막 행 키워드
+# 행이 하나도 없으면 null을 돌려 "아직 렌더링 전"으로 판단합니다.
+table_signature_script = r"""
+let rows = Array.from(document.querySelectorAll('tr')).filter(r => r.querySelectorAll('td').length >= 3);
+if (rows.length === 0) return null;
+let last = rows[rows.length - 1].querySelectorAll('td')[1];
+let lastTitle = (last.innerText || last.textContent || "").split('\n')[0].trim();
+return rows.length + '|' + lastTitle;
+"""
+
+# 현재 스크롤 위치가 페이지 맨 아래인지 확인
+page_bottom_script = r"""
+return (window.innerHeight + window.scrollY) >= (document.body.scrollHeight - 2);
+"""
+
+# [핵심] 클래스명 대신 태그 구조(tr > td)로 접근하는 범용 스크립트
+# innerText와 textContent를 모두 활용해 로딩 지연 데이터를 강제 추출합니다.
+precision_scan_script = r"""
+let snapshot = [];
+let rows = document.querySelectorAll('tr');
+
+rows.forEach(row => {
+    let cells = row.querySelectorAll('td');
+    // 구글 트렌드 표 구조상 칸이 3개 이상인 곳에 데이터가 있습니다.
+    if(cells.length >= 3) {
+        // 2번째 칸(index 1) = 키워드, 3번째 칸(index 2) = 검색량
+        let titleText = (cells[1].innerText || cells[1].textContent || "").split('\n')[0].trim();
+        let volumeText = (cells[2].innerText || cells[2].textContent || "").trim();
+        
+        if(titleText && titleText.length > 1) {
+            snapshot.push({title: titleText, google_volume: volumeText});
         }
-    });
-    return snapshot;
+    }
+});
+return snapshot;
+"""
+
+
+class TableStable:
+    """
+    WebDriverWait 조건: 표 서명이 STABLE_POLLS번 연속 동일하면 '안정'으로 판단합니다.
+    (행이 아직 없으면 안정으로 보지 않음)
+    """
+    def __init__(self, stable_polls=STABLE_POLLS):
+        self.stable_polls = stable_polls
+        self.last = None
+        self.hits = 0
+
+    def __call__(self, driver):
+        sig = driver.execute_script(table_signature_script)
+        if sig and sig == self.last:
+            self.hits += 1
+        else:
+            self.hits = 0
+        self.last = sig
+        return self.hits >= self.stable_polls
+
+
+def wait_for_table_stable(driver, timeout):
     """
+    추세 표가 렌더링되고 변화가 멈출 때까지 대기합니다.
+    반환: (실제 대기 시간(초), 타임아웃 여부)
+    """
+    start = time.monotonic()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(TableStable())
+        timed_out = False
+    except TimeoutException:
+        timed_out = True
+    return time.monotonic() - start, timed_out
+
 
-    for label, url in target_urls.items():
-        print(f"\n📡 [{label}] 정밀 구조 스캔 프로세스 가동...")
+def scan_category(driver, label, url, reload=True):
+    """
+    카테고리 페이지 하나를 열고 스크롤하며 키워드/검색량을 수집합니다. (DOM 스캐너)
+    reload=False면 이미 열려 있는 페이지를 그대로 스캔합니다. (네트워크 백엔드 실패 시 폴백)
+    반환: (TOP 25 리스트, 대기 시간 로그 dict)
+    """
+    print(f"\n📡 [{label}] 정밀 구조 스캔 프로세스 가동...")
+    if reload:
         driver.get(url)
-        time.sleep(12) # 페이지 및 데이터 로딩 대기
 
-        collected_dict = {} # 중복 제거용 저장소
+    # 페이지 및 데이터 로딩 대기 (표가 안정되는 즉시 반환, 최대 PAGE_READY_TIMEOUT초)
+    initial_wait, initial_timeout = wait_for_table_stable(driver, PAGE_READY_TIMEOUT)
+    if initial_timeout:
+        print(f"   ⏱️ 초기 로딩 타임아웃 ({PAGE_READY_TIMEOUT}초) - 현재 화면 기준으로 스캔을 진행합니다.")
+
+    wait_log = {
+        "backend": "dom",
+        "initial_wait_sec": round(initial_wait, 2),
+        "initial_timeout": initial_timeout,
+        "scroll_wait_sec": 0.0,
+        "scroll_steps": 0,
+        "scroll_timeouts": 0,
+    }
+
+    collected_dict = {} # 중복 제거용 저장소
+    
+    # 촘촘하게 내려가며 화면에 걸리는 모든 것을 낚아챕니다. (최대 25단계 스캔)
+    for step in range(25): 
+        current_snapshot = driver.execute_script(precision_scan_script)
         
-        # 촘촘하게 내려가며 화면에 걸리는 모든 것을 낚아챕니다. (25단계 스캔)
-        for step in range(25): 
-            current_snapshot = driver.execute_script(precision_scan_script)
-            
-            new_finds = 0
-            for item in current_snapshot:
-                title = item['title']
-                # 시간 정보 및 숫자만 있는 노이즈 제거
-                if not title.isdigit() and "시간 전" not in title and "분 전" not in title:
-                    if title not in collected_dict:
-                        collected_dict[title] = item['google_volume']
-                        new_finds += 1
-            
-            # 목표치(35개) 확보 시 조기 종료
-            if len(collected_dict) >= 35:
-                print(f"   > 목표 수량 충분 확보 ({len(collected_dict)}개)")
-                break
-                
-            # 스크롤 단위를 300px로 좁혀서 아주 꼼꼼하게 훑습니다.
-            driver.execute_script("window.scrollBy(0, 300);")
-            time.sleep(2.5) # 구글 서버가 데이터를 채워넣을 충분한 시간 부여
-            
-            if new_finds > 0:
-                print(f"   > {step+1}단계: 누계 {len(collected_dict)}개 (새 키워드 {new_finds}개 포착)")
+        new_finds = 0
+        for item in current_snapshot:
+            title = item['title']
+            # 시간 정보 및 숫자만 있는 노이즈 제거
+            if not title.isdigit() and "시간 전" not in title and "분 전" not in title:
+                if title not in collected_dict:
+                    collected_dict[title] = item['google_volume']
+                    new_finds += 1
+        
+        # 목표치(35개) 확보 시 조기 종료
+        if len(collected_dict) >= 35:
+            print(f"   > 목표 수량 충분 확보 ({len(collected_dict)}개)")
+            break
 
-        # 최종 TOP 25 슬라이싱
-        final_list = [{"title": t, "google_volume": v} for t, v in collected_dict.items()][:25]
+        # 페이지 끝에 도달했고 더 이상 새 키워드가 없으면 스크롤을 반복할 이유가 없습니다.
+        if new_finds == 0 and step > 0 and driver.execute_script(page_bottom_script):
+            print(f"   > 페이지 끝 도달 ({len(collected_dict)}개)")
+            break
+            
+        # 스크롤 단위를 300px로 좁혀서 아주 꼼꼼하게 훑습니다.
+        driver.execute_script("window.scrollBy(0, 300);")
+        # 구글 서버가 데이터를 채워넣을 때까지만 대기 (표가 다시 안정되면 즉시 진행)
+        waited, timed_out = wait_for_table_stable(driver, SCROLL_SETTLE_TIMEOUT)
+        wait_log["scroll_wait_sec"] += waited
+        wait_log["scroll_steps"] += 1
+        wait_log["scroll_timeouts"] += int(timed_out)
         
-        if not final_list:
-            print(f"⚠️ {label}에서 데이터를 가져오지 못했습니다. (페이지 로딩 확인 필요)")
-            continue
+        if new_finds > 0:
+            print(f"   > {step+1}단계: 누계 {len(collected_dict)}개 (새 키워드 {new_finds}개 포착)")
 
-        print(f"✅ {label}: 최종 {len(final_list)}개 키워드 확정")
+    wait_log["scroll_wait_sec"] = round(wait_log["scroll_wait_sec"], 2)
+    wait_log["total_wait_sec"] = round(wait_log["initial_wait_sec"] + wait_log["scroll_wait_sec"], 2)
+    print(f"   ⏱️ [{label}] 대기 시간: 초기 {wait_log['initial_wait_sec']}초 + 스크롤 {wait_log['scroll_wait_sec']}초 "
+          f"({wait_log['scroll_steps']}단계) = 총 {wait_log['total_wait_sec']}초")
 
-        # 2. 네이버 API 연동 및 결과 병합
-        titles = [it['title'] for it in final_list]
-        naver_raw = fetch_naver_data(titles)
+    # 최종 TOP 25 슬라이싱
+    final_list = [{"title": t, "google_volume": v} for t, v in collected_dict.items()][:25]
+    return final_list, wait_log
 
-        final_data_list = []
-        for item in final_list:
-            n_data = next((res['data'] for res in naver_raw if res['title'] == item['title']), [])
-            ratio_sum = round(sum(day['ratio'] for day in n_data), 2)
-            
-            final_data_list.append({
-                "rank_title": item['title'],
-                "google_volume": item['google_volume'],
-                "naver_trend_sum": ratio_sum,
-                "naver_daily_ratio": n_data
-            })
-
-        # 3. 개별 결과 저장
-        save_path = f'trend_report_{label}.json'
-        with open(save_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                "category": label,
-                "base_date": datetime.now().strftime('%Y-%m-%d'),
-                "results": final_data_list
-            }, f, ensure_ascii=False, indent=4)
+def scan_category_network(driver, label, url):
+    """
+    네트워크 가로채기 백엔드: 페이지 1회 로딩 중 DevTools 로그로 받은 JSON 페이로드에서
+    키워드/검색량을 바로 파싱합니다. (스크롤 루프 없음)
+    페이로드를 찾지 못하면 이미 열린 페이지로 DOM 스캐너를 실행합니다.
+    """
+    print(f"\n🛰️ [{label}] 네트워크 페이로드 캡처 중...")
+    drain_performance_log(driver)
+    start = time.monotonic()
+    driver.get(url)
+    bodies = capture_trending_payloads(driver)
+
+    final_list = []
+    for body in bodies:
+        final_list = parse_trending_payload(body)
+        if final_list:
+            break
+    elapsed = round(time.monotonic() - start, 2)
+
+    if final_list:
+        print(f"   ⏱️ [{label}] 페이로드 파싱 완료: {len(final_list)}개 ({elapsed}초)")
+        return final_list, {"backend": "network", "total_wait_sec": elapsed}
+
+    print(f"   ⚠️ [{label}] 페이로드를 찾지 못했습니다 ({elapsed}초). DOM 스캐너로 전환합니다.")
+    final_list, wait_log = scan_category(driver, label, url, reload=False)
+    wait_log["backend"] = "network->dom"
+    wait_log["network_wait_sec"] = elapsed
+    return final_list, wait_log
+
+
+def scan_with_backend(driver, label, url, backend):
+    if backend == "network":
+        final_list, wait_log = scan_category_network(driver, label, url)
+    else:
+        final_list, wait_log = scan_category(driver, label, url)
+    # 프로필(lean/full)별 비용 비교용: 페이지 로딩 시간과 브라우저 메모리
+    wait_log["page_load_ms"] = page_load_ms(driver)
+    wait_log["rss_mb"] = browser_rss_mb(driver)
+    return final_list, wait_log
+
+
+class DriverPool:
+    """
+    headless Chrome 드라이버 풀.
+    최대 max_size개까지만 필요할 때 생성하고, 작업이 끝난 드라이버는 다음 카테고리가 재사용합니다.
+    max_pages / max_rss_mb를 주면 반납 시점에 페이지 수나 메모리가 한도를 넘은 드라이버를 종료하고
+    다음 acquire에서 새로 띄웁니다. (상주 데몬에서 장시간 재사용할 때의 메모리 누수 방지)
+    """
+    def __init__(self, max_size, headless=True, lean=True, max_pages=None, max_rss_mb=None):
+        self.max_size = max_size
+        self.headless = headless
+        self.lean = lean
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle = queue.Queue()
+        self._all = []
+        self._pages = {}        # id(driver) -> 처리한 페이지 수
+        self._slots = {}        # id(driver) -> 프로필 슬롯 번호
+        self._reserved = set()  # 지금 Chrome을 띄우는 중인 프로필 슬롯
+        self._lock = threading.Lock()
+        self.recycled = 0
+
+    @property
+    def alive_count(self):
+        """지금 떠 있는 드라이버 수 (사용 중 + 대기 중, 기동 중인 것은 제외)"""
+        with self._lock:
+            return len(self._all)
+
+    def acquire(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._create_if_room()
+                if driver is None:
+                    # 풀이 가득 찼으면 다른 작업이 드라이버를 반납할 때까지 대기
+                    driver = self._idle.get()
+            # None은 재활용으로 자리가 비었다는 신호 → 다시 생성 시도
+            if driver is not None:
+                return driver
+
+    def _create_if_room(self):
+        # 락 안에서는 자리(슬롯)만 예약하고, 몇 초 걸리는 Chrome 실행은 락 밖에서
+        # (여러 드라이버가 동시에 뜨고, 그동안 반납 / 재활용도 막히지 않도록)
+        with self._lock:
+            if len(self._all) + len(self._reserved) >= self.max_size:
+                return None
+            # 드라이버마다 고정된 프로필 폴더를 써서 다음 실행에서도 데워진 캐시를 재사용
+            slot = min(set(range(self.max_size)) - set(self._slots.values()) - self._reserved)
+            self._reserved.add(slot)
+
+        try:
+            driver = create_driver(self.headless, self.lean, profile_dir_for(slot) if self.lean else None)
+        except Exception:
+            with self._lock:
+                self._reserved.discard(slot)
+            self._idle.put(None)    # 빈 자리를 기다리던 acquire가 다시 생성을 시도하도록
+            raise
+
+        with self._lock:
+            self._reserved.discard(slot)
+            self._all.append(driver)
+            self._pages[id(driver)] = 0
+            self._slots[id(driver)] = slot
+        return driver
+
+    def _should_recycle(self, driver):
+        pages = self._pages.get(id(driver), 0)
+        if self.max_pages and pages >= self.max_pages:
+            return True
+        if self.max_rss_mb:
+            rss = browser_rss_mb(driver)
+            if rss is not None and rss >= self.max_rss_mb:
+                return True
+        return False
+
+    def release(self, driver):
+        self._pages[id(driver)] = self._pages.get(id(driver), 0) + 1
+        if self._should_recycle(driver):
+            self.discard(driver)
+            return
+        self._idle.put(driver)
+
+    def discard(self, driver):
+        """드라이버를 풀에 돌려놓지 않고 종료 (작업 중 에러로 상태를 알 수 없을 때) → 다음 acquire에서 새로 띄움"""
+        with self._lock:
+            self._all.remove(driver)
+            self._pages.pop(id(driver), None)
+            self._slots.pop(id(driver), None)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._idle.put(None)
+
+    def close_all(self):
+        for driver in self._all:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self._all.clear()
+        self._pages.clear()
+        self._slots.clear()
+        self._idle = queue.Queue()
+
+
+def load_target_urls():
+    """config.py의 GOOGLE_TRENDS_CATEGORIES(라벨 -> 구글 카테고리 번호)로 수집 대상 URL을 만듭니다."""
+    category_ids = load_config().get("GOOGLE_TRENDS_CATEGORIES", {})
+    return {label: TRENDS_URL_TEMPLATE.format(category_id=cid) for label, cid in category_ids.items()}
+
+
+def build_category_report(label, final_list, stored_series=None):
+    """
+    구글 TOP 25에 네이버 데이터를 병합하고 trend_report_{label}.json으로 저장합니다.
+    stored_series가 주어지면 저장 이력 이후 날짜만 네이버에 요청합니다. (증분 모드)
+    반환: 요약 리포트 항목 (데이터가 없으면 None)
+    """
+    if not final_list:
+        print(f"⚠️ {label}에서 데이터를 가져오지 못했습니다. (페이지 로딩 확인 필요)")
+        return None
+
+    print(f"✅ {label}: 최종 {len(final_list)}개 키워드 확정")
+
+    # 2. 네이버 API 연동 및 결과 병합
+    titles = [it['title'] for it in final_list]
+    naver_raw, naver_failures = fetch_naver_data(titles, stored_series)
+
+    final_data_list = []
+    for item in final_list:
+        n_data = next((res['data'] for res in naver_raw if res['title'] == item['title']), [])
+        ratio_sum = round(sum(day['ratio'] for day in n_data), 2)
         
-        summary_report[label] = {
-            "total_count": len(final_data_list),
-            "keywords": [x['rank_title'] for x in final_data_list]
-        }
+        final_data_list.append({
+            "rank_title": item['title'],
+            "google_volume": item['google_volume'],
+            "naver_trend_sum": ratio_sum,
+            "naver_daily_ratio": n_data
+        })
+
+    # 3. 개별 결과 저장
+    save_path = f'trend_report_{label}.json'
+    with open(save_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "category": label,
+            "base_date": datetime.now().strftime('%Y-%m-%d'),
+            "results": final_data_list
+        }, f, ensure_ascii=False, indent=4)
+    
+    summary = {
+        "total_count": len(final_data_list),
+        "keywords": [x['rank_title'] for x in final_data_list]
+    }
+    # 네이버 요청이 끝내 실패한 키워드는 요약에 남겨 재수집 대상을 알 수 있게 합니다.
+    if naver_failures:
+        summary["naver_failed_keywords"] = [k for failure in naver_failures for k in failure["keywords"]]
+    return summary
+
+
+def collect_category_with_pool(pool, label, url, backend, stored_series=None):
+    """병렬 모드 작업 단위: 풀에서 드라이버를 빌려 카테고리 하나를 스캔하고 결과를 저장합니다."""
+    driver = pool.acquire()
+    try:
+        final_list, wait_log = scan_with_backend(driver, label, url, backend)
+    except Exception:
+        # 세션이 죽었거나 페이지가 꼬였을 수 있으므로 다음 카테고리에 넘기지 않고 교체
+        pool.discard(driver)
+        raise
+    pool.release(driver)
+    return build_category_report(label, final_list, stored_series), wait_log
+
+
+def get_integrated_analysis_final_ultra(parallel=False, max_drivers=None, backend=None, incremental=False,
+                                        series_source="reports", headless=True, lean=True, pool=None):
+    # 분석 대상 카테고리 (config.py의 GOOGLE_TRENDS_CATEGORIES 기준)
+    target_urls = load_target_urls()
+    # 수집 백엔드: network(페이로드 가로채기, 실패 시 DOM 폴백) / dom(기존 스크롤 스캐너)
+    backend = backend or load_config().get("GOOGLE_TRENDS_BACKEND", "network")
+
+    # 증분 모드: 리포트를 덮어쓰기 전에 저장된 네이버 시계열 조회기를 먼저 만들어 둡니다.
+    stored_series = None
+    if incremental:
+        stored_series = StoredSeries(series_source)
+        print(f"🔁 증분 모드: 저장 이력 기준 = {series_source}")
+
+    summary_report = {}
+    wait_report = {}
+
+    # 외부(상주 데몬)에서 데워진 드라이버 풀을 넘겨주면 그 풀로 병렬 수집하고 종료하지 않습니다.
+    owns_pool = pool is None
+    if pool is not None:
+        parallel = True
+
+    if parallel:
+        # 카테고리들을 동시에 수집 (전체 시간 ≈ 가장 느린 카테고리 1개 시간)
+        if owns_pool:
+            max_drivers = max_drivers or load_config().get("MAX_BROWSER_DRIVERS", 4)
+            pool = DriverPool(max(1, min(max_drivers, len(target_urls))), headless=headless, lean=lean)
+        pool_size = pool.max_size
+        print(f"🚀 병렬 수집 모드: {len(target_urls)}개 카테고리 / {'headless ' if pool.headless else ''}드라이버 {pool_size}개")
+
+        results = {}
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                futures = {
+                    executor.submit(collect_category_with_pool, pool, label, url, backend, stored_series): label
+                    for label, url in target_urls.items()
+                }
+                for future in as_completed(futures):
+                    label = futures[future]
+                    try:
+                        results[label] = future.result()
+                    except Exception as e:
+                        print(f"❌ [{label}] 병렬 수집 중 에러 발생: {e}")
+        finally:
+            if owns_pool:
+                pool.close_all()
+
+        # 요약 리포트는 원래 카테고리 순서대로 기록
+        for label in target_urls:
+            if label not in results:
+                continue
+            summary, wait_log = results[label]
+            wait_report[label] = wait_log
+            if summary:
+                summary_report[label] = summary
+    else:
+        driver = create_driver(headless, lean, profile_dir_for(0) if lean else None)
+        try:
+            for label, url in target_urls.items():
+                final_list, wait_log = scan_with_backend(driver, label, url, backend)
+                wait_report[label] = wait_log
+
+                summary = build_category_report(label, final_list, stored_series)
+                if summary:
+                    summary_report[label] = summary
+        finally:
+            driver.quit()
 
     # 4. 전체 요약 리포트 저장
     with open('collection_summary.json', 'w', encoding='utf-8') as f:
         json.dump(summary_report, f, ensure_ascii=False, indent=4)
     
+    # 5. 카테고리별 대기 시간 로그 저장
+    with open(WAIT_LOG_FILE, 'w', encoding='utf-8') as f:
+        json.dump(wait_report, f, ensure_ascii=False, indent=4)
+
+    if _datalab_client is not None:
+        stats = _datalab_client.stats
+        print(f"\n📊 네이버 데이터랩: API 호출 {stats['api_calls']}회 / 캐시 적중 {stats['cache_hits']}청크 / 실패 {stats['failed_chunks']}청크")
+
     print("\n✨ 분석 완료! 결과는 'trend_report_*.json' 및 'collection_summary.json' 파일에 저장되었습니다.")
-    driver.quit()
-
-def fetch_naver_data(keywords):
-    if not keywords: return []
-    url = "https://openapi.naver.com/v1/datalab/search"
-    results = []
-    for i in range(0, len(keywords), 5):
-        chunk = keywords[i:i+5]
-        body = {
-            "startDate": "2026-02-18",
-            "endDate": datetime.now().strftime('%Y-%m-%d'),
-            "timeUnit": "date",
-            "keywordGroups": [{"groupName": k, "keywords": [k]} for k in chunk]
-        }
-        req = urllib.request.Request(url)
-        req.add_header("X-Naver-Client-Id", NAVER_ID)
-        req.add_header("X-Naver-Client-Secret", NAVER_SECRET)
-        req.add_header("Content-Type", "application/json")
-        try:
-            res = urllib.request.urlopen(req, data=json.dumps(body).encode("utf-8"))
-            results.extend(json.loads(res.read())['results'])
-            time.sleep(0.5)
-        except:
-            pass
-    return results
+    return summary_report
+
+def get_datalab_client():
+    """병렬 수집 스레드들이 같은 레이트 리미터/캐시를 쓰도록 클라이언트를 하나만 만듭니다."""
+    global _datalab_client
+    with _datalab_client_lock:
+        if _datalab_client is None:
+            config = load_config()
+            _datalab_client = NaverDataLabClient(
+                NAVER_ID, NAVER_SECRET,
+                max_workers=config.get("NAVER_DATALAB_MAX_WORKERS", 4),
+                rate_per_sec=config.get("NAVER_DATALAB_RATE_PER_SEC", 5),
+            )
+        return _datalab_client
+
+def fetch_naver_data(keywords, stored_series=None):
+    """
+    네이버 데이터랩 일간 추이 조회.
+    stored_series(StoredSeries)가 있으면 저장 이력 이후의 꼬리 구간만 요청해 병합합니다.
+    반환: (results, failures) - 실패한 5개 단위 청크는 failures에 사유와 함께 담깁니다.
+    """
+    if not keywords: return [], []
+    client = get_datalab_client()
+    end_date = datetime.now().strftime('%Y-%m-%d')
+    if stored_series is not None:
+        stored = stored_series.lookup(keywords)
+        results, failures = fetch_incremental(client, keywords, stored, NAVER_START_DATE, end_date)
+    else:
+        results, failures = client.fetch(keywords, start_date=NAVER_START_DATE, end_date=end_date, time_unit="date")
+    for failure in failures:
+        print(f"   ❌ 네이버 데이터랩 요청 실패: {failure['keywords']} ({failure['error']})")
+    return results, failures
 
 if __name__ == "__main__":
-    get_integrated_analysis_final_ultra()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="구글 트렌드 TOP 25 + 네이버 데이터랩 통합 수집")
+    parser.add_argument("--parallel", action="store_true", help="headless 드라이버 풀로 카테고리를 동시에 수집")
+    parser.add_argument("--max-drivers", type=int, default=None, help="병렬 모드 최대 드라이버 수 (기본: config.MAX_BROWSER_DRIVERS)")
+    parser.add_argument("--backend", choices=["network", "dom"], default=None, help="수집 백엔드 (기본: config.GOOGLE_TRENDS_BACKEND)")
+    parser.add_argument("--incremental", action="store_true", help="저장된 네이버 시계열 이후 날짜만 요청")
+    parser.add_argument("--series-source", choices=["reports", "db"], default="reports", help="증분 모드 저장 이력 위치")
+    parser.add_argument("--headed", action="store_true", help="브라우저 창을 띄워서 실행 (디버깅용)")
+    parser.add_argument("--full-profile", action="store_true", help="이미지/폰트/미디어 차단 없이 기본 프로필로 실행")
+    parser.add_argument("--compare-profiles", action="store_true", help="수집 없이 full vs lean 프로필 로딩 시간/메모리만 비교")
+    args = parser.parse_args()
+
+    if args.compare_profiles:
+        print("🧪 [full vs lean] 카테고리별 페이지 로딩 시간 / 메모리 비교")
+        report = compare_profiles(load_target_urls())
+        with open('profile_comparison.json', 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=4)
+        sys.exit(0)
+
+    get_integrated_analysis_final_ultra(
+        parallel=args.parallel,
+        max_drivers=args.max_drivers,
+        backend=args.backend,
+        incremental=args.incremental,
+        series_source=args.series_source,
+        headless=not args.headed,
+        lean=not args.full_profile,
+    )
\ No newline at end of file
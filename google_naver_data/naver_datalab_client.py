@@ -0,0 +1,147 @@
+import os
+import sys
+import json
+import hashlib
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from rate_limit import TokenBucket, retry_call
+
+API_URL = "https://openapi.naver.com/v1/datalab/search"
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".datalab_cache")
+CHUNK_SIZE = 5  # DataLab은 요청 1회에 keywordGroups 최대 5개
+
+
+def _is_retryable(error):
+    # 429(초과 요청)와 5xx, 네트워크 오류만 재시도 (400/401 등은 재시도해도 같은 결과)
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, (urllib.error.URLError, TimeoutError, ConnectionError))
+
+
+class NaverDataLabClient:
+    """
+    네이버 데이터랩 검색어 트렌드 API 클라이언트.
+    - 동시 요청 수 제한 (max_workers) + 토큰 버킷으로 초당 호출 수 제한
+    - 429/5xx/네트워크 오류는 지터 백오프로 재시도
+    - 응답을 (keyword, startDate, endDate, timeUnit) 키로 디스크에 캐시 → 같은 날 재실행은 API 호출 0회
+    - 실패한 청크는 버리지 않고 failures로 보고
+    """
+    def __init__(self, client_id, client_secret, max_workers=4, rate_per_sec=5.0,
+                 retries=4, timeout=10, cache_dir=DEFAULT_CACHE_DIR):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.max_workers = max_workers
+        self.retries = retries
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        self.bucket = TokenBucket(rate_per_sec)
+        self.stats = {"api_calls": 0, "cache_hits": 0, "failed_chunks": 0}
+        self._stats_lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    # -------------------------
+    # 디스크 캐시
+    # -------------------------
+    def _cache_path(self, keyword, start_date, end_date, time_unit):
+        key = json.dumps([keyword, start_date, end_date, time_unit], ensure_ascii=False)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _load_cached_chunk(self, chunk, start_date, end_date, time_unit):
+        """
+        청크의 모든 키워드가 캐시에 있고, 같은 청크 구성으로 받은 응답일 때만 캐시를 사용합니다.
+        (DataLab ratio는 같은 요청 안의 키워드끼리 상대값이라 구성이 바뀌면 값도 달라집니다)
+        """
+        if not self.cache_dir:
+            return None
+        group = sorted(chunk)
+        cached = []
+        for keyword in chunk:
+            path = self._cache_path(keyword, start_date, end_date, time_unit)
+            if not os.path.exists(path):
+                return None
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                return None
+            if entry.get("group") != group:
+                return None
+            cached.append(entry["result"])
+        return cached
+
+    def _store_chunk(self, chunk, results, start_date, end_date, time_unit):
+        if not self.cache_dir:
+            return
+        group = sorted(chunk)
+        for result in results:
+            path = self._cache_path(result["title"], start_date, end_date, time_unit)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"group": group, "result": result}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    # -------------------------
+    # API 호출
+    # -------------------------
+    def _post(self, body):
+        self.bucket.acquire()
+        with self._stats_lock:
+            self.stats["api_calls"] += 1
+        req = urllib.request.Request(API_URL)
+        req.add_header("X-Naver-Client-Id", self.client_id)
+        req.add_header("X-Naver-Client-Secret", self.client_secret)
+        req.add_header("Content-Type", "application/json")
+        with urllib.request.urlopen(req, data=json.dumps(body).encode("utf-8"), timeout=self.timeout) as res:
+            return json.loads(res.read())["results"]
+
+    def _fetch_chunk(self, chunk, start_date, end_date, time_unit):
+        cached = self._load_cached_chunk(chunk, start_date, end_date, time_unit)
+        if cached is not None:
+            with self._stats_lock:
+                self.stats["cache_hits"] += 1
+            return cached
+
+        body = {
+            "startDate": start_date,
+            "endDate": end_date,
+            "timeUnit": time_unit,
+            "keywordGroups": [{"groupName": k, "keywords": [k]} for k in chunk]
+        }
+        results = retry_call(lambda: self._post(body), retries=self.retries, is_retryable=_is_retryable)
+        self._store_chunk(chunk, results, start_date, end_date, time_unit)
+        return results
+
+    def fetch(self, keywords, start_date, end_date, time_unit="date"):
+        """
+        키워드 목록을 5개씩 나눠 동시에 요청합니다.
+        반환: (results, failures)
+          - results: API 응답의 results 항목 리스트 ({title, keywords, data})
+          - failures: [{"keywords": [...], "error": "..."}] (재시도 후에도 실패한 청크)
+        """
+        if not keywords:
+            return [], []
+
+        chunks = [keywords[i:i + CHUNK_SIZE] for i in range(0, len(keywords), CHUNK_SIZE)]
+        results, failures = [], []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                (chunk, executor.submit(self._fetch_chunk, chunk, start_date, end_date, time_unit))
+                for chunk in chunks
+            ]
+            # 청크 순서대로 결과를 모아 기존 직렬 루프와 같은 순서를 유지
+            for chunk, future in futures:
+                try:
+                    results.extend(future.result())
+                except Exception as e:
+                    failures.append({"keywords": chunk, "error": f"{type(e).__name__}: {e}"})
+
+        with self._stats_lock:
+            self.stats["failed_chunks"] += len(failures)
+        return results, failures
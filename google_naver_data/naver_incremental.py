@@ -0,0 +1,160 @@
+import os
+import glob
+import json
+from collections import defaultdict
+
+# DataLab 응답 ratio 소수점 자릿수 (API 원본과 동일하게 유지)
+RATIO_DIGITS = 5
+
+
+def load_stored_series_from_reports(report_glob='trend_report_*.json'):
+    """
+    이전 실행이 남긴 trend_report_{label}.json들에서 키워드별 네이버 일간 추이를 읽어옵니다.
+    반환: {keyword: {period: ratio}}
+    """
+    stored = {}
+    for path in glob.glob(report_glob):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for item in data.get('results', []):
+            series = item.get('naver_daily_ratio') or []
+            if series:
+                stored[item['rank_title']] = {day['period']: day['ratio'] for day in series}
+    return stored
+
+
+def load_stored_series_from_db(keywords):
+    """
+    DB trend_series(source='naver')에서 키워드별 일간 추이를 읽어옵니다.
+    같은 날짜가 여러 run에 있으면 가장 최근 run의 값을 사용합니다.
+    반환: {keyword: {period: ratio}}
+    """
+    import psycopg2
+
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL이 설정되어 있지 않아 trend_series를 조회할 수 없습니다.")
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+
+    conn = psycopg2.connect(url)
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT DISTINCT ON (k.keyword_text, ts.d) k.keyword_text, ts.d, ts.value
+        FROM trend_series ts
+        JOIN keyword k ON ts.keyword_id = k.keyword_id
+        JOIN collection_run cr ON ts.run_id = cr.run_id
+        WHERE ts.source = 'naver' AND k.keyword_text = ANY(%s)
+        ORDER BY k.keyword_text, ts.d, cr.created_at DESC
+    """, (list(keywords),))
+
+    stored = defaultdict(dict)
+    for keyword_text, d, value in cursor.fetchall():
+        stored[keyword_text][d.strftime('%Y-%m-%d')] = float(value)
+    cursor.close()
+    conn.close()
+    return dict(stored)
+
+
+class StoredSeries:
+    """
+    증분 모드용 저장 이력 조회기.
+    - reports: 생성 시점에 기존 trend_report_*.json을 읽어 둡니다. (새 리포트로 덮어쓰기 전)
+    - db: 카테고리 키워드가 확정될 때마다 trend_series에서 해당 키워드만 조회합니다.
+    """
+    def __init__(self, source="reports"):
+        self.source = source
+        self._reports = load_stored_series_from_reports() if source == "reports" else None
+
+    def lookup(self, keywords):
+        if self.source == "db":
+            return load_stored_series_from_db(keywords)
+        return {k: self._reports[k] for k in keywords if k in self._reports}
+
+
+def plan_incremental_windows(keywords, stored, start_date, end_date):
+    """
+    키워드별로 요청해야 할 구간을 정합니다.
+    - 저장된 마지막 날짜(last)가 있으면 [last, end_date] 구간만 요청 (last = 재기준용 겹침일)
+    - 저장 이력이 없거나 start_date 이전에서 끊겼으면 전체 구간 요청
+    반환: ({window_start: [keyword, ...]}, [이미 최신이라 요청이 필요 없는 keyword])
+    """
+    windows = defaultdict(list)
+    up_to_date = []
+    for keyword in keywords:
+        days = stored.get(keyword) or {}
+        last = max(days) if days else None
+        if last is None or last < start_date:
+            windows[start_date].append(keyword)
+        elif last >= end_date:
+            up_to_date.append(keyword)
+        else:
+            windows[last].append(keyword)
+    return dict(windows), up_to_date
+
+
+def merge_with_anchor(stored_days, new_data, anchor_day, start_date):
+    """
+    새 구간의 ratio를 저장된 시계열 스케일에 맞춰 병합합니다.
+    DataLab ratio는 요청 구간 안에서의 상대값이라 구간마다 스케일이 달라지므로,
+    겹침일(anchor_day)의 저장값 / 새 값 비율로 새 구간 전체를 다시 스케일링합니다.
+    재기준이 불가능하면(겹침일 누락 또는 0) None을 반환합니다.
+    """
+    new_days = {day['period']: day['ratio'] for day in new_data}
+    old_anchor = stored_days.get(anchor_day)
+    new_anchor = new_days.get(anchor_day)
+    if not old_anchor or not new_anchor:
+        return None
+
+    factor = old_anchor / new_anchor
+    merged = {p: r for p, r in stored_days.items() if start_date <= p <= anchor_day}
+    for period, ratio in new_days.items():
+        if period > anchor_day:
+            merged[period] = round(ratio * factor, RATIO_DIGITS)
+    return [{"period": p, "ratio": merged[p]} for p in sorted(merged)]
+
+
+def fetch_incremental(client, keywords, stored, start_date, end_date, time_unit="date"):
+    """
+    저장 이력 이후의 날짜만 요청하고 기존 시계열과 병합합니다.
+    반환 형식은 NaverDataLabClient.fetch와 같습니다: (results, failures)
+    """
+    windows, up_to_date = plan_incremental_windows(keywords, stored, start_date, end_date)
+    merged = {}
+    failures = []
+    needs_full = []
+    tail_count = 0
+
+    # 이미 최신인 키워드는 저장된 시계열을 그대로 사용
+    for keyword in up_to_date:
+        days = stored[keyword]
+        merged[keyword] = [{"period": p, "ratio": days[p]} for p in sorted(days) if start_date <= p <= end_date]
+
+    for window_start, window_keywords in windows.items():
+        if window_start == start_date:
+            needs_full.extend(window_keywords)
+            continue
+
+        results, window_failures = client.fetch(window_keywords, window_start, end_date, time_unit)
+        failures.extend(window_failures)
+        for res in results:
+            series = merge_with_anchor(stored[res['title']], res['data'], window_start, start_date)
+            if series is None:
+                needs_full.append(res['title'])   # 재기준 실패 → 전체 구간 재요청
+            else:
+                merged[res['title']] = series
+                tail_count += 1
+
+    if needs_full:
+        results, full_failures = client.fetch(needs_full, start_date, end_date, time_unit)
+        failures.extend(full_failures)
+        for res in results:
+            merged[res['title']] = res['data']
+
+    print(f"   🔁 증분 조회: 최신 {len(up_to_date)}개 / 꼬리 구간 {tail_count}개 / 전체 구간 {len(needs_full)}개")
+
+    results = [{"title": k, "keywords": [k], "data": merged[k]} for k in keywords if k in merged]
+    return results, failures
@@ -0,0 +1,158 @@
+import json
+import time
+
+# 구글 트렌드 'trending' 페이지가 표를 그리기 위해 호출하는 내부 RPC 엔드포인트
+BATCHEXECUTE_MARKER = '/batchexecute'
+NETWORK_CAPTURE_TIMEOUT = 20   # 페이로드 응답 대기 하드 타임아웃 (초)
+NETWORK_POLL_INTERVAL = 0.3
+
+
+def format_volume_text(volume, increase_pct):
+    """
+    페이로드의 숫자 검색량/상승률을 DOM 표와 같은 문자열로 변환합니다.
+    예) (50000, 1000) -> "5만+\\narrow_upward\\n1,000%"
+    (data_preprocessing.parse_google_data가 그대로 읽을 수 있는 형식)
+    """
+    volume = int(volume or 0)
+    if volume >= 10000:
+        vol_text = f"{volume // 10000}만+"
+    elif volume >= 1000:
+        vol_text = f"{volume // 1000}천+"
+    else:
+        vol_text = f"{volume}+"
+
+    if increase_pct is None:
+        return vol_text
+    return f"{vol_text}\narrow_upward\n{int(increase_pct):,}%"
+
+
+def _is_trend_entry(node):
+    # [키워드, ?, 국가, [시작시각], [종료시각], ?, 검색량, ?, 상승률, [관련 검색어], ...] 형태
+    return (
+        isinstance(node, list)
+        and len(node) >= 9
+        and isinstance(node[0], str)
+        and isinstance(node[6], (int, float))
+        and (node[8] is None or isinstance(node[8], (int, float)))
+    )
+
+
+def _walk_trend_entries(node):
+    if _is_trend_entry(node):
+        yield node
+        return
+    if isinstance(node, list):
+        for child in node:
+            yield from _walk_trend_entries(child)
+
+
+def _iter_envelope_payloads(raw_text):
+    """
+    batchexecute 응답(")]}'" 접두어 + 길이/JSON 줄 반복)에서 wrb.fr 항목의 내부 JSON을 꺼냅니다.
+    """
+    text = raw_text.lstrip()
+    if text.startswith(")]}'"):
+        text = text[4:]
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith('['):
+            continue
+        try:
+            envelope = json.loads(line)
+        except ValueError:
+            continue
+        for item in envelope:
+            if isinstance(item, list) and len(item) >= 3 and item[0] == 'wrb.fr' and isinstance(item[2], str):
+                try:
+                    yield json.loads(item[2])
+                except ValueError:
+                    continue
+
+
+def parse_trending_payload(raw_text, limit=25):
+    """
+    캡처한 페이로드 텍스트에서 [{title, google_volume}] 리스트를 만듭니다.
+    DOM 스캐너(precision_scan_script)와 같은 노이즈 필터/중복 제거 규칙을 적용합니다.
+    """
+    collected_dict = {}
+    for payload in _iter_envelope_payloads(raw_text):
+        for entry in _walk_trend_entries(payload):
+            title = entry[0].split('\n')[0].strip()
+            if len(title) <= 1 or title.isdigit() or "시간 전" in title or "분 전" in title:
+                continue
+            if title not in collected_dict:
+                collected_dict[title] = format_volume_text(entry[6], entry[8])
+
+    return [{"title": t, "google_volume": v} for t, v in collected_dict.items()][:limit]
+
+
+def drain_performance_log(driver):
+    """이전 페이지의 네트워크 로그가 섞이지 않도록 버퍼를 비웁니다."""
+    try:
+        driver.get_log('performance')
+    except Exception:
+        pass
+
+
+def capture_trending_payloads(driver, timeout=NETWORK_CAPTURE_TIMEOUT):
+    """
+    driver.get 직후 호출: DevTools 성능 로그에서 batchexecute 응답 본문을 모아 반환합니다.
+    (Chrome 옵션에 goog:loggingPrefs = {'performance': 'ALL'} 이 설정되어 있어야 합니다)
+    """
+    pending = {}     # requestId -> url (응답 헤더는 왔지만 본문 로딩이 끝나지 않은 요청)
+    bodies = []
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        for entry in driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if BATCHEXECUTE_MARKER in url:
+                    pending[params['requestId']] = url
+            elif method == 'Network.loadingFinished' and params.get('requestId') in pending:
+                request_id = params['requestId']
+                pending.pop(request_id)
+                try:
+                    body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                    bodies.append(body.get('body', ''))
+                except Exception:
+                    continue
+
+        # 키워드가 들어있는 응답을 하나라도 받았다면 바로 종료
+        if any(parse_trending_payload(body, limit=1) for body in bodies):
+            break
+        time.sleep(NETWORK_POLL_INTERVAL)
+
+    return bodies
+
+
+if __name__ == "__main__":
+    # 오프라인 벤치마크: 캡처해 둔 페이로드 파일을 반복 파싱해 소요 시간을 측정합니다.
+    # 예) python trends_network_backend.py fixtures/trending_batchexecute_finance.txt --runs 200
+    import argparse
+
+    parser = argparse.ArgumentParser(description="캡처한 구글 트렌드 페이로드 오프라인 파싱/벤치마크")
+    parser.add_argument("payload_file", help="batchexecute 응답 본문을 저장한 파일")
+    parser.add_argument("--runs", type=int, default=100, help="반복 파싱 횟수")
+    args = parser.parse_args()
+
+    with open(args.payload_file, 'r', encoding='utf-8') as f:
+        raw = f.read()
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        items = parse_trending_payload(raw)
+    elapsed = time.perf_counter() - start
+
+    for rank, item in enumerate(items, start=1):
+        print(f"{rank:>2}. {item['title']} | {item['google_volume'].splitlines()[0]}")
+    print(f"\n⏱️ {len(items)}개 키워드 파싱: 평균 {elapsed / args.runs * 1000:.3f}ms ({args.runs}회)")
+    print("   (DOM 스캐너는 페이지당 최대 25회 스크롤 + 스캔 - 실시간 비교는 collection_wait_log.json 참고)")
@@ -0,0 +1,21 @@
+"""
+뉴스 수집기 (news_scraper.ipynb의 Google RSS / Daum / Naver 스크래퍼를 모듈화)
+
+사용 예)
+    cd news
+    python -m news_collector                    # Top10 결과 키워드로 3개 소스 수집
+    python -m news_collector --sources daum     # 특정 소스만
+    python -m news_collector --no-cache         # HTTP 캐시 없이 전부 새로 받기
+    python -m news_collector.enrich             # 저장된 JSON의 빈 메타(이미지/발행일/언론사)만 보강
+"""
+from .collector import SOURCES, collect_news
+from .common import load_top10_keywords
+from .sessions import HostSessions
+from .cache import HttpCache
+from .dedup import DedupIndex, dedup_articles
+from .enrich import enrich_items, enrich_news_files
+from .urls import canonicalize_url, canonicalize_article_url
+
+__all__ = ["SOURCES", "collect_news", "load_top10_keywords", "HostSessions", "HttpCache",
+           "DedupIndex", "dedup_articles", "enrich_items", "enrich_news_files",
+           "canonicalize_url", "canonicalize_article_url"]
@@ -0,0 +1,16 @@
+import argparse
+
+from .collector import SOURCES, DEFAULT_MAX_WORKERS, DEFAULT_PER_HOST, collect_news
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Top10 키워드 기준 뉴스 수집 (Google RSS / Daum / Naver)")
+    parser.add_argument("--sources", nargs="+", choices=list(SOURCES), default=None, help="수집할 소스 (기본: 전체)")
+    parser.add_argument("--max-workers", type=int, default=DEFAULT_MAX_WORKERS, help="전체 동시 요청 수")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST, help="호스트별 동시 요청 수")
+    parser.add_argument("--no-cache", action="store_true", help="디스크 HTTP 캐시(조건부 요청) 사용 안 함")
+    parser.add_argument("--inline-meta", action="store_true",
+                        help="메타 보강 단계 없이 소스별로 기사 원문을 바로 파싱 (기존 방식)")
+    args = parser.parse_args()
+
+    collect_news(sources=args.sources, max_workers=args.max_workers, per_host=args.per_host,
+                 use_cache=not args.no_cache, enrich=not args.inline_meta)
@@ -0,0 +1,63 @@
+import os
+import json
+import hashlib
+import threading
+from collections import defaultdict
+
+from .common import NEWS_DIR
+
+DEFAULT_CACHE_DIR = os.path.join(NEWS_DIR, ".http_cache")
+
+
+class HttpCache:
+    """
+    뉴스 수집용 디스크 HTTP 캐시.
+    - URL(정규화 키)별로 ETag / Last-Modified / 본문 / 본문 해시 / 파싱 결과를 저장
+    - 다음 요청에 If-None-Match / If-Modified-Since를 붙여 304면 저장된 본문을 사용
+    - 본문 해시가 그대로면 이전 파싱 결과를 재사용 (BeautifulSoup/feedparser 생략)
+    - 소스별 적중률 통계
+    """
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.stats = defaultdict(lambda: {
+            "requests": 0, "not_modified": 0, "unchanged": 0, "parse_skipped": 0, "bytes_saved": 0
+        })
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def load(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key, entry):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def record(self, source, field, amount=1):
+        with self._lock:
+            self.stats[source][field] += amount
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def report(self):
+        """소스별 적중률: (304 응답 + 본문 동일) / 전체 요청"""
+        rows = {}
+        with self._lock:
+            for source, s in self.stats.items():
+                hits = s["not_modified"] + s["unchanged"]
+                rows[source] = dict(s, hit_rate=round(hits / s["requests"], 3) if s["requests"] else 0.0)
+        return rows
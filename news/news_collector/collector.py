@@ -0,0 +1,126 @@
+import os
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import google_rss, daum, naver
+from .common import NEWS_DIR, now_kst, format_hhmm, load_top10_keywords, assign_ids, build_row
+from .sessions import HostSessions
+from .cache import HttpCache
+from .enrich import enrich_items
+
+SOURCES = {
+    google_rss.SOURCE: google_rss,
+    daum.SOURCE: daum,
+    naver.SOURCE: naver,
+}
+DEFAULT_MAX_WORKERS = 16   # 전체 동시 요청 수 (키워드 x 소스)
+DEFAULT_PER_HOST = 4       # 호스트(검색 페이지/언론사)별 동시 요청 수
+
+
+def _collect_one(module, http, keyword, fetch_meta=True):
+    try:
+        return module.collect(http, keyword, fetch_meta=fetch_meta)
+    except Exception:
+        return None
+
+
+def build_grouped(source, categories, results, collected_at):
+    """
+    소스별 결과를 기존 노트북과 같은 JSON 구조로 묶습니다.
+    - google: 카테고리 > 키워드 > { total_count: {google}, articles: [기사row] }
+    - daum / naver: 카테고리 > 키워드 > [기사row]
+    article_id는 카테고리/키워드 순서대로 1부터 매깁니다.
+    """
+    run_id_by_category, keyword_id_by_text = assign_ids(categories)
+    grouped = {}
+    article_id = 1
+    for cat, kws in categories.items():
+        grouped.setdefault(cat, {})
+        run_id = run_id_by_category[cat]
+        for kw in kws:
+            result = results.get(kw)
+            if source == google_rss.SOURCE:
+                news, total_count = result if result else ({}, 0)
+                row = build_row(article_id, run_id, keyword_id_by_text[kw], news, collected_at)
+                # 키워드 레벨에 total_count.google 저장 (기사 row에는 넣지 않음)
+                grouped[cat][kw] = {
+                    "total_count": {"google": int(total_count)},
+                    "articles": [row]
+                }
+            else:
+                row = build_row(article_id, run_id, keyword_id_by_text[kw], result, collected_at)
+                grouped[cat].setdefault(kw, []).append(row)
+            article_id += 1
+    return grouped
+
+
+def collect_news(sources=None, categories=None, out_dir=NEWS_DIR,
+                 max_workers=DEFAULT_MAX_WORKERS, per_host=DEFAULT_PER_HOST, http=None, use_cache=True, enrich=True):
+    """
+    Top10 키워드 x 뉴스 소스(google/daum/naver)를 동시에 수집하고 소스별 JSON으로 저장합니다.
+    http: 실행 간에 재사용할 HostSessions (상주 데몬용, 주지 않으면 이번 실행용으로 만들고 닫음)
+    use_cache: http를 새로 만들 때 디스크 HTTP 캐시(조건부 요청 + 파싱 결과 재사용) 사용 여부
+    enrich: True면 검색 단계에서는 원문을 열지 않고, 모은 기사 URL의 <head>만 병렬로 받아 메타를 일괄 보강
+            (False면 기존처럼 소스 모듈이 기사마다 원문 페이지를 파싱)
+    반환: {source: {"keywords": n, "found": 기사 있는 키워드 수, "file": 경로, "cache": 캐시 통계}}
+    """
+    sources = list(sources or SOURCES)
+    categories = categories or load_top10_keywords()
+    keywords = list(dict.fromkeys(kw for kws in categories.values() for kw in kws))
+    collected_at = format_hhmm(now_kst())
+
+    owns_http = http is None
+    http = http or HostSessions(per_host=per_host, cache=HttpCache() if use_cache else None)
+    if http.cache is not None:
+        http.cache.reset_stats()   # 적중률은 이번 실행 기준으로 집계
+    start = time.perf_counter()
+    print(f"📰 뉴스 수집: 키워드 {len(keywords)}개 x 소스 {len(sources)}개 (동시 {max_workers}, 호스트당 {per_host})")
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                (source, kw): executor.submit(_collect_one, SOURCES[source], http, kw, not enrich)
+                for kw in keywords for source in sources   # 소스를 번갈아 제출해 호스트별 부하 분산
+            }
+            results = {source: {} for source in sources}
+            for (source, kw), future in futures.items():
+                results[source][kw] = future.result()
+
+        if enrich:
+            items = []
+            for source, by_kw in results.items():
+                for result in by_kw.values():
+                    # google은 (news, total_count) 튜플
+                    items.append((source, result[0] if isinstance(result, tuple) else result))
+            stats = enrich_items(items, http, max_workers=max_workers)
+            print(f"   🖼️ 메타 보강: 대상 {stats['targets']}건 / 성공 {stats['fetched']}건 / 채운 필드 {stats['filled']}개")
+    finally:
+        if owns_http:
+            http.close()
+
+    cache_report = http.cache.report() if http.cache is not None else {}
+    report = {}
+    for source in sources:
+        grouped = build_grouped(source, categories, results[source], collected_at)
+        out_file = os.path.join(out_dir, SOURCES[source].OUT_FILE)
+        with open(out_file, "w", encoding="utf-8") as f:
+            json.dump(grouped, f, ensure_ascii=False, indent=4)
+
+        found = 0
+        for kw_map in grouped.values():
+            for value in kw_map.values():
+                rows = value["articles"] if isinstance(value, dict) else value
+                found += any(row["url"] for row in rows)
+        report[source] = {"keywords": len(keywords), "found": found, "file": out_file,
+                          "cache": cache_report.get(source)}
+        print(f"   ✅ [{source}] {found}/{len(keywords)}개 키워드 기사 수집 → {os.path.basename(out_file)}")
+
+        stats = cache_report.get(source)
+        if stats:
+            print(f"      💾 캐시 적중률 {stats['hit_rate']:.1%} (요청 {stats['requests']}, 304 {stats['not_modified']}, "
+                  f"본문 동일 {stats['unchanged']}, 파싱 생략 {stats['parse_skipped']}, "
+                  f"절약 {stats['bytes_saved'] / 1024:.0f}KB)")
+
+    print(f"⏱️ 뉴스 수집 완료: {time.perf_counter() - start:.1f}초")
+    return report
@@ -0,0 +1,163 @@
+import os
+import json
+from datetime import datetime, timezone, timedelta
+
+import pandas as pd
+
+KST = timezone(timedelta(hours=9))
+
+NEWS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOP10_DIR = os.path.join(os.path.dirname(NEWS_DIR), "Top10_Trends", "result", "top10_keyword")
+
+# 뉴스 JSON 카테고리명 -> Top10 결과 파일 라벨 (기존 JSON의 카테고리 순서 유지)
+CATEGORY_LABELS = {
+    "기후": "climate",
+    "엔터테인먼트": "entertainment",
+    "비즈니스 및 금융": "finance",
+    "스포츠": "sports",
+}
+
+# news_article 테이블 컬럼 (기사 row는 이 키만 유지)
+ROW_KEYS = [
+    "article_id", "run_id", "keyword_id",
+    "title", "url", "publisher", "published_at",
+    "image_url", "collected_at"
+]
+
+
+# =========================
+# 시간 전처리 (YYYY-MM-DD HH:MM)
+# =========================
+def format_hhmm(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    dt = dt.astimezone(KST)
+    return dt.strftime("%Y-%m-%d %H:%M")
+
+
+def now_kst():
+    return datetime.now(tz=KST)
+
+
+def abs_url(url: str) -> str:
+    if not url:
+        return ""
+    u = url.strip()
+    if u.startswith("//"):
+        return "https:" + u
+    return u
+
+
+# =========================
+# ld+json 보조
+# =========================
+def parse_ldjson_texts(texts):
+    """
+    ld+json 원문 문자열들에서 publisher/name, datePublished 등을 최대한 추출
+    """
+    publisher = ""
+    date_published = ""
+    try:
+        for txt in texts:
+            txt = (txt or "").strip()
+            if not txt:
+                continue
+            data = json.loads(txt)
+
+            def walk(obj):
+                nonlocal publisher, date_published
+                if isinstance(obj, dict):
+                    for k in ("datePublished", "dateCreated", "dateModified"):
+                        v = obj.get(k)
+                        if not date_published and isinstance(v, str) and v.strip():
+                            date_published = v.strip()
+
+                    pub = obj.get("publisher")
+                    if not publisher:
+                        if isinstance(pub, dict):
+                            name = pub.get("name")
+                            if isinstance(name, str) and name.strip():
+                                publisher = name.strip()
+                        elif isinstance(pub, list):
+                            for it in pub:
+                                if isinstance(it, dict):
+                                    name = it.get("name")
+                                    if isinstance(name, str) and name.strip():
+                                        publisher = name.strip()
+                                        break
+
+                    for v in obj.values():
+                        walk(v)
+
+                elif isinstance(obj, list):
+                    for it in obj:
+                        walk(it)
+
+            walk(data)
+
+            if publisher or date_published:
+                break
+    except Exception:
+        pass
+
+    return publisher, date_published
+
+
+def parse_ldjson(soup):
+    """BeautifulSoup 문서의 ld+json에서 publisher/name, datePublished 추출"""
+    try:
+        texts = [script.get_text(strip=True) for script in soup.select('script[type="application/ld+json"]')]
+    except Exception:
+        return "", ""
+    return parse_ldjson_texts(texts)
+
+
+# =========================
+# 입력: Top10 결과에서 카테고리/키워드
+# =========================
+def load_top10_keywords(top10_dir=TOP10_DIR):
+    """
+    Top10_Trends 결과(final_weighted_top10_{label}.csv)의 순위 순서대로 카테고리별 키워드를 읽어옵니다.
+    반환: {카테고리명: [키워드, ...]}
+    """
+    categories = {}
+    for category, label in CATEGORY_LABELS.items():
+        path = os.path.join(top10_dir, f"final_weighted_top10_{label}.csv")
+        if not os.path.exists(path):
+            print(f"⚠️ Top10 결과 파일이 없습니다: {path}")
+            continue
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        categories[category] = [str(title).strip() for title in df["rank_title"].dropna()]
+    return categories
+
+
+def assign_ids(categories):
+    """
+    임시 ID 매핑 (DB INSERT 전 단계에서 FK 연결용)
+    - run_id: 카테고리별 1개 run (1~4)
+    - keyword_id: 전체 키워드 유니크하게 1..N
+    """
+    run_id_by_category = {cat: idx + 1 for idx, cat in enumerate(categories)}
+    keyword_id_by_text = {}
+    for kws in categories.values():
+        for kw in kws:
+            if kw not in keyword_id_by_text:
+                keyword_id_by_text[kw] = len(keyword_id_by_text) + 1
+    return run_id_by_category, keyword_id_by_text
+
+
+def build_row(article_id, run_id, keyword_id, news, collected_at):
+    """수집 결과(dict 또는 None)를 news_article 컬럼 9키 row로 변환"""
+    news = news or {}
+    row = {
+        "article_id": article_id,
+        "run_id": run_id,
+        "keyword_id": keyword_id,
+        "title": news.get("title") or None,
+        "url": news.get("url") or None,
+        "publisher": news.get("publisher") or None,
+        "published_at": news.get("published_at") or None,   # YYYY-MM-DD HH:MM
+        "image_url": news.get("image_url") or None,
+        "collected_at": collected_at                         # YYYY-MM-DD HH:MM
+    }
+    return {k: row[k] for k in ROW_KEYS}
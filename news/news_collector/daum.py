@@ -0,0 +1,220 @@
+import urllib.parse
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from .common import KST, format_hhmm, abs_url, parse_ldjson
+
+SOURCE = "daum"
+OUT_FILE = "daum_news_grouped_by_category_keyword.json"
+REQ_HEADER = {"Referer": "https://www.daum.net/"}
+
+
+# =========================
+# 유틸
+# =========================
+def first_attr(soup, selectors, attr):
+    if not soup:
+        return ""
+    for sel in selectors:
+        el = soup.select_one(sel)
+        if el and el.get(attr):
+            v = el.get(attr, "").strip()
+            if v:
+                return v
+    return ""
+
+
+def first_text(soup, selectors):
+    if not soup:
+        return ""
+    for sel in selectors:
+        el = soup.select_one(sel)
+        if el:
+            t = el.get_text(" ", strip=True)
+            if t:
+                return t
+    return ""
+
+
+# =========================
+# 시간 전처리: published_at 을 YYYY-MM-DD HH:MM 로
+# =========================
+def to_dt_from_yyyymmddhhmmss(raw: str):
+    digits = "".join(ch for ch in (raw or "") if ch.isdigit())
+    if len(digits) < 12:
+        return None
+    y = int(digits[0:4])
+    mo = int(digits[4:6])
+    d = int(digits[6:8])
+    hh = int(digits[8:10])
+    mm = int(digits[10:12])
+    ss = int(digits[12:14]) if len(digits) >= 14 else 0
+    return datetime(y, mo, d, hh, mm, ss, tzinfo=KST)
+
+
+def normalize_published_to_hhmm(raw: str) -> str:
+    """
+    가능한 경우 'YYYY-MM-DD HH:MM' (KST)로 변환
+    - og:regDate(YYYYMMDDHHMMSS) 처리
+    - ISO 문자열 처리
+    """
+    if not raw:
+        return ""
+
+    s = raw.strip()
+    digits = "".join(ch for ch in s if ch.isdigit())
+
+    # 1) 14자리/12자리 기반
+    if len(digits) >= 12:
+        dt = to_dt_from_yyyymmddhhmmss(digits)
+        return format_hhmm(dt) if dt else ""
+
+    # 2) ISO8601
+    if "T" in s and "-" in s:
+        try:
+            s2 = s.replace("Z", "+00:00")
+            dt = datetime.fromisoformat(s2)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=KST)
+            dt = dt.astimezone(KST)
+            return format_hhmm(dt)
+        except Exception:
+            return ""
+
+    return ""
+
+
+# =========================
+# 기사(또는 v.daum.net 뷰어)에서 메타 추출
+# =========================
+def parse_article_meta(html: str, url: str):
+    """
+    기사(또는 v.daum.net 뷰어) 페이지에서:
+    - publisher
+    - published_at (YYYY-MM-DD HH:MM)
+    - image_url
+    추출
+    """
+    meta = {"publisher": "", "published_at": "", "image_url": ""}
+    soup = BeautifulSoup(html, "html.parser")
+
+    # image_url: og:image 우선
+    og_image = first_attr(soup, ['meta[property="og:image"]', 'meta[name="og:image"]'], "content")
+    meta["image_url"] = abs_url(og_image)
+
+    # published_at 우선순위:
+    # 1) og:regDate (Daum 뷰어에서 매우 자주 14자리)
+    regdate = first_attr(soup, ['meta[property="og:regDate"]'], "content")
+    if regdate:
+        meta["published_at"] = normalize_published_to_hhmm(regdate)
+
+    # 2) article:published_time
+    if not meta["published_at"]:
+        apub = first_attr(
+            soup,
+            [
+                'meta[property="article:published_time"]',
+                'meta[name="article:published_time"]',
+                'meta[property="og:article:published_time"]',
+                'meta[name="pubdate"]',
+                'meta[name="publishdate"]',
+                'meta[name="date"]',
+            ],
+            "content",
+        )
+        meta["published_at"] = normalize_published_to_hhmm(apub)
+
+    # 3) ld+json datePublished
+    ld_publisher, ld_date = parse_ldjson(soup)
+    if not meta["published_at"] and ld_date:
+        meta["published_at"] = normalize_published_to_hhmm(ld_date)
+
+    # publisher 우선순위:
+    # 1) ld+json publisher.name
+    meta["publisher"] = ld_publisher.strip() if ld_publisher else ""
+
+    # 2) og:site_name
+    if not meta["publisher"]:
+        site_name = first_attr(soup, ['meta[property="og:site_name"]', 'meta[name="og:site_name"]'], "content")
+        meta["publisher"] = site_name.strip() if site_name else ""
+
+    # 3) Daum 뷰어 DOM fallback
+    if (not meta["publisher"]) and ("v.daum.net" in url):
+        meta["publisher"] = first_text(
+            soup,
+            [
+                "em.info_cp a",
+                "span.info_cp a",
+                "a.link_cp",
+                "span.txt_cp",
+                "em.txt_cp",
+            ],
+        )
+
+    return meta
+
+
+def fetch_article_meta(http, url: str, timeout=8):
+    """기사 페이지 메타 추출 (본문이 이전 수집과 같으면 캐시된 파싱 결과 사용)"""
+    meta = {"publisher": "", "published_at": "", "image_url": ""}
+
+    if not url:
+        return meta
+
+    try:
+        parsed = http.get_parsed(url, lambda html: parse_article_meta(html, url), headers=REQ_HEADER,
+                                 timeout=timeout, allow_redirects=True, source=SOURCE)
+        return parsed or meta
+    except Exception:
+        return meta
+
+
+# =========================
+# Daum 검색에서 top1 기사 추출
+# =========================
+def collect(http, keyword: str, fetch_meta=True):
+    """
+    다음 검색에서 키워드 1개당 1개 기사:
+    title/url 뽑고,
+    원문 열어서 publisher/published_at/image_url 보강 (fetch_meta=False면 enrich 단계에서 일괄 보강)
+    """
+    encoded_kw = urllib.parse.quote(keyword)
+    search_url = f"https://search.daum.net/search?w=news&q={encoded_kw}"
+
+    empty = {"title": "", "url": "", "publisher": "", "published_at": "", "image_url": ""}
+
+    try:
+        res = http.get(search_url, headers=REQ_HEADER, timeout=8, source=SOURCE)
+        if not res.ok:
+            return empty
+
+        soup = BeautifulSoup(res.text, "html.parser")
+
+        # 제목 링크 후보
+        a_tags = soup.select("div.item-title a")
+        if not a_tags:
+            a_tags = soup.select("a.f_link_b, a.link_tit")
+
+        for a in a_tags:
+            title = a.get_text(strip=True)
+            url = abs_url(a.get("href", ""))
+
+            if not url or url == "#" or len(title) < 5:
+                continue
+
+            # 원문 메타 보강(여기서 image_url/ publisher / published_at)
+            meta = fetch_article_meta(http, url) if fetch_meta else {}
+
+            return {
+                "title": title,
+                "url": url,
+                "publisher": meta.get("publisher", "") or "",
+                "published_at": meta.get("published_at", "") or "",
+                "image_url": meta.get("image_url", "") or ""
+            }
+
+        return empty
+
+    except Exception:
+        return empty
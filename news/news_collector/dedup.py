@@ -0,0 +1,127 @@
+import re
+import hashlib
+
+from .urls import canonicalize_article_url
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3          # 한글 제목은 띄어쓰기가 들쑥날쑥해서 글자 3-gram 사용
+MAX_HAMMING = 3           # 이 이하로 다르면 같은 기사(통신사 기사 재배포 등)로 판단
+BANDS = MAX_HAMMING + 1   # 비둘기집 원리: 해밍거리 3 이하면 4개 밴드 중 최소 1개는 완전히 같음
+BAND_BITS = SIMHASH_BITS // BANDS
+
+# 제목 앞뒤에 붙는 말머리/언론사 표기 ([속보], [단독], "- 뉴시스" 등)
+_TITLE_NOISE = re.compile(r"\[[^\]]*\]|【[^】]*】|\([^)]*\)|\s[-|│]\s[^-|│]+$")
+_NON_WORD = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_title(title):
+    t = _TITLE_NOISE.sub(" ", str(title or "")).lower()
+    return _NON_WORD.sub("", t)
+
+
+def title_simhash(title):
+    """정규화한 제목의 글자 n-gram으로 64비트 SimHash를 만듭니다. 제목이 비면 None."""
+    text = normalize_title(title)
+    if not text:
+        return None
+    if len(text) <= SHINGLE_SIZE:
+        shingles = [text]
+    else:
+        shingles = [text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)]
+
+    weights = [0] * SIMHASH_BITS
+    for sh in shingles:
+        h = int.from_bytes(hashlib.md5(sh.encode("utf-8")).digest()[:8], "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    value = 0
+    for bit, w in enumerate(weights):
+        if w > 0:
+            value |= 1 << bit
+    return value
+
+
+def to_signed64(value):
+    """PostgreSQL BIGINT 저장용 (부호 있는 64비트)"""
+    if value is None:
+        return None
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class DedupIndex:
+    """
+    기사 중복 판정 인덱스.
+    - canonical URL 완전 일치: dict 조회
+    - 제목 SimHash 근사 일치: 64비트를 16비트 밴드 4개로 나눠 밴드별 dict에 등록,
+      같은 밴드 값을 가진 후보만 해밍거리 비교 (기사 수와 무관하게 거의 상수 시간)
+    add()는 중복이면 대표 기사의 ref를, 새 기사면 None을 돌려줍니다.
+    """
+    def __init__(self, max_hamming=MAX_HAMMING):
+        self.max_hamming = max_hamming
+        self._by_url = {}
+        self._bands = [{} for _ in range(BANDS)]
+        self._hashes = {}
+
+    @staticmethod
+    def _band_keys(simhash):
+        mask = (1 << BAND_BITS) - 1
+        return [(simhash >> (i * BAND_BITS)) & mask for i in range(BANDS)]
+
+    def find(self, canonical_url, simhash):
+        if canonical_url and canonical_url in self._by_url:
+            return self._by_url[canonical_url]
+        if simhash is None:
+            return None
+        for band, key in zip(self._bands, self._band_keys(simhash)):
+            for ref in band.get(key, ()):
+                if hamming(simhash, self._hashes[ref]) <= self.max_hamming:
+                    return ref
+        return None
+
+    def register(self, ref, canonical_url, simhash):
+        if canonical_url:
+            self._by_url.setdefault(canonical_url, ref)
+        if simhash is not None:
+            self._hashes[ref] = simhash
+            for band, key in zip(self._bands, self._band_keys(simhash)):
+                band.setdefault(key, []).append(ref)
+
+    def add(self, ref, canonical_url, simhash):
+        dup_of = self.find(canonical_url, simhash)
+        if dup_of is None:
+            self.register(ref, canonical_url, simhash)
+        return dup_of
+
+
+def article_quality(article):
+    """대표 기사 선정 점수: 채워진 메타(언론사/발행일/이미지)가 많을수록, 순위가 높을수록 우선"""
+    filled = sum(1 for k in ("publisher", "published_at", "image_url") if article.get(k))
+    return (-filled, article.get("rank_no") or 0, article.get("source_order") or 0)
+
+
+def dedup_articles(articles, index=None):
+    """
+    같은 키워드로 모인 기사들(여러 소스)을 중복 묶음으로 정리합니다.
+    품질이 좋은 기사부터 인덱스에 넣으므로 묶음마다 가장 좋은 기사가 대표가 됩니다.
+    index: DB에 이미 있는 기사로 미리 채운 DedupIndex (재적재 시 기존 대표 기사를 그대로 사용)
+    반환: (대표 기사 리스트, [(중복 기사, 대표 ref)])  — 기사 dict에 canonical_url/title_simhash 추가
+    """
+    index = index or DedupIndex()
+    keep, duplicates = [], []
+    for art in sorted(articles, key=article_quality):
+        art["canonical_url"] = canonicalize_article_url(art.get("url"))
+        art["title_simhash"] = title_simhash(art.get("title"))
+        if not art["canonical_url"] and art["title_simhash"] is None:
+            continue   # 빈 기사 (수집 실패 row)
+        ref = ("new", len(keep))
+        dup_of = index.add(ref, art["canonical_url"], art["title_simhash"])
+        if dup_of is None:
+            keep.append(art)
+        else:
+            duplicates.append((art, dup_of))
+    return keep, duplicates
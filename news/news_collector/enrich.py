@@ -0,0 +1,301 @@
+import os
+import re
+import json
+import time
+import codecs
+import argparse
+import urllib.parse
+from html.parser import HTMLParser
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from . import daum, naver
+from .common import NEWS_DIR, format_hhmm, parse_ldjson_texts
+from .urls import canonicalize_url
+
+META_FIELDS = ("publisher", "published_at", "image_url")
+ENRICH_TIMEOUT = 6              # 연결/읽기 타임아웃 (초)
+ENRICH_DEADLINE = 10            # 기사 1건 전체 제한 시간 (초)
+MAX_HEAD_BYTES = 256 * 1024     # <head>가 이보다 길면 포기
+
+# 이름 뒤에 구분자까지 와야 매칭 (조각 경계에서 'charset=eu'처럼 잘린 이름을 잡지 않도록)
+_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_\-]+)(?=[\s"';/>])""", re.I)
+_HEADER_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?\s*([A-Za-z0-9_\-]+)""", re.I)
+_HEAD_END_RE = re.compile(rb"</head\s*>|<body[\s>]", re.I)
+
+IMAGE_KEYS = ("og:image", "og:image:url", "twitter:image", "twitter:image:src")
+PUBLISHER_KEYS = ("og:site_name", "article:publisher", "twitter:site")
+PUBLISHED_KEYS = (
+    "og:regdate", "article:published_time", "og:article:published_time",
+    "pubdate", "publishdate", "date", "datepublished",
+)
+
+
+class _HeadDone(Exception):
+    pass
+
+
+class HeadMetaParser(HTMLParser):
+    """
+    <head> 안의 <meta>와 ld+json만 모으는 스트리밍 파서.
+    조각 단위로 feed하다가 </head> 또는 <body>를 만나면 done=True (BeautifulSoup 트리를 만들지 않음)
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta = {}
+        self.ldjson = []
+        self.done = False
+        self._ld_buf = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            raise _HeadDone
+        a = dict(attrs)
+        if tag == "meta":
+            key = (a.get("property") or a.get("name") or a.get("itemprop") or "").strip().lower()
+            content = (a.get("content") or "").strip()
+            if key and content and key not in self.meta:
+                self.meta[key] = content
+        elif tag == "script" and (a.get("type") or "").strip().lower() == "application/ld+json":
+            self._ld_buf = []
+
+    def handle_data(self, data):
+        if self._ld_buf is not None:
+            self._ld_buf.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "script" and self._ld_buf is not None:
+            self.ldjson.append("".join(self._ld_buf))
+            self._ld_buf = None
+        elif tag == "head":
+            raise _HeadDone
+
+    def feed_text(self, text):
+        if self.done:
+            return True
+        try:
+            self.feed(text)
+        except _HeadDone:
+            self.done = True
+        return self.done
+
+
+def normalize_published_at(raw):
+    """og:regDate(14자리) / ISO / '2026.02.25. 13:10' 등을 'YYYY-MM-DD HH:MM'(KST)으로"""
+    if not raw:
+        return ""
+    s = raw.strip()
+
+    # ISO('2026-02-25T00:15:06Z', '+00:00' 등)는 타임존을 살려 KST로 변환
+    # (Daum 파서는 숫자만 읽어 타임존을 버리므로 14자리 og:regDate / 점 구분 형식에만 사용)
+    if "-" in s:
+        try:
+            return format_hhmm(datetime.fromisoformat(s.replace("Z", "+00:00")))
+        except ValueError:
+            pass
+    return daum.normalize_published_to_hhmm(s) or naver.normalize_published(s) or ""
+
+
+def extract_meta(parser, url):
+    meta = parser.meta
+    ld_publisher, ld_date = parse_ldjson_texts(parser.ldjson)
+
+    image = next((meta[k] for k in IMAGE_KEYS if meta.get(k)), "")
+    publisher = next((meta[k] for k in PUBLISHER_KEYS if meta.get(k) and not meta[k].startswith(("http", "@"))), "")
+    published_raw = next((meta[k] for k in PUBLISHED_KEYS if meta.get(k)), "") or ld_date
+
+    return {
+        "publisher": publisher or ld_publisher or "",
+        "published_at": normalize_published_at(published_raw),
+        "image_url": urllib.parse.urljoin(url, image) if image else "",
+    }
+
+
+def _valid_encoding(name):
+    if not name:
+        return None
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return None
+
+
+class _HeadReader:
+    """
+    HostSessions.stream 콜백: 바이트 조각을 디코딩해 HeadMetaParser에 넘기고, head가 끝나면 중단
+    인코딩 우선순위: 응답 Content-Type의 charset → <meta charset> → UTF-8
+    헤더에 charset이 없으면 <meta charset>을 찾거나 </head>에 닿을 때까지 바이트를 모아 두었다가 디코딩 시작
+    (EUC-KR / CP949 페이지를 UTF-8로 잘못 읽어 깨지지 않도록)
+    """
+    def __init__(self, deadline, max_bytes):
+        self.parser = HeadMetaParser()
+        self.deadline = deadline
+        self.max_bytes = max_bytes
+        self.read = 0
+        self._decoder = None
+        self._pending = b""
+
+    def on_response(self, res):
+        m = _HEADER_CHARSET_RE.search(res.headers.get("Content-Type", ""))
+        encoding = _valid_encoding(m.group(1)) if m else None
+        if encoding:
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+
+    def _feed(self, data):
+        return self.parser.feed_text(self._decoder.decode(data))
+
+    def _start_decoding(self, encoding):
+        self._decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        data, self._pending = self._pending, b""
+        return self._feed(data)
+
+    def __call__(self, chunk):
+        self.read += len(chunk)
+        stop = self.read >= self.max_bytes or time.monotonic() > self.deadline
+
+        if self._decoder is not None:
+            done = self._feed(chunk)
+        else:
+            self._pending += chunk
+            m = _CHARSET_RE.search(self._pending)
+            if m:
+                done = self._start_decoding(_valid_encoding(m.group(1).decode("ascii")))
+            elif stop or _HEAD_END_RE.search(self._pending):
+                done = self._start_decoding(None)
+            else:
+                done = False
+        return not (done or stop)
+
+    def finish(self):
+        """head가 끝나기 전에 본문이 끝났으면 모아 둔 바이트를 마저 디코딩"""
+        if self._decoder is None and self._pending:
+            self._start_decoding(None)
+
+
+def fetch_head_meta(http, url, source="other", timeout=ENRICH_TIMEOUT, deadline=ENRICH_DEADLINE, max_bytes=MAX_HEAD_BYTES):
+    """
+    기사 페이지의 <head>만 받아 publisher / published_at / image_url을 추출합니다.
+    HTTP 캐시가 있으면 조건부 요청을 보내고, 304면 지난번 추출 결과를 그대로 사용합니다.
+    실패하면 None.
+    """
+    cache = http.cache
+    key = "head:" + canonicalize_url(url)
+    entry = cache.load(key) if cache is not None else None
+
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    reader = _HeadReader(time.monotonic() + deadline, max_bytes)
+    try:
+        if cache is not None:
+            cache.record(source, "requests")
+        res = http.stream(url, reader, headers=headers, timeout=timeout, allow_redirects=True,
+                          on_response=reader.on_response)
+        reader.finish()
+    except Exception:
+        return None
+
+    if res.status_code == 304 and entry:
+        cache.record(source, "not_modified")
+        return entry["meta"]
+    if not res.ok:
+        return None
+
+    meta = extract_meta(reader.parser, res.url or url)
+    if cache is not None:
+        cache.store(key, {
+            "url": url,
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "meta": meta,
+        })
+    return meta
+
+
+def enrich_items(items, http, max_workers=16):
+    """
+    items: [(source, 기사 dict)] — 기사 dict의 publisher/published_at/image_url 중 빈 값만 채웁니다 (제자리 수정).
+    같은 기사(canonical URL)는 한 번만 요청하고, 호스트별 동시 요청 수는 http(HostSessions)가 제한합니다.
+    반환: {"targets": 보강 대상 URL 수, "fetched": 성공 수, "filled": 채운 필드 수}
+    """
+    targets = {}
+    for source, item in items:
+        if not item or not item.get("url"):
+            continue
+        if all(item.get(k) for k in META_FIELDS):
+            continue
+        key = canonicalize_url(item["url"])
+        targets.setdefault(key, (source, item["url"], []))[2].append(item)
+
+    stats = {"targets": len(targets), "fetched": 0, "filled": 0}
+    if not targets:
+        return stats
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (executor.submit(fetch_head_meta, http, url, source), group)
+            for source, url, group in targets.values()
+        ]
+        for future, group in futures:
+            meta = future.result()
+            if not meta:
+                continue
+            stats["fetched"] += 1
+            for item in group:
+                for k in META_FIELDS:
+                    if not item.get(k) and meta.get(k):
+                        item[k] = meta[k]
+                        stats["filled"] += 1
+    return stats
+
+
+def enrich_news_files(sources=None, out_dir=NEWS_DIR, max_workers=16, per_host=4, use_cache=True):
+    """이미 저장된 소스별 뉴스 JSON의 빈 메타를 보강하고 파일 단위로 한 번에 다시 씁니다."""
+    from .collector import SOURCES
+    from .cache import HttpCache
+    from .sessions import HostSessions
+
+    loaded = {}
+    items = []
+    for source in sources or SOURCES:
+        path = os.path.join(out_dir, SOURCES[source].OUT_FILE)
+        if not os.path.exists(path):
+            print(f"⚠️ 뉴스 파일이 없습니다: {path}")
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            grouped = json.load(f)
+        loaded[path] = grouped
+        for kw_map in grouped.values():
+            for value in kw_map.values():
+                rows = value["articles"] if isinstance(value, dict) else value
+                items.extend((source, row) for row in rows)
+
+    http = HostSessions(per_host=per_host, cache=HttpCache() if use_cache else None)
+    start = time.perf_counter()
+    try:
+        stats = enrich_items(items, http, max_workers=max_workers)
+    finally:
+        http.close()
+
+    for path, grouped in loaded.items():
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(grouped, f, ensure_ascii=False, indent=4)
+    print(f"🖼️ 메타 보강: 대상 {stats['targets']}건 / 성공 {stats['fetched']}건 / 채운 필드 {stats['filled']}개 "
+          f"({time.perf_counter() - start:.1f}초)")
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="저장된 뉴스 JSON의 publisher / published_at / image_url 일괄 보강")
+    parser.add_argument("--sources", nargs="+", default=None, help="보강할 소스 (기본: 전체)")
+    parser.add_argument("--max-workers", type=int, default=16, help="전체 동시 요청 수")
+    parser.add_argument("--per-host", type=int, default=4, help="호스트(언론사)별 동시 요청 수")
+    parser.add_argument("--no-cache", action="store_true", help="디스크 HTTP 캐시 사용 안 함")
+    args = parser.parse_args()
+
+    enrich_news_files(sources=args.sources, max_workers=args.max_workers, per_host=args.per_host,
+                      use_cache=not args.no_cache)
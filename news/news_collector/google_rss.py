@@ -0,0 +1,195 @@
+import re
+import json
+import urllib.parse
+from datetime import datetime
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from .common import KST, format_hhmm, abs_url
+
+SOURCE = "google"
+OUT_FILE = "google_news_grouped_by_category_keyword.json"
+COUNTRY = "KR"
+LANG = "ko"
+REQ_HEADERS = {"Referer": "https://news.google.com/"}
+
+
+# =========================
+# 시간 전처리 (YYYY-MM-DD HH:MM)
+# =========================
+def normalize_published_to_hhmm(raw: str) -> str:
+    if not raw:
+        return ""
+    s = raw.strip()
+
+    # ISO8601
+    if "T" in s and "-" in s:
+        try:
+            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=KST)
+            return format_hhmm(dt.astimezone(KST))
+        except Exception:
+            pass
+
+    # RFC822
+    try:
+        s2 = re.sub(r"\bGMT\b", "+0000", s)
+        dt = datetime.strptime(s2, "%a, %d %b %Y %H:%M:%S %z")
+        return format_hhmm(dt.astimezone(KST))
+    except Exception:
+        pass
+
+    return ""
+
+
+# =========================
+# 원문 링크에서 publisher / og:image 보강
+# =========================
+def parse_publisher_and_image(html: str):
+    out = {"publisher": "", "image_url": ""}
+    soup = BeautifulSoup(html, "html.parser")
+
+    og_img = soup.select_one('meta[property="og:image"]')
+    if og_img and og_img.get("content"):
+        out["image_url"] = abs_url(og_img["content"].strip())
+
+    og_site = soup.select_one('meta[property="og:site_name"]')
+    if og_site and og_site.get("content"):
+        out["publisher"] = og_site["content"].strip()
+
+    # json-ld publisher.name 보강
+    if not out["publisher"]:
+        for script in soup.select('script[type="application/ld+json"]'):
+            try:
+                txt = script.get_text(strip=True)
+                if not txt:
+                    continue
+                data = json.loads(txt)
+                candidates = data if isinstance(data, list) else [data]
+                for obj in candidates:
+                    if isinstance(obj, dict):
+                        pub = obj.get("publisher")
+                        if isinstance(pub, dict):
+                            name = pub.get("name")
+                            if isinstance(name, str) and name.strip():
+                                out["publisher"] = name.strip()
+                                break
+                if out["publisher"]:
+                    break
+            except Exception:
+                continue
+
+    return out
+
+
+def fetch_publisher_and_image(http, url: str, timeout=8):
+    out = {"publisher": "", "image_url": ""}
+    if not url:
+        return out
+
+    try:
+        parsed = http.get_parsed(url, parse_publisher_and_image, headers=REQ_HEADERS, timeout=timeout,
+                                 allow_redirects=True, source=SOURCE)
+        return parsed or out
+    except Exception:
+        return out
+
+
+# =========================
+# Google RSS url + 폴백
+# =========================
+def build_google_rss_url(query: str, days):
+    q = query if days is None else f"{query} when:{days}d"
+    encoded_q = urllib.parse.quote(q)
+    return f"https://news.google.com/rss/search?q={encoded_q}&hl={LANG}&gl={COUNTRY}&ceid={COUNTRY}:{LANG}"
+
+
+def parse_feed(text: str):
+    """RSS 본문 → 검색 결과 수와 첫 번째 기사 정보 (캐시에 그대로 저장 가능한 dict)"""
+    feed = feedparser.parse(text)
+    entries = feed.entries or []
+    if not entries:
+        return {"count": 0, "first": None}
+
+    e = entries[0]
+    src = e.get("source")
+    if isinstance(src, dict):
+        source_title = str(src.get("title") or "")
+    else:
+        source_title = src if isinstance(src, str) else ""
+    return {
+        "count": len(entries),
+        "first": {
+            "title": (e.get("title") or "").strip(),
+            "link": (e.get("link") or "").strip(),
+            "published": (e.get("published") or e.get("updated") or "").strip(),
+            "source": source_title.strip(),
+        },
+    }
+
+
+def collect(http, keyword: str, fetch_meta=True):
+    """
+    fetch_meta=False면 원문 페이지는 열지 않음 (enrich 단계에서 일괄 보강)
+    반환:
+      - news: {title,url,publisher,published_at,image_url}
+      - total_count: int  (RSS가 반환한 entries 개수)
+    폴백:
+      1) "키워드" when:1d
+      2) 키워드 when:1d
+      3) "키워드" when:7d
+      4) 키워드 when:7d
+      5) "키워드" 기간제한 없음
+      6) 키워드 기간제한 없음
+    """
+    empty_news = {"title": "", "url": "", "publisher": "", "published_at": "", "image_url": ""}
+    variants = [
+        (f'"{keyword}"', 1),
+        (f"{keyword}", 1),
+        (f'"{keyword}"', 7),
+        (f"{keyword}", 7),
+        (f'"{keyword}"', None),
+        (f"{keyword}", None),
+    ]
+
+    best_count = 0
+
+    for q, days in variants:
+        rss_url = build_google_rss_url(q, days)
+        try:
+            feed = http.get_parsed(rss_url, parse_feed, headers=REQ_HEADERS, timeout=10, source=SOURCE)
+            if feed is None:
+                continue
+
+            best_count = max(best_count, feed["count"])
+
+            e = feed["first"]
+            if not e:
+                continue
+
+            title = e["title"]
+            link = e["link"]
+            published_at = normalize_published_to_hhmm(e["published"])
+            publisher = e["source"]
+
+            meta = fetch_publisher_and_image(http, link) if fetch_meta else {}
+            if not publisher:
+                publisher = (meta.get("publisher") or "").strip()
+            image_url = (meta.get("image_url") or "").strip()
+
+            news = {
+                "title": title or "",
+                "url": link or "",
+                "publisher": publisher or "",
+                "published_at": published_at or "",
+                "image_url": image_url or ""
+            }
+            return news, feed["count"]
+
+        except Exception:
+            continue
+
+    # 전부 실패했으면 (뉴스는 empty, total_count는 best_count(대부분 0))
+    return empty_news, best_count
@@ -0,0 +1,218 @@
+import re
+import urllib.parse
+from datetime import datetime, timedelta
+
+from bs4 import BeautifulSoup
+
+from .common import KST, parse_ldjson
+
+SOURCE = "naver"
+OUT_FILE = "naver_news_grouped_by_category_keyword.json"
+HEADERS = {"Referer": "https://www.naver.com/"}
+
+
+# =========================
+# 유틸: 발행일로 보이는 텍스트 판별
+# =========================
+def looks_like_time_or_date(txt: str) -> bool:
+    if not txt:
+        return False
+    t = txt.strip()
+    if re.search(r"\d+\s*(분|시간|일|주|개월|년)\s*전", t):
+        return True
+    if re.search(r"\d{4}\.\d{2}\.\d{2}\.?", t):
+        return True
+    if re.search(r"\d{4}-\d{2}-\d{2}", t):
+        return True
+    return False
+
+
+# =========================
+# 발행일 정규화: 'YYYY-MM-DD HH:MM' (KST)
+# =========================
+def normalize_published(published_raw: str):
+    if not published_raw:
+        return None
+
+    s = published_raw.strip()
+
+    # 1) ISO8601
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=KST)
+        dt = dt.astimezone(KST)
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        pass
+
+    # 2) 날짜+시간 (2026.02.25. 13:10)
+    m = re.search(r"(\d{4})\.(\d{2})\.(\d{2})\.?\s*(\d{1,2}):(\d{2})", s)
+    if m:
+        y, mo, d, hh, mm = m.groups()
+        dt = datetime(int(y), int(mo), int(d), int(hh), int(mm), tzinfo=KST)
+        return dt.strftime("%Y-%m-%d %H:%M")
+
+    # 3) 날짜만 (2026.02.25)
+    m = re.search(r"(\d{4})\.(\d{2})\.(\d{2})", s)
+    if m:
+        y, mo, d = map(int, m.groups())
+        dt = datetime(y, mo, d, 0, 0, tzinfo=KST)
+        return dt.strftime("%Y-%m-%d %H:%M")
+
+    # 4) 상대시간 (3시간 전)
+    m = re.search(r"(\d+)\s*(분|시간|일|주|개월|년)\s*전", s)
+    if m:
+        n = int(m.group(1))
+        unit = m.group(2)
+        now = datetime.now(KST)
+
+        if unit == "분":
+            dt = now - timedelta(minutes=n)
+        elif unit == "시간":
+            dt = now - timedelta(hours=n)
+        elif unit == "일":
+            dt = now - timedelta(days=n)
+        elif unit == "주":
+            dt = now - timedelta(weeks=n)
+        elif unit == "개월":
+            dt = now - timedelta(days=30 * n)
+        elif unit == "년":
+            dt = now - timedelta(days=365 * n)
+        else:
+            return None
+
+        return dt.strftime("%Y-%m-%d %H:%M")
+
+    # 5) 이미 YYYY-MM-DD HH:MM 이면 그대로
+    if re.fullmatch(r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}", s):
+        return s
+
+    return None
+
+
+# =========================
+# 기사 페이지 메타 (발행일/언론사/이미지)
+# =========================
+def parse_published_from_meta(soup: BeautifulSoup):
+    meta_props = [
+        ("property", "article:published_time"),
+        ("property", "og:article:published_time"),
+        ("name", "article:published_time"),
+        ("name", "pubdate"),
+        ("name", "date"),
+    ]
+    for attr, key in meta_props:
+        tag = soup.find("meta", attrs={attr: key})
+        if tag and tag.get("content"):
+            return tag["content"].strip()
+    return None
+
+
+def parse_article_meta(html: str):
+    """기사 페이지 한 장에서 발행일 원문/언론사/og:image를 모두 추출합니다."""
+    meta = {"published_raw": None, "publisher": None, "image_url": None}
+    soup = BeautifulSoup(html, "html.parser")
+    ld_publisher, ld_date = parse_ldjson(soup)
+
+    # 발행일: meta → ld+json → 본문 텍스트
+    pub = parse_published_from_meta(soup) or ld_date or None
+    if not pub:
+        text = soup.get_text(" ", strip=True)
+        m = re.search(r"\d{4}\.\d{2}\.\d{2}\.?\s*\d{1,2}:\d{2}", text) or re.search(r"\d{4}\.\d{2}\.\d{2}\.?", text)
+        if m:
+            pub = m.group(0)
+    meta["published_raw"] = pub
+
+    # 언론사: ld+json → og:site_name
+    meta["publisher"] = ld_publisher or None
+    if not meta["publisher"]:
+        tag = soup.find("meta", attrs={"property": "og:site_name"})
+        if tag and tag.get("content"):
+            meta["publisher"] = tag["content"].strip()
+
+    # 이미지: og:image → twitter:image
+    for attrs in ({"property": "og:image"}, {"name": "twitter:image"}):
+        tag = soup.find("meta", attrs=attrs)
+        if tag and tag.get("content"):
+            meta["image_url"] = tag["content"].strip()
+            break
+    return meta
+
+
+def fetch_article_meta(http, link: str):
+    """
+    기사 페이지를 한 번만 받아서 발행일 원문/언론사/og:image를 모두 추출합니다.
+    (노트북 버전은 항목마다 같은 페이지를 따로 요청했음, 본문이 이전과 같으면 캐시된 파싱 결과 사용)
+    """
+    meta = {"published_raw": None, "publisher": None, "image_url": None}
+    try:
+        return http.get_parsed(link, parse_article_meta, headers=HEADERS, timeout=10, source=SOURCE) or meta
+    except Exception:
+        return meta
+
+
+# =========================
+# 네이버 뉴스 검색: 키워드별 1개
+# =========================
+def collect(http, keyword: str, fetch_meta=True):
+    q = urllib.parse.quote(keyword)
+    url = f"https://search.naver.com/search.naver?where=news&sm=tab_jum&query={q}"
+
+    try:
+        res = http.get(url, headers=HEADERS, timeout=10, source=SOURCE)
+        res.raise_for_status()
+    except Exception:
+        return None
+    soup = BeautifulSoup(res.text, "html.parser")
+
+    a = soup.select_one('a[data-heatmap-target=".tit"]') or soup.select_one("a.news_tit")
+    if not a:
+        return None
+
+    title = a.get_text(strip=True)
+    link = a.get("href")
+
+    published_raw = None
+    publisher = None
+    card = a.find_parent("div", class_="news_area") or a.find_parent(["div", "li"])
+
+    if card:
+        infos = card.select("div.info_group span.info, span.info")
+        for sp in infos:
+            txt = sp.get_text(strip=True)
+            if looks_like_time_or_date(txt):
+                published_raw = txt
+                break
+
+        press = card.select_one("a.info.press, span.info.press, a.press, span.press")
+        if press:
+            publisher = press.get_text(" ", strip=True)
+
+    img_url = None
+    if card:
+        img = card.select_one("img")
+        if img:
+            img_url = (
+                img.get("data-lazy-src")
+                or img.get("data-src")
+                or img.get("src")
+                or img.get("data-original")
+            )
+            if img_url and img_url.startswith("//"):
+                img_url = "https:" + img_url
+
+    # 검색 카드에 없는 항목만 기사 페이지(1회 요청)에서 보강 (fetch_meta=False면 enrich 단계에서 일괄 보강)
+    if fetch_meta and link and (published_raw is None or not publisher or not img_url):
+        meta = fetch_article_meta(http, link)
+        published_raw = published_raw or meta["published_raw"]
+        publisher = publisher or meta["publisher"]
+        img_url = img_url or meta["image_url"]
+
+    return {
+        "title": title,
+        "url": link,
+        "publisher": publisher,
+        "published_at": normalize_published(published_raw),
+        "image_url": img_url
+    }
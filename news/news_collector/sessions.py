@@ -0,0 +1,160 @@
+import hashlib
+import threading
+import urllib.parse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .urls import canonicalize_url
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+DEFAULT_TIMEOUT = 10
+
+
+class CachedResponse:
+    """304 Not Modified일 때 캐시에 저장된 본문으로 만든 응답 (requests.Response에서 쓰는 속성만 제공)"""
+    status_code = 200
+    ok = True
+    from_cache = True
+
+    def __init__(self, url, text, content_hash):
+        self.url = url
+        self.text = text
+        self.content_hash = content_hash
+
+    def raise_for_status(self):
+        pass
+
+
+class HostSessions:
+    """
+    호스트별 requests.Session 풀.
+    - 같은 호스트 요청은 하나의 세션(keep-alive 연결 재사용)을 공유
+    - 호스트마다 동시 요청 수를 per_host개로 제한 (검색 페이지/언론사 서버에 부담 주지 않도록)
+    - cache(HttpCache)를 주면 조건부 요청(ETag/Last-Modified) + 본문 해시 기반 파싱 결과 재사용
+    """
+    def __init__(self, per_host=4, headers=None, cache=None):
+        self.per_host = per_host
+        self.headers = headers or {}
+        self.cache = cache
+        self._sessions = {}
+        self._limits = {}
+        self._lock = threading.Lock()
+
+    def _host(self, url):
+        return urllib.parse.urlsplit(url).netloc.lower()
+
+    def _session_for(self, host):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.per_host)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8"})
+                session.headers.update(self.headers)
+                self._sessions[host] = session
+                self._limits[host] = threading.BoundedSemaphore(self.per_host)
+            return session, self._limits[host]
+
+    def _request(self, url, headers, timeout, **kwargs):
+        session, limit = self._session_for(self._host(url))
+        with limit:
+            return session.get(url, headers=headers, timeout=timeout, **kwargs)
+
+    def get(self, url, headers=None, timeout=DEFAULT_TIMEOUT, source="other", **kwargs):
+        """
+        GET 요청. 캐시가 있으면 조건부 요청을 보내고, 304면 저장된 본문으로 응답을 돌려줍니다.
+        반환 응답에는 content_hash(본문 sha1)와 from_cache가 붙습니다.
+        """
+        if self.cache is None:
+            return self._request(url, headers, timeout, **kwargs)
+
+        key = canonicalize_url(url)
+        entry = self.cache.load(key)
+        req_headers = dict(headers or {})
+        if entry:
+            if entry.get("etag"):
+                req_headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                req_headers["If-Modified-Since"] = entry["last_modified"]
+
+        self.cache.record(source, "requests")
+        res = self._request(url, req_headers, timeout, **kwargs)
+
+        if res.status_code == 304 and entry:
+            self.cache.record(source, "not_modified")
+            self.cache.record(source, "bytes_saved", len(entry["body"].encode("utf-8")))
+            return CachedResponse(url, entry["body"], entry["content_hash"])
+
+        res.from_cache = False
+        res.content_hash = hashlib.sha1(res.content).hexdigest()
+        if not res.ok:
+            return res
+
+        unchanged = bool(entry) and entry.get("content_hash") == res.content_hash
+        if unchanged:
+            # 서버가 조건부 요청을 지원하지 않아도 본문이 같으면 적중으로 집계 (파싱 결과 재사용 가능)
+            self.cache.record(source, "unchanged")
+        self.cache.store(key, {
+            "url": url,
+            "etag": res.headers.get("ETag"),
+            "last_modified": res.headers.get("Last-Modified"),
+            "content_hash": res.content_hash,
+            "body": res.text,
+            "parsed": entry.get("parsed") if unchanged else None,
+        })
+        return res
+
+    def get_parsed(self, url, parse_fn, headers=None, timeout=DEFAULT_TIMEOUT, source="other", **kwargs):
+        """
+        GET 후 parse_fn(응답 본문 텍스트)의 결과를 돌려줍니다.
+        본문이 이전과 같으면(304 또는 해시 동일) 저장된 파싱 결과를 그대로 사용합니다.
+        parse_fn의 반환값은 JSON으로 저장 가능해야 합니다. 요청이 실패하면 None.
+        """
+        res = self.get(url, headers=headers, timeout=timeout, source=source, **kwargs)
+        if not res.ok:
+            return None
+        if self.cache is None:
+            return parse_fn(res.text)
+
+        key = canonicalize_url(url)
+        entry = self.cache.load(key) or {}
+        if entry.get("content_hash") == res.content_hash and entry.get("parsed") is not None:
+            self.cache.record(source, "parse_skipped")
+            return entry["parsed"]
+
+        parsed = parse_fn(res.text)
+        if entry.get("content_hash") == res.content_hash:
+            entry["parsed"] = parsed
+            self.cache.store(key, entry)
+        return parsed
+
+    def stream(self, url, on_chunk, headers=None, timeout=DEFAULT_TIMEOUT, chunk_size=8192, on_response=None, **kwargs):
+        """
+        본문을 조각(bytes) 단위로 on_chunk에 넘기고, on_chunk가 False를 돌려주면 바로 연결을 닫습니다.
+        (<head>만 필요할 때 본문 전체를 받지 않도록) 읽는 동안 호스트 동시 요청 수 제한을 유지합니다.
+        on_response: 본문을 읽기 전에 응답(헤더)을 받는 콜백 (예: Content-Type의 charset 확인)
+        반환: 닫힌 응답 (status_code / headers 확인용)
+        """
+        session, limit = self._session_for(self._host(url))
+        with limit:
+            res = session.get(url, headers=headers, timeout=timeout, stream=True, **kwargs)
+            try:
+                if res.ok:
+                    if on_response is not None:
+                        on_response(res)
+                    for chunk in res.iter_content(chunk_size=chunk_size):
+                        if on_chunk(chunk) is False:
+                            break
+            finally:
+                res.close()
+        return res
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._limits.clear()
@@ -0,0 +1,78 @@
+import urllib.parse
+
+# 추적용 쿼리 파라미터 (기사 식별과 무관 → 정규화 시 제거)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "referrer", "from", "cmpid", "share", "sns",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+
+def _is_tracking_param(name):
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url):
+    """
+    같은 기사를 가리키는 URL을 하나의 키로 정규화합니다.
+    - 스킴/호스트 소문자화, 기본 포트 제거, fragment 제거
+    - utm_* 등 추적 파라미터 제거 후 나머지 파라미터 정렬
+    """
+    if not url:
+        return ""
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = parts.hostname.lower() if parts.hostname else ""
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+    query = urllib.parse.urlencode(sorted(
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(k)
+    ))
+    path = parts.path or "/"
+    return urllib.parse.urlunsplit((scheme, host, path, query, ""))
+
+
+# 모바일/AMP 변형 → 데스크톱 원문 (같은 기사로 취급)
+MOBILE_HOST_PREFIXES = ("m.", "mobile.", "amp.")
+AMP_QUERY_PARAMS = {"amp", "outputtype", "output"}
+HOST_ALIASES = {
+    "m.news.naver.com": "n.news.naver.com",
+    "m.entertain.naver.com": "entertain.naver.com",
+    "m.sports.naver.com": "sports.naver.com",
+    "m.v.daum.net": "v.daum.net",
+}
+
+
+def canonicalize_article_url(url):
+    """
+    출처(네이버/다음/구글)가 달라도 같은 기사면 같은 값이 나오도록 canonicalize_url보다 한 단계 더 정규화합니다.
+    - 모바일 호스트(m./mobile./amp.) → 데스크톱 호스트, www. 제거
+    - AMP 경로(/amp, /amp/, .amp)와 amp 관련 쿼리 제거
+    - 스킴은 https로 통일, 경로 끝 '/' 제거
+    """
+    key = canonicalize_url(url)
+    if not key:
+        return ""
+    parts = urllib.parse.urlsplit(key)
+
+    host = parts.netloc
+    host = HOST_ALIASES.get(host, host)
+    for prefix in MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") >= 2:
+            host = host[len(prefix):]
+            break
+    if host.startswith("www."):
+        host = host[4:]
+
+    segments = [seg for seg in parts.path.split("/") if seg and seg.lower() != "amp"]
+    path = "/" + "/".join(segments)
+    if path.endswith(".amp"):
+        path = path[:-4]
+
+    query = urllib.parse.urlencode([
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in AMP_QUERY_PARAMS
+    ])
+    return urllib.parse.urlunsplit(("https", host, path, query, ""))
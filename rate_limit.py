@@ -0,0 +1,53 @@
+# rate_limit.py
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 레이트 리미터.
+    rate: 초당 토큰 보충 개수 (= 허용 호출 수/초), capacity: 순간 최대 허용량(버스트)
+    """
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """토큰이 생길 때까지 대기한 뒤 차감합니다."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                shortage = tokens - self._tokens
+            time.sleep(shortage / self.rate)
+
+
+def backoff_delay(attempt, base_delay=0.5, max_delay=8.0):
+    """지수 백오프 + full jitter: 0 ~ min(max_delay, base_delay * 2^attempt) 사이 임의 대기 시간"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
+
+
+def retry_call(func, retries=3, base_delay=0.5, max_delay=8.0, is_retryable=lambda e: True):
+    """
+    func()를 실행하고 실패하면 지터가 섞인 지수 백오프로 재시도합니다.
+    재시도 대상이 아닌 에러이거나 재시도 횟수를 모두 쓰면 마지막 예외를 그대로 올립니다.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retries or not is_retryable(e):
+                raise
+            time.sleep(backoff_delay(attempt, base_delay, max_delay))